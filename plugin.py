@@ -40,20 +40,28 @@ try:
 except ImportError:
     VirtualKeyBoard = None
 # Twisted Imports - Aliasing ssl to avoid conflict with stdlib ssl
-from twisted.internet import reactor
+from twisted.internet import reactor, threads, defer
 try:
     from twisted.internet import ssl as twisted_ssl
 except ImportError:
     twisted_ssl = None
 
 from twisted.web.client import Agent, readBody, getPage, downloadPage, HTTPConnectionPool
+from twisted.web.http_headers import Headers
+try:
+    from twisted.web.client import RedirectAgent
+except ImportError:
+    RedirectAgent = None
 from functools import partial
-from enigma import eTimer, eListboxPythonMultiContent, gFont, RT_HALIGN_LEFT, RT_HALIGN_RIGHT, RT_HALIGN_CENTER, RT_VALIGN_CENTER, getDesktop, eConsoleAppContainer, gRGB, addFont, eEPGCache, eServiceReference, eServiceCenter, ePoint, eSize
+from enigma import eTimer, eListboxPythonMultiContent, gFont, RT_HALIGN_LEFT, RT_HALIGN_RIGHT, RT_HALIGN_CENTER, RT_VALIGN_CENTER, getDesktop, gRGB, addFont, eEPGCache, eServiceReference, eServiceCenter, ePoint, eSize
 import json
 import datetime
 import math
 import random
 import collections
+import bisect
+import copy
+import heapq
 import uuid
 
 
@@ -1268,6 +1276,10 @@ def build_ai_prompt(language, cached_events, match_snapshots, ledger=None):
 XMLTV_EPG_URL = "https://epg.pw/xmltv/epg.xml"
 EPG_SEARCH_CAT_COLOR = 0x0055CC   # blue tint for EPG-sourced entries in the list
 EPG_SEARCH_TIMEOUT   = 30         # seconds per request
+XMLTV_SPOOL_MAX_AGE_HOURS = 12    # default revalidation age of the remote XMLTV spool
+XMLTV_SPOOL_MAX_BYTES = 150 * 1024 * 1024  # larger remote guides are not spooled
+XMLTV_TMP_INDEX_MAX_BYTES = 16 * 1024 * 1024  # hard cap for the programme index on tmpfs
+XMLTV_TMP_INDEX_HORIZON = 48 * 3600           # ... which only covers the next two days
 SAT_FEED_CAT_COLOR   = 0xCC7700   # amber tint for satellite-feed entries in the list
 SAT_FEED_TIMEOUT     = 20         # seconds per HTTP request for sat-feed search
 
@@ -1310,7 +1322,48 @@ CONFIG_FILE = "/etc/enigma2/simply_sports.json"
 LEDGER_FILE = "/etc/enigma2/simply_sports_ledger.json"
 FAVORITE_LEAGUES_FILE = "/etc/enigma2/simplysports_favoriteleagues.json"
 DISCOVERED_LEAGUES_FILE = "/etc/enigma2/simply_sports_discovered.json"
-LOGO_CACHE_DIR = "/tmp/simplysports/logos"
+
+
+def _select_logo_cache_dir():
+    """Persistent logo store: first mounted HDD/USB, else flash; /tmp only as a last resort.
+    Returns (directory, byte budget for LRU pruning)."""
+    for mnt in ("/media/hdd", "/media/usb", "/media/mmc"):
+        if os.path.ismount(mnt) and os.access(mnt, os.W_OK):
+            return mnt + "/simplysports/logos", 64 * 1024 * 1024
+    if os.access("/etc/enigma2", os.W_OK):
+        return "/etc/enigma2/simplysports/logos", 12 * 1024 * 1024
+    return "/tmp/simplysports/logos", 32 * 1024 * 1024
+
+
+_LOGO_STORE = [None, 0, 0]   # directory, byte budget, time of the last probe
+LOGO_STORE_RECHECK_SECS = 60
+
+
+def logo_store():
+    """(directory, byte budget) of the logo store, chosen on first use rather than
+    at import: plugins load before the HDD is mounted. While the store is not on
+    removable media it is re-probed every LOGO_STORE_RECHECK_SECS, so a late
+    mount moves the store to the disk the same boot would choose next time."""
+    now = time.time()
+    if _LOGO_STORE[0] is None or (not _LOGO_STORE[0].startswith("/media/")
+                                  and now - _LOGO_STORE[2] > LOGO_STORE_RECHECK_SECS):
+        d, budget = _select_logo_cache_dir()
+        if d != _LOGO_STORE[0]:
+            log_dbg("LOGO_STORE: using {}".format(d))
+        _LOGO_STORE[:] = [d, budget, now]
+    return _LOGO_STORE[0], _LOGO_STORE[1]
+
+
+def logo_cache_dir():
+    return logo_store()[0]
+
+
+def logo_state_file(name):
+    """State file kept next to the logo store (sibling of its logos/ dir).
+    Owners created at import take lambda: logo_state_file(...) and resolve it
+    on first use, after the boot-time mounts."""
+    return os.path.join(os.path.dirname(logo_cache_dir()), name)
+CACHE_FORMAT_VERSION = 2  # cache.json layout: pruned events + MatchSnapshot rows
 
 
 # ==============================================================================
@@ -1944,6 +1997,122 @@ _COUNTRY_ISO2 = {
 # ==============================================================================
 # UNIFIED MATCH SNAPSHOT BUILDER
 # ==============================================================================
+class MatchSnapshot(object):
+    """
+    Display-ready match state produced by build_match_snapshot().
+    Uses __slots__ instead of a per-event dict; fields that are plain copies of
+    raw_event values (league, date, logo URLs/IDs, period) are not stored but
+    read through raw_event on access.
+    Supports the dict read API the UI already uses: snap['x'], snap.get('x'),
+    'x' in snap, keys()/items(), plus snap['raw_event'] = ev for re-pointing.
+    Snapshots restored from the disk cache (from_row) keep the stored row and
+    only unpack it into the slots on first read.
+    """
+    # Stored fields, in the order used for cache rows (to_row/from_row)
+    _FIELDS = (
+        'event_id', 'sport_type', 'state',
+        'h_poss', 'a_poss', 'h_pct_stats', 'a_pct_stats',
+        'h_shots', 'a_shots', 'h_on_target', 'a_on_target',
+        'status_short', 'is_live', 'is_postponed', 'is_suspended', 'clock',
+        'h_name', 'a_name', 'h_name_short', 'a_name_short',
+        'h_team_id', 'a_team_id', 'h_abbrev', 'a_abbrev',
+        'h_score_str', 'a_score_str', 'h_score_int', 'a_score_int',
+        'score_str', 'time_str',
+        'h_red_cards', 'a_red_cards',
+        'stage_label', 'is_pen_shootout', 'host_flag_url', 'host_flag_id',
+        'h_iso2', 'a_iso2',
+        'start_ts', 'local_date', 'local_end_date',
+    )
+    __slots__ = _FIELDS + ('raw_event', '_row')
+
+    # Resolved from raw_event on every read (never stale, never duplicated)
+    _LAZY = {
+        'league_name': lambda ev: ev.get('league_name', ''),
+        'league_url':  lambda ev: ev.get('league_url', ''),
+        'date':        lambda ev: ev.get('date', ''),
+        'period':      lambda ev: ev.get('status', {}).get('period', 0),
+        'h_logo_url':  lambda ev: ev.get('h_logo_url', ''),
+        'a_logo_url':  lambda ev: ev.get('a_logo_url', ''),
+        'l_logo_url':  lambda ev: ev.get('l_logo_url', ''),
+        'h_logo_id':   lambda ev: ev.get('h_logo_id', ''),
+        'a_logo_id':   lambda ev: ev.get('a_logo_id', ''),
+        'l_logo_id':   lambda ev: ev.get('l_logo_id', ''),
+    }
+    _KEYS = _FIELDS + ('raw_event',) + tuple(sorted(_LAZY))
+    _SLOT_SET = frozenset(_FIELDS + ('raw_event',))
+
+    def __init__(self, raw_event, **fields):
+        self.raw_event = raw_event
+        self._row = None
+        for k, v in fields.items():
+            setattr(self, k, v)
+
+    @classmethod
+    def from_row(cls, raw_event, row):
+        """Restore a cached snapshot without unpacking it yet."""
+        snap = cls.__new__(cls)
+        snap.raw_event = raw_event
+        snap._row = row
+        return snap
+
+    def to_row(self):
+        """Stored field values as a list (raw_event excluded)."""
+        if self._row is not None:
+            return self._row
+        return [getattr(self, k) for k in self._FIELDS]
+
+    def _unpack(self):
+        # Slots first, then drop the row: to_row() always finds one or the other complete
+        for k, v in zip(self._FIELDS, self._row):
+            setattr(self, k, v)
+        self._row = None
+
+    def __getitem__(self, key):
+        lazy = self._LAZY.get(key)
+        if lazy is not None:
+            return lazy(self.raw_event)
+        if key in self._SLOT_SET:
+            if self._row is not None and key != 'raw_event':
+                self._unpack()
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._SLOT_SET:
+            raise KeyError(key)
+        if key != 'raw_event' and self._row is not None:
+            self._unpack()
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, AttributeError):
+            return default
+
+    def __contains__(self, key):
+        return key in self._SLOT_SET or key in self._LAZY
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def keys(self):
+        return list(self._KEYS)
+
+    def values(self):
+        return [self[k] for k in self._KEYS]
+
+    def items(self):
+        return [(k, self[k]) for k in self._KEYS]
+
+    def to_dict(self):
+        """Plain dict in the pre-MatchSnapshot layout."""
+        return dict(self.items())
+
+
 def build_match_snapshot(event):
     """
     Convert a raw ESPN event dict into a normalized, display-ready MatchSnapshot.
@@ -2225,130 +2394,710 @@ def build_match_snapshot(event):
                 a_pct_stats.append(a_corners / total_corners * 100.0)
         except Exception: pass
 
-    return {
+    # --- Kick-off epoch and local day(s) ---
+    start_ts, local_date, local_end_date = snapshot_local_dates(
+        event.get('date', ''),
+        event.get('endDate', '') if sport_type == SPORT_TYPE_RACING else '')
+
+    # league_name/league_url/date/period and the logo URLs/IDs (already set
+    # by process_events_data) are read through raw_event -- see MatchSnapshot._LAZY
+    return MatchSnapshot(
+        event,
         # Identity
-        'event_id':      str(event.get('id', '')),
-        'league_name':   event.get('league_name', ''),
-        'league_url':    league_url,
-        'sport_type':    sport_type,
-        'date':          event.get('date', ''),
+        event_id      = str(event.get('id', '')),
+        sport_type    = sport_type,
 
         # State
-        'state':         state,
-        'h_poss':        h_possession,
-        'a_poss':        a_possession,
-        'h_pct_stats':   h_pct_stats,
-        'a_pct_stats':   a_pct_stats,
-        'h_shots':       h_shots_total,
-        'a_shots':       a_shots_total,
-        'h_on_target':   h_shots_ot,
-        'a_on_target':   a_shots_ot,
-
-        'status_short':  status_short,
-        'is_live':       state == 'in' and not is_suspended,
-        'is_postponed':  is_postponed,
-        'is_suspended':  is_suspended,
-        'clock':         clock_display,
-        'period':        status.get('period', 0),
+        state         = state,
+        h_poss        = h_possession,
+        a_poss        = a_possession,
+        h_pct_stats   = tuple(h_pct_stats),
+        a_pct_stats   = tuple(a_pct_stats),
+        h_shots       = h_shots_total,
+        a_shots       = a_shots_total,
+        h_on_target   = h_shots_ot,
+        a_on_target   = a_shots_ot,
+
+        status_short  = status_short,
+        is_live       = state == 'in' and not is_suspended,
+        is_postponed  = is_postponed,
+        is_suspended  = is_suspended,
+        clock         = clock_display,
 
         # Teams
-        'h_name':        h_name,
-        'a_name':        a_name,
-        'h_name_short':  h_name_short,
-        'a_name_short':  a_name_short,
-        'h_team_id':     h_team_id,
-        'a_team_id':     a_team_id,
-        'h_abbrev':      h_abbrev,
-        'a_abbrev':      a_abbrev,
+        h_name        = h_name,
+        a_name        = a_name,
+        h_name_short  = h_name_short,
+        a_name_short  = a_name_short,
+        h_team_id     = h_team_id,
+        a_team_id     = a_team_id,
+        h_abbrev      = h_abbrev,
+        a_abbrev      = a_abbrev,
 
         # Scores
-        'h_score_str':   h_score_str,
-        'a_score_str':   a_score_str,
-        'h_score_int':   h_score_int,
-        'a_score_int':   a_score_int,
-        'score_str':     score_str,     # "2 - 1" or "VS" or "P - P"
-        'time_str':      time_str,      # "45'" or "FT" or "20:30"
-
-        # Logos (already set by process_events_data)
-        'h_logo_url':    event.get('h_logo_url', ''),
-        'a_logo_url':    event.get('a_logo_url', ''),
-        'l_logo_url':    event.get('l_logo_url', ''),
-        'h_logo_id':     event.get('h_logo_id', ''),
-        'a_logo_id':     event.get('a_logo_id', ''),
-        'l_logo_id':     event.get('l_logo_id', ''),
+        h_score_str   = h_score_str,
+        a_score_str   = a_score_str,
+        h_score_int   = h_score_int,
+        a_score_int   = a_score_int,
+        score_str     = score_str,     # "2 - 1" or "VS" or "P - P"
+        time_str      = time_str,      # "45'" or "FT" or "20:30"
 
         # Red Cards
-        'h_red_cards':   h_red_cards,
-        'a_red_cards':   a_red_cards,
+        h_red_cards   = h_red_cards,
+        a_red_cards   = a_red_cards,
 
         # World Cup extras
-        'stage_label':      stage_label,
-        'is_pen_shootout':  is_pen_shootout,
-        'host_flag_url':    host_flag_url,
-        'host_flag_id':     host_flag_id,
-        'h_iso2':           h_iso2,
-        'a_iso2':           a_iso2,
-
-        # Raw event reference (for GameInfoScreen detail requests only)
-        'raw_event':     event,
-    }
+        stage_label     = stage_label,
+        is_pen_shootout = is_pen_shootout,
+        host_flag_url   = host_flag_url,
+        host_flag_id    = host_flag_id,
+        h_iso2          = h_iso2,
+        a_iso2          = a_iso2,
+
+        # Precomputed once for snapshot_passes_filter / day buckets
+        start_ts        = start_ts,
+        local_date      = local_date,
+        local_end_date  = local_end_date,
+    )
 
 
-def snapshot_passes_filter(snap, filter_mode, today, tomorrow, yesterday):
-    """Shared filter for all UI screens. filter_mode: 0=Yesterday, 1=Live, 2=Today, 3=Tomorrow, 4=All"""
-    import datetime, calendar, time
-    state    = snap['state']
-    ev_date  = snap['date'][:10] if snap['date'] else ''
-    
-    # Convert UTC date string (e.g. "2026-06-13T01:00Z") to local date representation
-    utc_str = snap.get('date', '')
-    if utc_str and 'T' in utc_str:
-        try:
-            date_part, time_part = utc_str.split('T')
-            y, m, d = map(int, date_part.split('-'))
-            time_part = time_part.replace('Z', '')
-            H, M = map(int, time_part.split(':')[:2])
-            dt_utc = datetime.datetime(y, m, d, H, M)
-            timestamp = calendar.timegm(dt_utc.timetuple())
-            local_dt = datetime.datetime.fromtimestamp(timestamp)
-            ev_date = local_dt.strftime("%Y-%m-%d")
-        except:
-            pass
+def _snapshot_deep_size(obj, skip):
+    """sys.getsizeof over containers, ignoring objects whose id is in skip."""
+    import sys
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in skip:
+            continue
+        skip.add(id(o))
+        size += sys.getsizeof(o)
+        if isinstance(o, dict):
+            stack.extend(o.keys()); stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set)):
+            stack.extend(o)
+        elif isinstance(o, MatchSnapshot):
+            for k in MatchSnapshot._FIELDS + ('raw_event',):
+                stack.append(getattr(o, k, None))
+    return size
+
+
+def snapshot_memory_report(events):
+    """
+    Compare the memory held by snapshots for the given raw events:
+    legacy dict layout vs MatchSnapshot. Objects shared with raw_event
+    (strings copied by reference, the event itself) are not counted.
+    """
+    dict_bytes = 0
+    slot_bytes = 0
+    for ev in events:
+        snap = build_match_snapshot(ev)
+        shared = set()
+        _snapshot_deep_size(ev, shared)
+        dict_bytes += _snapshot_deep_size(snap.to_dict(), set(shared))
+        slot_bytes += _snapshot_deep_size(snap, set(shared))
+    saved = (100.0 * (dict_bytes - slot_bytes) / dict_bytes) if dict_bytes else 0.0
+    return {'events': len(events), 'dict_bytes': dict_bytes,
+            'slot_bytes': slot_bytes, 'saved_pct': saved}
+
+
+def _utc_iso_to_epoch(utc_str):
+    """ESPN UTC timestamp ("2026-06-13T01:00Z") -> epoch seconds, or None."""
+    if not utc_str or 'T' not in utc_str:
+        return None
+    try:
+        date_part, time_part = utc_str.split('T')
+        y, m, d = map(int, date_part.split('-'))
+        H, M = map(int, time_part.replace('Z', '').split(':')[:2])
+        return calendar.timegm((y, m, d, H, M, 0))
+    except:
+        return None
 
-    # For racing: check date range if endDate exists
-    is_racing = snap.get('sport_type') == SPORT_TYPE_RACING
-    ev_end_date = ev_date
-    if is_racing:
-        raw_evt = snap.get('raw_event', {})
-        end_utc = raw_evt.get('endDate', '')
-        if end_utc and 'T' in end_utc:
-            try:
-                date_part, time_part = end_utc.split('T')
-                y, m, d = map(int, date_part.split('-'))
-                time_part = time_part.replace('Z', '')
-                H, M = map(int, time_part.split(':')[:2])
-                dt_utc = datetime.datetime(y, m, d, H, M)
-                timestamp = calendar.timegm(dt_utc.timetuple())
-                local_dt = datetime.datetime.fromtimestamp(timestamp)
-                ev_end_date = local_dt.strftime("%Y-%m-%d")
-            except:
-                ev_end_date = end_utc[:10]
-        elif end_utc:
-            ev_end_date = end_utc[:10]
-
-    if is_racing:
-        if filter_mode == 0 and not (ev_date <= yesterday <= ev_end_date): return False
-        if filter_mode == 1 and state != 'in': return False
-        if filter_mode == 2 and not (ev_date <= today <= ev_end_date) and state != 'in': return False
-        if filter_mode == 3 and not (ev_date <= tomorrow <= ev_end_date): return False
+
+def snapshot_local_dates(start_utc, end_utc=''):
+    """
+    Returns (start_ts, local_date, local_end_date) for an event.
+    start_ts is the UTC epoch (0 if unparseable); dates are local "YYYY-MM-DD".
+    end_utc is only given for multi-day events (racing endDate).
+    """
+    ts = _utc_iso_to_epoch(start_utc)
+    if ts is not None:
+        local_date = time.strftime("%Y-%m-%d", time.localtime(ts))
     else:
-        if filter_mode == 0 and ev_date != yesterday: return False
-        if filter_mode == 1 and state != 'in':        return False
-        if filter_mode == 2 and ev_date != today and state != 'in': return False
-        if filter_mode == 3 and ev_date != tomorrow:  return False
+        local_date = start_utc[:10] if start_utc else ''
+    local_end_date = local_date
+    if end_utc:
+        end_ts = _utc_iso_to_epoch(end_utc)
+        if end_ts is not None:
+            local_end_date = time.strftime("%Y-%m-%d", time.localtime(end_ts))
+        else:
+            local_end_date = end_utc[:10]
+    return ts or 0, local_date, local_end_date
+
+
+def _snapshot_dates(snap):
+    """Precomputed (local_date, local_end_date); plain-dict snapshots fall back to parsing."""
+    local_date = snap.get('local_date')
+    if local_date is not None:
+        return local_date, snap.get('local_end_date') or local_date
+    end_utc = ''
+    if snap.get('sport_type') == SPORT_TYPE_RACING:
+        end_utc = (snap.get('raw_event') or {}).get('endDate', '')
+    _, local_date, local_end_date = snapshot_local_dates(snap.get('date', ''), end_utc)
+    return local_date, local_end_date
+
+
+def snapshot_passes_filter(snap, filter_mode, today, tomorrow, yesterday):
+    """Shared filter for all UI screens. filter_mode: 0=Yesterday, 1=Live, 2=Today, 3=Tomorrow, 4=All
+    For whole lists prefer MatchSnapshotStore.filter_ids(), which answers from day buckets."""
+    state = snap['state']
+    ev_date, ev_end_date = _snapshot_dates(snap)
+
+    # Multi-day events (racing) match any day inside [start, end]
+    if filter_mode == 0 and not (ev_date <= yesterday <= ev_end_date): return False
+    if filter_mode == 1 and state != 'in': return False
+    if filter_mode == 2 and not (ev_date <= today <= ev_end_date) and state != 'in': return False
+    if filter_mode == 3 and not (ev_date <= tomorrow <= ev_end_date): return False
     return True
 
 
+# ==============================================================================
+# PER-EVENT SCOREBOARD PARSER
+# ==============================================================================
+_SCOREBOARD_DECODER = json.JSONDecoder()
+_JSON_WS_RE = _re_module.compile(r'[ \t\n\r]*')
+SCOREBOARD_DROP_COMP_KEYS = ('odds', 'headlines')   # never read from scoreboard events
+
+
+def _strip_scoreboard_event(ev):
+    """Drop bulky competition subtrees nobody reads from the scoreboard."""
+    for comp in ev.get('competitions') or []:
+        if isinstance(comp, dict):
+            for k in SCOREBOARD_DROP_COMP_KEYS:
+                comp.pop(k, None)
+
+
+def parse_scoreboard(text):
+    """
+    Decode an ESPN scoreboard document into {'leagues': [...], 'events': [...]},
+    one event per raw_decode call. Runs on the _normalise_bodies worker
+    thread: each call holds the GIL only for one event, so the UI thread is
+    not locked out for a whole multi-megabyte body (NCAA, tennis, racing)
+    as with a single json.loads. Only the top-level 'leagues' and 'events'
+    keys are kept, and events lose SCOREBOARD_DROP_COMP_KEYS as they arrive.
+    Raises ValueError on malformed input.
+    """
+    decode = _SCOREBOARD_DECODER.raw_decode
+    ws = _JSON_WS_RE.match
+    out = {'leagues': [], 'events': []}
+    events = out['events']
+
+    idx = ws(text, 0).end()
+    if text[idx:idx + 1] != '{':
+        raise ValueError("scoreboard is not a JSON object")
+    idx = ws(text, idx + 1).end()
+    if text[idx:idx + 1] == '}':
+        return out
+
+    while True:
+        key, idx = decode(text, idx)
+        idx = ws(text, idx).end()
+        if text[idx:idx + 1] != ':':
+            raise ValueError("expected ':' at {}".format(idx))
+        idx = ws(text, idx + 1).end()
+
+        if key == 'events' and text[idx:idx + 1] == '[':
+            idx = ws(text, idx + 1).end()
+            if text[idx:idx + 1] == ']':
+                idx += 1
+            else:
+                while True:
+                    ev, idx = decode(text, idx)
+                    if isinstance(ev, dict):
+                        _strip_scoreboard_event(ev)
+                        events.append(ev)
+                    idx = ws(text, idx).end()
+                    c = text[idx:idx + 1]
+                    idx += 1
+                    if c == ']':
+                        break
+                    if c != ',':
+                        raise ValueError("expected ',' in events at {}".format(idx))
+                    idx = ws(text, idx).end()
+        else:
+            value, idx = decode(text, idx)
+            if key == 'leagues':
+                out['leagues'] = value
+
+        idx = ws(text, idx).end()
+        c = text[idx:idx + 1]
+        idx += 1
+        if c == '}':
+            return out
+        if c != ',':
+            raise ValueError("expected ',' at {}".format(idx))
+        idx = ws(text, idx).end()
+
+
+# ==============================================================================
+# RAW EVENT SCHEMA (what event_map / cached_events / cache.json retain)
+# ==============================================================================
+# Single declaration of every raw ESPN path the plugin reads after ingestion:
+# build_match_snapshot, evaluate_goals, snapshot_passes_filter, the AI prompt
+# builder, reminders, GameInfoScreen detail requests and the broadcaster list.
+# True keeps the value whole; a dict keeps only the listed keys (applied to
+# each element when the value is a list). Add a path here before reading it.
+_RAW_TEAM_SCHEMA = {
+    'id': True, 'uid': True, 'abbreviation': True, 'displayName': True,
+    'shortDisplayName': True, 'name': True, 'location': True, 'logo': True,
+    'color': True, 'alternateColor': True, 'countryCode': True,
+    'country': True, 'flag': True,
+}
+_RAW_COMPETITOR_SCHEMA = {
+    'id': True, 'uid': True, 'type': True, 'order': True, 'homeAway': True,
+    'winner': True, 'score': True, 'linescores': True, 'statistics': True,
+    'status': True, 'rank': True, 'seed': True, 'name': True,
+    'athlete': True, 'roster': True, 'country': True, 'flag': True,
+    'vehicle': True,
+    'team': _RAW_TEAM_SCHEMA,
+}
+_RAW_COMPETITION_SCHEMA = {
+    'id': True, 'uid': True, 'date': True, 'startDate': True, 'type': True,
+    'status': True, 'details': True, 'venue': True, 'round': True,
+    'notes': True, 'broadcasts': True, 'geoBroadcasts': True, 'broadcast': True,
+    'competitors': _RAW_COMPETITOR_SCHEMA,
+}
+RAW_EVENT_SCHEMA = {
+    'id': True, 'uid': True, 'date': True, 'endDate': True, 'name': True,
+    'shortName': True, 'status': True, 'links': True, 'venue': True,
+    'circuit': True,
+    # Flattened tennis matches (_extract_tennis_matches)
+    'tournament_id': True, 'competition_id': True,
+    # Added at ingestion
+    'league_name': True, 'league_url': True,
+    'h_logo_url': True, 'a_logo_url': True, 'l_logo_url': True,
+    'h_logo_id': True, 'a_logo_id': True, 'l_logo_id': True,
+    'competitions': _RAW_COMPETITION_SCHEMA,
+}
+
+
+def _prune_value(value, schema):
+    if isinstance(value, list):
+        return [_prune_value(v, schema) for v in value]
+    if not isinstance(value, dict):
+        return value
+    out = {}
+    for k, sub in schema.items():
+        if k in value:
+            out[k] = value[k] if sub is True else _prune_value(value[k], sub)
+    return out
+
+
+def prune_raw_event(ev, schema=RAW_EVENT_SCHEMA):
+    """Return a copy of ev holding only the paths declared in RAW_EVENT_SCHEMA."""
+    return _prune_value(ev, schema)
+
+
+# ==============================================================================
+# INCREMENTAL SNAPSHOT STORE
+# ==============================================================================
+def _snapshot_extra_inputs(ev):
+    """build_match_snapshot inputs not covered by state/clock/score checks."""
+    comp = (ev.get('competitions') or [{}])[0]
+    return (ev.get('status', {}).get('type', {}).get('shortDetail'),
+            comp.get('details'),
+            [(c.get('linescores'), c.get('statistics'), c.get('winner'))
+             for c in comp.get('competitors', [])])
+
+
+class MatchSnapshotStore(dict):
+    """
+    event_id -> MatchSnapshot, rebuilt incrementally.
+    The lazy processor marks the IDs whose scoreboard data changed; sync()
+    rebuilds only those, drops reaped IDs and keeps every other snapshot as-is.
+    Behaves like the plain dict it replaces for all UI readers.
+    """
+    def __init__(self):
+        dict.__init__(self)
+        self.dirty = set()
+        self._cycle_built = set()
+        self._built_day = datetime.date.today()
+        self.last_rebuilt = 0
+        self.last_reused = 0
+        self.version = 0            # bumped on every add/replace/remove
+        self._buckets = None
+        self._buckets_version = -1
+
+    def __setitem__(self, eid, snap):
+        dict.__setitem__(self, eid, snap)
+        self.version += 1
+
+    def __delitem__(self, eid):
+        dict.__delitem__(self, eid)
+        self.version += 1
+
+    def _day_buckets(self):
+        """(local day -> set(ids), set(live ids)), rebuilt only when the store changed."""
+        if self._buckets_version != self.version:
+            days = {}
+            live = set()
+            for eid, snap in self.items():
+                try:
+                    if snap['state'] == 'in':
+                        live.add(eid)
+                    start, end = _snapshot_dates(snap)
+                    days.setdefault(start, set()).add(eid)
+                    if end > start:
+                        # Multi-day events (racing): one entry per covered day
+                        d = datetime.datetime.strptime(start, "%Y-%m-%d").date()
+                        for _ in range(31):
+                            d += datetime.timedelta(days=1)
+                            day = d.isoformat()
+                            if day > end: break
+                            days.setdefault(day, set()).add(eid)
+                except Exception:
+                    pass
+            self._buckets = (days, live)
+            self._buckets_version = self.version
+        return self._buckets
+
+    def filter_ids(self, filter_mode, today, tomorrow, yesterday):
+        """Event IDs passing snapshot_passes_filter() for the whole store, as a
+        container for 'in' checks. filter_mode: 0=Yesterday, 1=Live, 2=Today, 3=Tomorrow, 4=All"""
+        if filter_mode not in (0, 1, 2, 3):
+            return self
+        days, live = self._day_buckets()
+        if filter_mode == 0: return days.get(yesterday, ())
+        if filter_mode == 1: return live
+        if filter_mode == 3: return days.get(tomorrow, ())
+        return days.get(today, set()) | live
+
+    def mark_dirty(self, eid):
+        self.dirty.add(str(eid))
+
+    def restore(self, event_map, rows, day):
+        """Install cached snapshot rows (unpacked lazily on first read).
+        Rows from another day are ignored: time_str labels are day-relative."""
+        if day != datetime.date.today().isoformat():
+            return 0
+        count = 0
+        for eid, row in rows.items():
+            ev = event_map.get(eid)
+            if ev is not None and len(row) == len(MatchSnapshot._FIELDS):
+                self[eid] = MatchSnapshot.from_row(ev, row)
+                count += 1
+        return count
+
+    def put(self, eid, snap):
+        """Store a snapshot that was already built (e.g. on the worker thread)."""
+        eid = str(eid)
+        self[eid] = snap
+        self._cycle_built.add(eid)
+        self.dirty.discard(eid)
+
+    def reset(self):
+        self.clear()
+        self.version += 1
+        self.dirty.clear()
+        self._cycle_built.clear()
+
+    def rebuild_dirty(self, event_map):
+        """Rebuild only the dirty snapshots (used between batch responses)."""
+        for eid in list(self.dirty):
+            ev = event_map.get(eid)
+            if ev is not None:
+                self[eid] = build_match_snapshot(ev)
+                self._cycle_built.add(eid)
+        self.dirty.clear()
+
+    def sync(self, event_map):
+        """End of a poll cycle: drop stale keys, rebuild dirty/missing snapshots,
+        re-point reused snapshots at the current raw event.
+        Returns (rebuilt, reused) for this cycle."""
+        # time_str embeds "today" vs weekday labels, so a day rollover
+        # invalidates every snapshot built yesterday.
+        today = datetime.date.today()
+        full = (today != self._built_day)
+        self._built_day = today
+
+        for k in [k for k in self if k not in event_map]:
+            del self[k]
+
+        built = self._cycle_built
+        dirty = self.dirty
+        for eid, ev in event_map.items():
+            snap = self.get(eid)
+            if full or snap is None or eid in dirty:
+                self[eid] = build_match_snapshot(ev)
+                built.add(eid)
+            elif snap.get('raw_event') is not ev:
+                snap['raw_event'] = ev
+
+        self.last_rebuilt = sum(1 for k in built if k in self)
+        self.last_reused = len(self) - self.last_rebuilt
+        dirty.clear()
+        built.clear()
+        return self.last_rebuilt, self.last_reused
+
+
+# ==============================================================================
+# SORTED EVENT INDEX
+# ==============================================================================
+def event_sort_key(ev):
+    """
+    STABLE SORT: STATUS + SPORT + DATE + LEAGUE + ID
+    Priority (Ascending for now, consumed/sorted elsewhere):
+    1) Post=0, Pre=1, Live=2
+    2) Other=0, Soccer=1
+    """
+    state = ev.get('status', {}).get('type', {}).get('state', 'pre')
+    if state == 'post': status_priority = 0
+    elif state == 'pre': status_priority = 1
+    else: status_priority = 2  # 'in'
+
+    # Soccer Priority
+    sport_priority = 1 if 'soccer' in ev.get('league_url', '') else 0
+
+    return (status_priority, sport_priority, ev.get('date', ''), ev.get('league_name', ''), str(ev.get('id', '')))
+
+
+class SortedEventIndex(object):
+    """
+    Raw events kept permanently in event_sort_key() order, mirroring event_map.
+    upsert()/remove() find the stored key by binary search (O(log n)); the
+    list insert/delete that follows is an O(n) memmove, still far cheaper than
+    re-sorting the whole day on every poll response. view() copies the list
+    once per mutation batch and hands out that copy until the next change.
+    """
+    def __init__(self):
+        self._keys = []     # sorted event_sort_key() tuples
+        self._events = []   # raw events, parallel to _keys
+        self._key_of = {}   # event_id -> key currently stored
+        self._view = None   # published copy of _events, dropped on mutation
+
+    def __len__(self):
+        return len(self._events)
+
+    def clear(self):
+        self._keys = []
+        self._events = []
+        self._key_of = {}
+        self._view = None
+
+    def rebuild(self, event_map):
+        pairs = sorted(((event_sort_key(ev), eid, ev) for eid, ev in event_map.items()),
+                       key=lambda p: p[0])
+        self._keys = [p[0] for p in pairs]
+        self._events = [p[2] for p in pairs]
+        self._key_of = dict((p[1], p[0]) for p in pairs)
+        self._view = None
+
+    def _pop(self, key):
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+            del self._events[i]
+
+    def upsert(self, eid, ev):
+        """Insert ev or move it to its new position (O(log n) search, O(n) move)."""
+        key = event_sort_key(ev)
+        self._view = None
+        old = self._key_of.get(eid)
+        if old is not None:
+            if old == key:
+                i = bisect.bisect_left(self._keys, key)
+                if i < len(self._keys) and self._keys[i] == key:
+                    self._events[i] = ev
+                    return
+            self._pop(old)
+        i = bisect.bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._events.insert(i, ev)
+        self._key_of[eid] = key
+
+    def remove(self, eid):
+        key = self._key_of.pop(eid, None)
+        if key is not None:
+            self._view = None
+            self._pop(key)
+
+    def view(self):
+        """List in sort order, copied only after a mutation. Never modified in
+        place, so screens may keep a reference to it."""
+        if self._view is None:
+            self._view = list(self._events)
+        return self._view
+
+
+# ==============================================================================
+# LOGO DOWNLOAD MANAGER
+# ==============================================================================
+LOGO_PRIO_VISIBLE  = 0   # rows / widgets currently on screen
+LOGO_PRIO_LIVE     = 1   # live matches (next most likely to be shown)
+LOGO_PRIO_PREFETCH = 2   # cache warm-up from scoreboard ingestion
+
+
+def _is_valid_png(path):
+    """100-byte minimum plus PNG magic: rejects empty files and saved HTML error pages."""
+    try:
+        if os.path.getsize(path) <= 100:
+            return False
+        with open(path, 'rb') as f:
+            return f.read(4) == b'\x89PNG'
+    except (IOError, OSError):
+        return False
+
+
+class LogoDownloadManager:
+    """
+    Single queue for every team/league logo download: list screens, detail
+    widgets, scoreboard prefetch and the league selector.
+    - global concurrency cap; lowest priority value is started first
+    - dedup by logo ID: a repeat request only adds its callback / raises priority
+    - failures retry with backoff, then the ID is skipped for the session
+    - the body is written to <path>.part and renamed into place once it is a valid PNG
+    Callbacks are called as callback(logo_id, path) on success only; a request
+    made while the ID is backing off keeps its callback for the retry. Callbacks
+    given an owner screen are released when that screen closes.
+    """
+    MAX_CONCURRENT = 4
+    RETRY_DELAYS = (20, 120, 600)   # seconds before attempts 2, 3 and 4
+
+    def __init__(self):
+        self._heap = []        # (priority, seq, logo_id); stale entries are skipped
+        self._queued = {}      # logo_id -> [priority, url, path]
+        self._active = set()
+        self._callbacks = {}   # logo_id -> [(callback, owner), ...] while queued/active/backing off
+        self._failures = {}    # logo_id -> failed attempts so far
+        self._retry_at = {}    # logo_id -> time before which requests are ignored
+        self._seq = 0
+        self.stats = {'done': 0, 'failed': 0, 'deduped': 0}
+
+    def is_pending(self, logo_id):
+        return logo_id in self._active or logo_id in self._queued
+
+    def _add_callback(self, logo_id, callback, owner=None):
+        if callback is None: return
+        cbs = self._callbacks.setdefault(logo_id, [])
+        if all(cb != callback for cb, _ in cbs):
+            cbs.append((callback, owner))
+        if owner is not None and not getattr(owner, '_logo_dl_hooked', False):
+            try:
+                owner.onClose.append(lambda: self.release(owner))
+                owner._logo_dl_hooked = True
+            except AttributeError:
+                pass
+
+    def release(self, owner):
+        """Forget the callbacks of a closed screen (downloads themselves continue)."""
+        for logo_id in list(self._callbacks):
+            cbs = [c for c in self._callbacks[logo_id] if c[1] is not owner]
+            if cbs:
+                self._callbacks[logo_id] = cbs
+            else:
+                del self._callbacks[logo_id]
+
+    def _push(self, priority, logo_id):
+        self._seq += 1
+        heapq.heappush(self._heap, (priority, self._seq, logo_id))
+
+    def request(self, url, logo_id, path, priority=LOGO_PRIO_PREFETCH, callback=None, owner=None):
+        if not url or not logo_id: return
+        if logo_id in self._active:
+            self.stats['deduped'] += 1
+            self._add_callback(logo_id, callback, owner)
+            return
+        entry = self._queued.get(logo_id)
+        if entry is not None:
+            self.stats['deduped'] += 1
+            self._add_callback(logo_id, callback, owner)
+            if priority < entry[0]:
+                entry[0] = priority
+                self._push(priority, logo_id)
+            return
+        retry_at = self._retry_at.get(logo_id, 0)
+        if retry_at > time.time():
+            # Backing off after a failure: the scheduled retry serves this
+            # callback too. Given-up IDs never succeed, so nothing is kept.
+            if retry_at != float('inf'):
+                self._add_callback(logo_id, callback, owner)
+            return
+        self._add_callback(logo_id, callback, owner)
+        self._queued[logo_id] = [priority, url, path]
+        self._push(priority, logo_id)
+        self._pump()
+
+    def _pump(self):
+        while self._heap and len(self._active) < self.MAX_CONCURRENT:
+            priority, _, logo_id = heapq.heappop(self._heap)
+            entry = self._queued.get(logo_id)
+            if entry is None or entry[0] != priority:
+                continue  # superseded by a higher-priority push
+            del self._queued[logo_id]
+            self._start(logo_id, entry[1], entry[2], priority)
+
+    def _start(self, logo_id, url, path, priority):
+        self._active.add(logo_id)
+        part = path + ".part"
+        try:
+            cache_dir = os.path.dirname(path)
+            if cache_dir and not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            downloadPage(url.encode('utf-8'), part) \
+                .addCallback(self._on_done, logo_id, url, path, part, priority) \
+                .addErrback(self._on_error, logo_id, url, path, part, priority)
+        except Exception as e:
+            self._on_error(e, logo_id, url, path, part, priority)
+
+    def _on_done(self, data, logo_id, url, path, part, priority):
+        if not _is_valid_png(part):
+            self._on_error(None, logo_id, url, path, part, priority)
+            return
+        try:
+            os.rename(part, path)
+        except OSError as e:
+            self._on_error(e, logo_id, url, path, part, priority)
+            return
+        self._active.discard(logo_id)
+        self._failures.pop(logo_id, None)
+        self._retry_at.pop(logo_id, None)
+        self.stats['done'] += 1
+        GLOBAL_VALID_LOGO_PATHS.add(path)
+        GLOBAL_LOGO_INDEX.add(logo_id, path)
+        GLOBAL_LOGO_VARIANTS.drop(logo_id)
+        GLOBAL_LOGO_VARIANTS.enqueue_all(path)
+        GLOBAL_PIXMAP_CACHE.pop(path, None)
+        for cb, _owner in self._callbacks.pop(logo_id, []):
+            try: cb(logo_id, path)
+            except Exception: pass
+        self._pump()
+
+    def _on_error(self, failure, logo_id, url, path, part, priority):
+        self._active.discard(logo_id)
+        self.stats['failed'] += 1
+        try: os.remove(part)
+        except OSError: pass
+        attempts = self._failures.get(logo_id, 0) + 1
+        self._failures[logo_id] = attempts
+        if attempts <= len(self.RETRY_DELAYS):
+            delay = self.RETRY_DELAYS[attempts - 1]
+            self._retry_at[logo_id] = time.time() + delay
+            reactor.callLater(delay, self._retry, logo_id, url, path, priority)
+        else:
+            self._retry_at[logo_id] = float('inf')
+            self._callbacks.pop(logo_id, None)
+            log_dbg("LOGO_DL: giving up on {} after {} attempts".format(logo_id, attempts))
+        self._pump()
+
+    def _retry(self, logo_id, url, path, priority):
+        self._retry_at.pop(logo_id, None)
+        if not self.is_pending(logo_id):
+            self.request(url, logo_id, path, priority)
+
+
+GLOBAL_LOGO_DOWNLOADER = LogoDownloadManager()
+
+
 # ==============================================================================
 # UNIFIED LOGO LOADER
 # ==============================================================================
@@ -2366,59 +3115,32 @@ def load_logo_to_widget(screen, widget_name, url, img_id=None, on_loaded=None, k
     if not img_id or img_id in ('0', ''):
         img_id = hashlib.md5(url.encode('utf-8')).hexdigest()[:12]
 
-    cache_dir = LOGO_CACHE_DIR + "/"
+    cache_dir = logo_cache_dir() + "/"
     file_path = cache_dir + str(img_id) + ".png"
 
-    # Serve from disk cache (100-byte minimum to reject corrupt files)
-    if os.path.exists(file_path) and os.path.getsize(file_path) > 100:
-        # Validate PNG magic bytes (\x89PNG) — a 404/HTML error page saved by a
-        # previous failed download passes the size check but cannot be loaded as
-        # a pixmap.  Delete it so we fall through to a fresh download.
+    # Serve from disk cache: the index only lists validated PNGs (a 404/HTML
+    # error page saved by an old download is dropped on its first lookup)
+    if GLOBAL_LOGO_INDEX.lookup(img_id):
         try:
-            with open(file_path, 'rb') as _f:
-                _magic = _f.read(4)
-            if _magic != b'\x89PNG':
-                os.remove(file_path)
-                if file_path in GLOBAL_PIXMAP_CACHE:
-                    del GLOBAL_PIXMAP_CACHE[file_path]
-                raise ValueError("stale cache")
-        except (IOError, ValueError):
-            pass  # fall through to download below
-        else:
-            try:
-                ptr = GLOBAL_PIXMAP_CACHE.get(file_path)
-                if not ptr and LoadPixmap:
-                    ptr = LoadPixmap(cached=True, path=file_path)
-                    if ptr: GLOBAL_PIXMAP_CACHE[file_path] = ptr
-                if ptr:
-                    if screen[widget_name].instance:
-                        screen[widget_name].instance.setPixmap(ptr)
-                        screen[widget_name].instance.setScale(1)
-                elif screen[widget_name].instance:
-                    screen[widget_name].instance.setPixmapFromFile(file_path)
+            ptr = GLOBAL_PIXMAP_CACHE.get(file_path)
+            if not ptr and LoadPixmap:
+                ptr = LoadPixmap(cached=True, path=file_path)
+                if ptr: GLOBAL_PIXMAP_CACHE[file_path] = ptr
+            if ptr:
+                if screen[widget_name].instance:
+                    screen[widget_name].instance.setPixmap(ptr)
                     screen[widget_name].instance.setScale(1)
-                screen[widget_name].show()
-                if on_loaded: on_loaded()
-            except: pass
-            return
+            elif screen[widget_name].instance:
+                screen[widget_name].instance.setPixmapFromFile(file_path)
+                screen[widget_name].instance.setScale(1)
+            screen[widget_name].show()
+            if on_loaded: on_loaded()
+        except: pass
+        return
 
-    # Download asynchronously
-    def _on_done(data):
+    # Download asynchronously (validated + renamed into place by the manager)
+    def _on_done(logo_id, path):
         try:
-            if not (os.path.exists(file_path) and os.path.getsize(file_path) > 100):
-                return
-            # Validate PNG magic bytes (\x89PNG)
-            try:
-                with open(file_path, 'rb') as _f:
-                    _magic = _f.read(4)
-                if _magic != b'\x89PNG':
-                    os.remove(file_path)
-                    return
-            except:
-                try: os.remove(file_path)
-                except: pass
-                return
-            GLOBAL_VALID_LOGO_PATHS.add(file_path)
             ptr = None
             if LoadPixmap:
                 ptr = LoadPixmap(cached=True, path=file_path)
@@ -2437,7 +3159,176 @@ def load_logo_to_widget(screen, widget_name, url, img_id=None, on_loaded=None, k
     if not keep_existing:
         try: screen[widget_name].hide()
         except: pass
-    downloadPage(url.encode('utf-8'), file_path).addCallback(_on_done).addErrback(lambda e: None)
+    GLOBAL_LOGO_DOWNLOADER.request(url, str(img_id), file_path, LOGO_PRIO_VISIBLE, _on_done, owner=screen)
+
+
+# ==============================================================================
+# PERSISTENT LOGO INDEX
+# ==============================================================================
+class LogoIndex:
+    """
+    Persistent index of the logo store: logo_id -> [file, size, mtime, last_used, validated].
+    Loaded on first lookup (not at boot) and reloaded if logo_store() moves;
+    kept in sync by the download manager. The first hit of a logo per session
+    stats its file so logos deleted behind our back are re-downloaded; files
+    found by the one-off directory scan (no/corrupt index) are PNG-validated
+    then too. LRU touches alone are written on a long interval (the store may
+    be flash); adds, discards and prunes within SAVE_DELAY.
+    """
+    VERSION = 1
+    SAVE_DELAY = 30           # seconds; coalesces index writes
+    TOUCH_SAVE_DELAY = 6 * 3600
+
+    def __init__(self):
+        self.cache_dir = None
+        self.max_bytes = 0
+        self.index_file = None
+        self._entries = None
+        self._save_call = None
+        self._seen = set()        # logo ids whose file was checked this session
+
+    def _load(self):
+        cache_dir, max_bytes = logo_store()
+        if cache_dir != self.cache_dir:
+            if self._entries is not None:
+                self.save()   # flush the old store before switching
+            self.cache_dir, self.max_bytes = cache_dir, max_bytes
+            self.index_file = os.path.join(cache_dir, "index.json")
+            self._entries = None
+            self._seen = set()
+        if self._entries is not None:
+            return self._entries
+        entries = None
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                entries = data.get('entries') or {}
+        except Exception:
+            pass
+        if entries is None:
+            entries = self._scan()
+        self._entries = entries
+        return entries
+
+    def _scan(self):
+        entries = {}
+        try:
+            for fn in os.listdir(self.cache_dir):
+                if not fn.endswith('.png'): continue
+                try:
+                    st = os.stat(os.path.join(self.cache_dir, fn))
+                    entries[fn[:-4]] = [fn, st.st_size, int(st.st_mtime), int(st.st_mtime), 0]
+                except OSError:
+                    pass
+        except OSError:
+            pass
+        log_dbg("LOGO_INDEX: rebuilt from directory scan ({} files)".format(len(entries)))
+        self._schedule_save()
+        return entries
+
+    def lookup(self, logo_id):
+        """Path of a usable cached logo, or None."""
+        e = self._load().get(str(logo_id))
+        if e is None:
+            return None
+        path = os.path.join(self.cache_dir, e[0])
+        key = str(logo_id)
+        if key not in self._seen:
+            if not os.path.exists(path):
+                self.discard(logo_id)
+                return None
+            if not e[4]:
+                if not _is_valid_png(path):
+                    self.discard(logo_id, remove_file=True)
+                    return None
+                e[4] = 1
+                self._schedule_save()
+            self._seen.add(key)
+        e[3] = int(time.time())   # LRU touch, persisted with the next save
+        self._schedule_save(self.TOUCH_SAVE_DELAY)
+        GLOBAL_VALID_LOGO_PATHS.add(path)
+        return path
+
+    def add(self, logo_id, path):
+        """Register a freshly downloaded (already validated) logo."""
+        entries = self._load()
+        if os.path.dirname(path) != self.cache_dir:
+            return
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        now = int(time.time())
+        entries[str(logo_id)] = [os.path.basename(path), st.st_size, int(st.st_mtime), now, 1]
+        self._seen.add(str(logo_id))
+        self._schedule_save()
+
+    def discard(self, logo_id, remove_file=False):
+        e = self._load().pop(str(logo_id), None)
+        self._seen.discard(str(logo_id))
+        if e is None:
+            return
+        path = os.path.join(self.cache_dir, e[0])
+        GLOBAL_VALID_LOGO_PATHS.discard(path)
+        GLOBAL_LOGO_VARIANTS.drop(logo_id)
+        if remove_file:
+            try: os.remove(path)
+            except OSError: pass
+        self._schedule_save()
+
+    def prune(self):
+        """Size-bounded LRU: drop least recently used logos until under 90% of the budget.
+        A logo costs its own bytes plus its pre-scaled variants, which go with it."""
+        entries = self._load()
+        variant_bytes = GLOBAL_LOGO_VARIANTS.sizes_by_logo()
+        for logo_id in [k for k in variant_bytes if k not in entries]:
+            GLOBAL_LOGO_VARIANTS.drop(logo_id)   # variants of logos no longer indexed
+            del variant_bytes[logo_id]
+        total = sum(e[1] + variant_bytes.get(k, 0) for k, e in entries.items())
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for logo_id, e in sorted(entries.items(), key=lambda kv: kv[1][3]):
+            if total <= target: break
+            path = os.path.join(self.cache_dir, e[0])
+            try: os.remove(path)
+            except OSError: pass
+            GLOBAL_VALID_LOGO_PATHS.discard(path)
+            GLOBAL_PIXMAP_CACHE.pop(path, None)
+            GLOBAL_LOGO_VARIANTS.drop(logo_id)
+            del entries[logo_id]
+            total -= e[1] + variant_bytes.get(logo_id, 0)
+            removed += 1
+        log_dbg("LOGO_INDEX: pruned {} logos, {} KB kept".format(removed, total // 1024))
+        self._schedule_save()
+        return removed
+
+    def _schedule_save(self, delay=None):
+        if delay is None:
+            delay = self.SAVE_DELAY
+        if self._save_call is not None and self._save_call.active():
+            if self._save_call.getTime() <= time.time() + delay:
+                return
+            self._save_call.cancel()   # a sooner save supersedes a touch-only one
+        self._save_call = reactor.callLater(delay, self.save)
+
+    def save(self):
+        if self._entries is None or self.cache_dir is None:
+            return
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            tmp_file = self.index_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({'version': self.VERSION, 'entries': self._entries}, f, separators=(',', ':'))
+            os.rename(tmp_file, self.index_file)
+        except Exception as e:
+            log_dbg("LOGO_INDEX: save failed: {}".format(e))
+
+
+GLOBAL_LOGO_INDEX = LogoIndex()
 
 
 # ==============================================================================
@@ -2447,22 +3338,11 @@ class LogoCacheManager:
     """Manages local caching of team logos with delayed auto-cleanup"""
     @profile_function("LogoCacheManager")
     def __init__(self):
-        self.cache_dir = LOGO_CACHE_DIR
-        self._ensure_cache_dir()
+        # The store is chosen lazily (logo_store()), so nothing touches the
+        # disk here; the directory is created by the first download or prune.
 
-        # Populate in-memory valid logo paths
-        try:
-            if os.path.exists(self.cache_dir):
-                for filename in os.listdir(self.cache_dir):
-                    if filename.endswith('.png'):
-                        GLOBAL_VALID_LOGO_PATHS.add(os.path.join(self.cache_dir, filename))
-            # Also check /tmp/simplysports/logos
-            tmp_dir = "/tmp/simplysports/logos/"
-            if os.path.exists(tmp_dir):
-                for filename in os.listdir(tmp_dir):
-                    if filename.endswith('.png'):
-                        GLOBAL_VALID_LOGO_PATHS.add(os.path.join(tmp_dir, filename))
-        except: pass
+        # Presence is answered by GLOBAL_LOGO_INDEX (loaded on first lookup),
+        # so there is no directory scan at boot.
 
         # OPTIMIZATION: Run pruning 60 seconds AFTER startup to avoid blocking boot
         self.prune_timer = eTimer()
@@ -2472,6 +3352,10 @@ class LogoCacheManager:
             self.prune_timer.timeout.get().append(self._prune_cache)
         self.prune_timer.start(60000, True)
 
+    @property
+    def cache_dir(self):
+        return logo_cache_dir()
+
     def _ensure_cache_dir(self):
         try:
             if not os.path.exists(self.cache_dir):
@@ -2479,24 +3363,13 @@ class LogoCacheManager:
         except: pass
 
     @profile_function("LogoCacheManager")
-    def _prune_cache(self, days=7):
-        """Delete files older than 'days'"""
+    def _prune_cache(self):
+        """Keep the logo store within its byte budget (least recently used first)"""
+        self._ensure_cache_dir()
         try:
-            now = time.time()
-            cutoff = now - (days * 86400)
-            if not os.path.exists(self.cache_dir): return
-
-            # Limit the number of files we check to prevent freezing
-            count = 0
-            for filename in os.listdir(self.cache_dir):
-                if count > 50: break # Only check a batch at a time
-                file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    if os.path.getmtime(file_path) < cutoff:
-                        os.remove(file_path)
-                        GLOBAL_VALID_LOGO_PATHS.discard(file_path)
-                count += 1
+            GLOBAL_LOGO_INDEX.prune()
         except: pass
+        log_diag("PIXMAP_CACHE: {}".format(pixmap_cache_stats()))
 
 
 # ==============================================================================
@@ -2636,24 +3509,240 @@ def safe_connect(timer_obj, func):
             timer_obj.timeout.append(func)
 
 
-GLOBAL_PIXMAP_CACHE = collections.OrderedDict()
-GLOBAL_PIXMAP_CACHE_LIMIT = 200
+class PixmapLRU(collections.OrderedDict):
+    """
+    Decoded-pixmap LRU bounded by estimated pixel memory (w*h*4 bytes) rather
+    than entry count, so a few full-size 500px logos cannot push out hundreds
+    of small list icons. Plain dict access keeps working for existing callers.
+    """
+    UNKNOWN_BYTES = 500 * 500 * 4   # unscaled ESPN logo when the size is unknown
+
+    def __init__(self, max_bytes):
+        collections.OrderedDict.__init__(self)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._sizes = {}
+
+    @classmethod
+    def _estimate(cls, ptr):
+        try:
+            sz = ptr.size()
+            return sz.width() * sz.height() * 4
+        except Exception:
+            return cls.UNKNOWN_BYTES
+
+    def put(self, key, ptr, nbytes=None):
+        if key in self:
+            self.pop(key)
+        collections.OrderedDict.__setitem__(self, key, ptr)
+        nbytes = self._estimate(ptr) if nbytes is None else nbytes
+        self._sizes[key] = nbytes
+        self.bytes += nbytes
+        while self.bytes > self.max_bytes and len(self) > 1:
+            old, _ = collections.OrderedDict.popitem(self, last=False)
+            self.bytes -= self._sizes.pop(old, 0)
+
+    def __setitem__(self, key, ptr):
+        self.put(key, ptr)
+
+    def __delitem__(self, key):
+        collections.OrderedDict.__delitem__(self, key)
+        self.bytes -= self._sizes.pop(key, 0)
+
+    def pop(self, key, *default):
+        if key in self:
+            val = collections.OrderedDict.__getitem__(self, key)
+            del self[key]
+            return val
+        if default: return default[0]
+        raise KeyError(key)
+
+    def touch(self, key):
+        """Return the cached value and mark it most recently used (None if absent)."""
+        if key not in self:
+            return None
+        val = collections.OrderedDict.__getitem__(self, key)
+        collections.OrderedDict.__delitem__(self, key)
+        collections.OrderedDict.__setitem__(self, key, val)
+        return val
+
+
+GLOBAL_PIXMAP_CACHE = PixmapLRU(16 * 1024 * 1024)
+GLOBAL_PIXMAP_STATS = {'hits': 0, 'misses': 0, 'variant_hits': 0, 'decodes': 0, 'decode_ms': 0.0}
 GLOBAL_VALID_LOGO_PATHS = set()
 GLOBAL_EPICLOAD_DECODERS = []
 
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
+
+# Logo sizes requested by the list/mini-bar skins (pre-built for every new logo)
+LOGO_VARIANT_SIZES = ((69, 69), (56, 56), (60, 60), (50, 50), (40, 40), (35, 35))
+
+
+class LogoVariantCache:
+    """
+    Pre-scaled logo PNGs on disk: <logo store>/variants/<logo_id>_<w>x<h>.png.
+    get_scaled_pixmap() loads a variant without ePicLoad scaling; a missing
+    variant is decoded as before and queued for the worker thread, which scales
+    with PIL (aspect kept, transparent padding like ePicLoad) and renames the
+    file into place. Variant bytes count towards the LogoIndex budget and are
+    removed with their logo. Without PIL the cache stays empty.
+    """
+    def __init__(self):
+        self.variant_dir = None
+        self._known = None      # variant file names, listed once on first use
+        self._sizes = {}        # variant file name -> bytes, stat'ed once for prune()
+        self._pending = set()
+        self._queue = []
+        self._busy = False
+
+    def _names(self):
+        variant_dir = os.path.join(logo_cache_dir(), "variants")
+        if variant_dir != self.variant_dir:
+            self.variant_dir, self._known, self._sizes = variant_dir, None, {}
+        if self._known is None:
+            try: self._known = set(os.listdir(self.variant_dir))
+            except OSError: self._known = set()
+        return self._known
+
+    @staticmethod
+    def variant_name(path, width, height):
+        """Variant file name for a logo-store PNG, or None for other images."""
+        if not path.startswith(logo_cache_dir() + "/") or not path.endswith(".png"):
+            return None
+        return "{}_{}x{}.png".format(os.path.basename(path)[:-4], width, height)
+
+    def lookup(self, name):
+        if name in self._names():
+            return os.path.join(self.variant_dir, name)
+        return None
+
+    def enqueue(self, src, width, height):
+        if _PILImage is None: return
+        name = self.variant_name(src, width, height)
+        if not name or name in self._pending or name in self._names(): return
+        self._pending.add(name)
+        self._queue.append((src, name, width, height))
+        self._kick()
+
+    def enqueue_all(self, src):
+        for w, h in LOGO_VARIANT_SIZES:
+            self.enqueue(src, w, h)
+
+    def drop(self, logo_id):
+        """Remove every variant of a logo (re-downloaded or pruned)."""
+        prefix = str(logo_id) + "_"
+        for name in [n for n in self._names() if n.startswith(prefix)]:
+            self._known.discard(name)
+            self._sizes.pop(name, None)
+            path = os.path.join(self.variant_dir, name)
+            GLOBAL_PIXMAP_CACHE.pop(path, None)
+            try: os.remove(path)
+            except OSError: pass
+
+    def sizes_by_logo(self):
+        """logo_id -> bytes of its variants on disk, counted in the LogoIndex budget."""
+        out = {}
+        for name in list(self._names()):
+            size = self._sizes.get(name)
+            if size is None:
+                try:
+                    size = self._sizes[name] = os.path.getsize(os.path.join(self.variant_dir, name))
+                except OSError:
+                    continue
+            logo_id = name.rsplit('_', 1)[0]
+            out[logo_id] = out.get(logo_id, 0) + size
+        return out
+
+    def _kick(self):
+        if self._busy or not self._queue: return
+        batch, self._queue = self._queue, []
+        self._busy = True
+        names = [item[1] for item in batch]
+        threads.deferToThread(self._build, batch).addBoth(self._built, names)
+
+    def _build(self, batch):
+        """WORKER THREAD: scale and write the variants, return the names written."""
+        done = []
+        resample = getattr(_PILImage, 'LANCZOS', getattr(_PILImage, 'ANTIALIAS', 1))
+        try:
+            if not os.path.exists(self.variant_dir):
+                os.makedirs(self.variant_dir)
+        except OSError:
+            return done
+        for src, name, w, h in batch:
+            try:
+                img = _PILImage.open(src).convert('RGBA')
+                # Fit inside w x h keeping the aspect, up- or downscaling like
+                # ePicLoad (thumbnail() would leave small logos undersized)
+                iw, ih = img.size
+                scale = min(float(w) / iw, float(h) / ih)
+                size = (max(1, int(round(iw * scale))), max(1, int(round(ih * scale))))
+                if size != img.size:
+                    img = img.resize(size, resample)
+                canvas = _PILImage.new('RGBA', (w, h), (0, 0, 0, 0))
+                canvas.paste(img, ((w - img.size[0]) // 2, (h - img.size[1]) // 2))
+                target = os.path.join(self.variant_dir, name)
+                canvas.save(target + ".part", "PNG")
+                os.rename(target + ".part", target)
+                done.append(name)
+            except Exception:
+                pass
+        return done
+
+    def _built(self, result, names):
+        self._busy = False
+        if isinstance(result, list):
+            self._names().update(result)
+        # Only this batch is done; names queued meanwhile stay pending
+        self._pending.difference_update(names)
+        self._kick()
+        return None
+
+
+GLOBAL_LOGO_VARIANTS = LogoVariantCache()
+
+
+def pixmap_cache_stats():
+    """Hit/miss/decode-time counters plus current pixmap memory estimate."""
+    st = dict(GLOBAL_PIXMAP_STATS)
+    st['entries'] = len(GLOBAL_PIXMAP_CACHE)
+    st['bytes'] = GLOBAL_PIXMAP_CACHE.bytes
+    st['avg_decode_ms'] = (st['decode_ms'] / st['decodes']) if st['decodes'] else 0.0
+    return st
+
 
 def get_scaled_pixmap(path, width, height):
     """Load and return a scaled pixmap from file path, cached in memory"""
     if not path: return None
     cache_key = "{}_{}x{}".format(path, width, height)
 
-    if cache_key in GLOBAL_PIXMAP_CACHE:
-        val = GLOBAL_PIXMAP_CACHE.pop(cache_key)
-        GLOBAL_PIXMAP_CACHE[cache_key] = val
+    val = GLOBAL_PIXMAP_CACHE.touch(cache_key)
+    if val is not None:
+        GLOBAL_PIXMAP_STATS['hits'] += 1
         return val
+    GLOBAL_PIXMAP_STATS['misses'] += 1
+    nbytes = width * height * 4
+
+    # Pre-scaled variant on disk: plain PNG load, no scaling on the UI thread
+    variant_name = LogoVariantCache.variant_name(path, width, height)
+    if variant_name and LoadPixmap:
+        variant = GLOBAL_LOGO_VARIANTS.lookup(variant_name)
+        if variant:
+            try:
+                ptr = LoadPixmap(cached=False, path=variant)
+                if ptr:
+                    GLOBAL_PIXMAP_STATS['variant_hits'] += 1
+                    GLOBAL_PIXMAP_CACHE.put(cache_key, ptr, nbytes)
+                    return ptr
+            except: pass
 
     try:
         from enigma import ePicLoad
+        t0 = time.time()
         sc = ePicLoad()
         global GLOBAL_EPICLOAD_DECODERS
         GLOBAL_EPICLOAD_DECODERS.append(sc)
@@ -2664,10 +3753,12 @@ def get_scaled_pixmap(path, width, height):
         sc.setPara((width, height, 1, 1, 0, 0, "#00000000"))
         if sc.startDecode(path, 0, 0, False) == 0:
             ptr = sc.getData()
+            GLOBAL_PIXMAP_STATS['decodes'] += 1
+            GLOBAL_PIXMAP_STATS['decode_ms'] += (time.time() - t0) * 1000.0
             if ptr:
-                if len(GLOBAL_PIXMAP_CACHE) >= GLOBAL_PIXMAP_CACHE_LIMIT:
-                    GLOBAL_PIXMAP_CACHE.popitem(last=False)
-                GLOBAL_PIXMAP_CACHE[cache_key] = ptr
+                GLOBAL_PIXMAP_CACHE.put(cache_key, ptr, nbytes)
+                if variant_name:
+                    GLOBAL_LOGO_VARIANTS.enqueue(path, width, height)
                 return ptr
     except: pass
 
@@ -2676,9 +3767,7 @@ def get_scaled_pixmap(path, width, height):
         try:
             ptr = LoadPixmap(cached=True, path=path)
             if ptr:
-                if len(GLOBAL_PIXMAP_CACHE) >= GLOBAL_PIXMAP_CACHE_LIMIT:
-                    GLOBAL_PIXMAP_CACHE.popitem(last=False)
-                GLOBAL_PIXMAP_CACHE[cache_key] = ptr
+                GLOBAL_PIXMAP_CACHE.put(cache_key, ptr)
                 return ptr
         except: pass
     return None
@@ -2687,12 +3776,24 @@ def get_scaled_pixmap(path, width, height):
 # ==============================================================================
 # LIST RENDERERS
 # ==============================================================================
-def draw_rounded_box(res, x, y, w, h, border_color, fill_color, is_solid):
-    """Draw a box with rounded top-left and bottom-right corners (arched from middle height, convex/outward curvature)"""
+# Rounded shapes are scanline approximations (no native rounded-rect primitive
+# on eListboxPythonMultiContent). Each (shape, size, colours) combination is
+# computed once: selection-invariant shapes become a cached PNG drawn with one
+# pixmap primitive; focus-dependent ones become a memoised list of rectangles
+# where runs of identical scanlines are merged into a single tall rectangle.
+_MC_SHAPE_PIXMAP = getattr(eListboxPythonMultiContent, 'TYPE_PIXMAP_ALPHABLEND',
+                           eListboxPythonMultiContent.TYPE_PIXMAP_ALPHATEST)
+_SHAPE_DIR = "/tmp/simplysports/shapes"
+_SHAPE_TEMPLATES = {}   # key -> ((x, y, w, h, color, color_sel), ...) relative to the shape origin
+_SHAPE_PIXMAPS = {}     # key -> pixmap, or None if it could not be rendered
+
+
+def _rounded_box_rows(w, h, border_color, fill_color, is_solid):
+    """Per-row segments [(x, w, color, color_sel)] of the arched status/time box."""
     import math
     h_half = h // 2
     max_dx = 15  # Symmetrical offset at top and bottom
-
+    rows = []
     for i in range(h):
         if i < h_half:
             # Top-left corner curved outward (convex) from middle height:
@@ -2706,29 +3807,20 @@ def draw_rounded_box(res, x, y, w, h, border_color, fill_color, is_solid):
             dx_left = 0
             dx_right = int(max_dx * (1.0 - math.sqrt(max(0.0, 1.0 - t ** 2))))
 
-        line_x = x + dx_left
         line_w = w - dx_left - dx_right
-
         # Outer border/solid line
-        res.append((eListboxPythonMultiContent.TYPE_TEXT, line_x, y + i, line_w, 1, 0, RT_HALIGN_CENTER, "", border_color, border_color, border_color, border_color))
-
-        if not is_solid:
+        segs = [(dx_left, line_w, border_color, border_color)]
+        if not is_solid and 0 < i < h - 1 and line_w - 2 > 0:
             # Inner fill line (inset by 1px to create outline border)
-            if i > 0 and i < h - 1:
-                inner_x = line_x + 1
-                inner_w = line_w - 2
-                if inner_w > 0:
-                    res.append((eListboxPythonMultiContent.TYPE_TEXT, inner_x, y + i, inner_w, 1, 0, RT_HALIGN_CENTER, "", fill_color, fill_color, fill_color, fill_color))
+            segs.append((dx_left + 1, line_w - 2, fill_color, fill_color))
+        rows.append(segs)
+    return rows
 
 
-def draw_card(res, x, y, w, h, radius, fill, fill_sel, border=None, border_sel=None, border_w=2):
-    """Draw a 4-corner rounded card (fully rounded rect) with an optional border that
-    switches color on focus (fill_sel / border_sel), used for the vNext match cards.
-    This is a scanline approximation suited to eListboxPythonMultiContent (no native
-    rounded-rect primitive is available on this engine)."""
+def _card_rows(w, h, radius, fill, fill_sel, border, border_sel, border_w):
+    """Per-row segments [(x, w, color, color_sel)] of a 4-corner rounded card."""
     import math
-    if border is None: border = fill
-    if border_sel is None: border_sel = fill_sel
+    rows = []
     for i in range(h):
         if i < radius:
             dy = radius - 1 - i
@@ -2738,20 +3830,113 @@ def draw_card(res, x, y, w, h, radius, fill, fill_sel, border=None, border_sel=N
             dx = radius - int(math.sqrt(max(0, radius * radius - dy * dy)))
         else:
             dx = 0
-        line_x = x + dx
         line_w = w - 2 * dx
         if line_w <= 0:
-            continue
-        if border_w > 0 and (i < border_w or i >= h - border_w):
+            rows.append([])
+        elif border_w > 0 and (i < border_w or i >= h - border_w):
             # Top/bottom edge rows: solid border color across the (curved) row
-            res.append((eListboxPythonMultiContent.TYPE_TEXT, line_x, y + i, line_w, 1, 0, RT_HALIGN_CENTER, "", border, border_sel, border, border_sel))
+            rows.append([(dx, line_w, border, border_sel)])
         elif border_w > 0 and line_w > 2 * border_w:
             # Middle rows: border strip on left/right edges, fill in between
-            res.append((eListboxPythonMultiContent.TYPE_TEXT, line_x, y + i, border_w, 1, 0, RT_HALIGN_CENTER, "", border, border_sel, border, border_sel))
-            res.append((eListboxPythonMultiContent.TYPE_TEXT, line_x + border_w, y + i, line_w - 2 * border_w, 1, 0, RT_HALIGN_CENTER, "", fill, fill_sel, fill, fill_sel))
-            res.append((eListboxPythonMultiContent.TYPE_TEXT, line_x + line_w - border_w, y + i, border_w, 1, 0, RT_HALIGN_CENTER, "", border, border_sel, border, border_sel))
+            rows.append([(dx, border_w, border, border_sel),
+                         (dx + border_w, line_w - 2 * border_w, fill, fill_sel),
+                         (dx + line_w - border_w, border_w, border, border_sel)])
         else:
-            res.append((eListboxPythonMultiContent.TYPE_TEXT, line_x, y + i, line_w, 1, 0, RT_HALIGN_CENTER, "", fill, fill_sel, fill, fill_sel))
+            rows.append([(dx, line_w, fill, fill_sel)])
+    return rows
+
+
+def _merge_rows(rows):
+    """Collapse runs of identical scanlines into (x, y, w, h, color, color_sel) rects."""
+    rects = []
+    start = 0
+    for i in range(1, len(rows) + 1):
+        if i < len(rows) and rows[i] == rows[start]:
+            continue
+        for x, w, c, cs in rows[start]:
+            rects.append((x, start, w, i - start, c, cs))
+        start = i
+    return tuple(rects)
+
+
+def _write_rgba_png(path, w, h, rows):
+    """Minimal RGBA PNG writer (zlib only) for the flat-colour shape pixmaps."""
+    import zlib
+    import struct
+    raw = []
+    for segs in rows:
+        line = bytearray(w * 4)
+        for x, sw, c, _cs in segs:
+            px = bytearray(((c >> 16) & 0xFF, (c >> 8) & 0xFF, c & 0xFF, 0xFF))
+            line[x * 4:(x + sw) * 4] = px * sw
+        raw.append(b'\x00' + bytes(line))
+
+    def chunk(tag, data):
+        return (struct.pack('>I', len(data)) + tag + data
+                + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    png = (b'\x89PNG\r\n\x1a\n'
+           + chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 6, 0, 0, 0))
+           + chunk(b'IDAT', zlib.compress(b''.join(raw), 6))
+           + chunk(b'IEND', b''))
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(png)
+    os.rename(tmp, path)
+
+
+def _shape_pixmap(key, w, h, rows):
+    """Cached pixmap for a selection-invariant shape (None when it can't be made)."""
+    if key in _SHAPE_PIXMAPS:
+        return _SHAPE_PIXMAPS[key]
+    ptr = None
+    if LoadPixmap:
+        try:
+            if not os.path.exists(_SHAPE_DIR):
+                os.makedirs(_SHAPE_DIR)
+            path = os.path.join(_SHAPE_DIR, hashlib.md5(repr(key).encode('utf-8')).hexdigest()[:16] + ".png")
+            if not os.path.exists(path):
+                _write_rgba_png(path, w, h, rows)
+            ptr = LoadPixmap(cached=False, path=path)
+        except Exception as e:
+            log_dbg("shape pixmap error: " + str(e))
+    _SHAPE_PIXMAPS[key] = ptr
+    return ptr
+
+
+def _emit_shape(res, x, y, w, h, key, build_rows):
+    """Append a cached shape at (x, y): one pixmap primitive when the shape looks
+    the same focused and unfocused (plain RGB colours), else merged rectangles."""
+    rects = _SHAPE_TEMPLATES.get(key)
+    if rects is None:
+        rows = build_rows()
+        rects = _SHAPE_TEMPLATES[key] = _merge_rows(rows)
+        static = all(c == cs and c <= 0xFFFFFF for _x, _y, _w, _h, c, cs in rects)
+        if static and w > 0 and h > 0:
+            _shape_pixmap(key, w, h, rows)
+    ptr = _SHAPE_PIXMAPS.get(key)
+    if ptr:
+        res.append((_MC_SHAPE_PIXMAP, x, y, w, h, ptr))
+        return
+    for rx, ry, rw, rh, c, cs in rects:
+        res.append((eListboxPythonMultiContent.TYPE_TEXT, x + rx, y + ry, rw, rh, 0, RT_HALIGN_CENTER, "", c, cs, c, cs))
+
+
+def draw_rounded_box(res, x, y, w, h, border_color, fill_color, is_solid):
+    """Draw a box with rounded top-left and bottom-right corners (arched from middle height, convex/outward curvature)"""
+    key = ('box', w, h, border_color, fill_color, bool(is_solid))
+    _emit_shape(res, x, y, w, h, key,
+                lambda: _rounded_box_rows(w, h, border_color, fill_color, is_solid))
+
+
+def draw_card(res, x, y, w, h, radius, fill, fill_sel, border=None, border_sel=None, border_w=2):
+    """Draw a 4-corner rounded card (fully rounded rect) with an optional border that
+    switches color on focus (fill_sel / border_sel), used for the vNext match cards."""
+    if border is None: border = fill
+    if border_sel is None: border_sel = fill_sel
+    key = ('card', w, h, radius, fill, fill_sel, border, border_sel, border_w)
+    _emit_shape(res, x, y, w, h, key,
+                lambda: _card_rows(w, h, radius, fill, fill_sel, border, border_sel, border_w))
 
 
 # ==============================================================================
@@ -4376,6 +5561,580 @@ class AIToast(Screen):
         self.timer.callback.append(self.close)
         self.timer.start(duration_ms, True)
 
+# ==============================================================================
+# CONDITIONAL HTTP (ETag / Last-Modified / body hash)
+# ==============================================================================
+class HTTPValidatorCache:
+    """
+    Per-URL validator cache for scoreboard polling.
+    Sends If-None-Match / If-Modified-Since when we have validators, and falls
+    back to an MD5 of the body for servers that ignore them. resolve() returns
+    None when the scoreboard is unchanged so the caller can skip parsing.
+    A changed body's validators stay pending until commit(league_url) is
+    called after its events were merged, so a body that failed to process
+    is fetched and processed again next poll.
+    """
+    def __init__(self):
+        self.entries = {}   # fetch_url -> {'etag':, 'last_modified':, 'hash':, 'size':}
+        self.pending = {}   # league_url -> (fetch_url, entry) awaiting commit()
+        self.stats = {}     # league name -> {'hits':, 'misses':, 'bytes_saved':}
+
+    def clear(self):
+        """Forget validators (call whenever event_map is flushed)."""
+        self.entries = {}
+        self.pending = {}
+
+    def commit(self, league_url):
+        """The body last resolved for league_url was merged: keep its validators."""
+        item = self.pending.pop(league_url, None)
+        if item is not None:
+            self.entries[item[0]] = item[1]
+
+    def request_headers(self, url):
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        raw = {}
+        if entry.get('etag'):
+            raw[b'If-None-Match'] = [entry['etag']]
+        if entry.get('last_modified'):
+            raw[b'If-Modified-Since'] = [entry['last_modified']]
+        return Headers(raw) if raw else None
+
+    def resolve(self, name, url, code, headers, body, league_url=None):
+        """Returns body if it must be processed, None if unchanged."""
+        entry = self.entries.get(url)
+        st = self.stats.setdefault(name, {'hits': 0, 'misses': 0, 'bytes_saved': 0})
+        if code == 304 and entry:
+            st['hits'] += 1
+            st['bytes_saved'] += entry.get('size', 0)
+            log_diag("HTTP_COND: '{}' HIT (304) hits={} misses={} saved={}KB".format(
+                name, st['hits'], st['misses'], st['bytes_saved'] // 1024))
+            return None
+        if code != 200 or not body:
+            return body
+
+        digest = hashlib.md5(body).hexdigest()
+        if entry and entry.get('hash') == digest:
+            st['hits'] += 1
+            log_diag("HTTP_COND: '{}' HIT (hash) hits={} misses={} saved={}KB".format(
+                name, st['hits'], st['misses'], st['bytes_saved'] // 1024))
+            return None
+
+        etag = headers.getRawHeaders(b'etag') if headers is not None else None
+        l_mod = headers.getRawHeaders(b'last-modified') if headers is not None else None
+        self.pending[league_url or url] = (url, {
+            'etag':          etag[0] if etag else None,
+            'last_modified': l_mod[0] if l_mod else None,
+            'hash':          digest,
+            'size':          len(body),
+        })
+        st['misses'] += 1
+        log_diag("HTTP_COND: '{}' MISS hits={} misses={}".format(name, st['hits'], st['misses']))
+        return body
+
+
+# ==============================================================================
+# PER-LEAGUE ADAPTIVE POLL SCHEDULER
+# ==============================================================================
+class LeaguePollScheduler:
+    """
+    Keeps a next-due time per league URL so custom mode only re-fetches the
+    leagues that need it. The interval comes from the league's own events:
+    live matches and imminent kick-offs poll fast, a league that just had a
+    final whistle polls a little longer, idle leagues back off to 10-30 min
+    (capped at 5 min while a screen is open).
+    """
+    LIVE_INTERVAL        = 30      # live match / kick-off within 15 min
+    FINAL_INTERVAL       = 60      # within 10 min of a final whistle
+    SOON_INTERVAL        = 120     # kick-off within the hour
+    IDLE_MIN_INTERVAL    = 600
+    IDLE_MAX_INTERVAL    = 1800
+    UI_IDLE_CAP          = 300
+    FINAL_GRACE          = 600
+    DUE_SLACK            = 2       # timer jitter tolerance (seconds)
+
+    def __init__(self):
+        self.next_due = {}     # url -> epoch
+        self.intervals = {}    # url -> last interval (s), for diagnostics
+        self.live_ids = {}     # url -> set(event_id) live at last update
+        self.last_final = {}   # url -> epoch of last observed final whistle
+
+    def reset(self):
+        self.next_due = {}
+        self.intervals = {}
+        self.live_ids = {}
+        self.last_final = {}
+
+    def cap(self, now, limit):
+        """Bring every league due within limit seconds (a screen just opened)."""
+        for url, due in list(self.next_due.items()):
+            if due - now > limit:
+                self.next_due[url] = now + limit
+
+    def is_due(self, url, now):
+        due = self.next_due.get(url)
+        return due is None or due - now <= self.DUE_SLACK
+
+    def soonest(self, urls):
+        """Epoch of the earliest next-due among urls (None if any never ran)."""
+        best = None
+        for url in urls:
+            due = self.next_due.get(url)
+            if due is None:
+                return None
+            if best is None or due < best:
+                best = due
+        return best
+
+    def update(self, url, events, now, ui_open=False):
+        """Reschedule one league from its current events; returns interval (s)."""
+        live_now = set()
+        next_ko = None
+        for ev in events:
+            state = ev.get('status', {}).get('type', {}).get('state', 'pre')
+            if state == 'in':
+                live_now.add(str(ev.get('id', '')))
+            elif state == 'pre':
+                m_date = ev.get('date', '')
+                if not m_date:
+                    continue
+                try:
+                    dt = datetime.datetime.strptime(m_date[:16], "%Y-%m-%dT%H:%M")
+                    m_ts = calendar.timegm(dt.timetuple())
+                except Exception:
+                    continue
+                if m_ts >= now - 300 and (next_ko is None or m_ts < next_ko):
+                    next_ko = m_ts
+
+        # A match that was live last time and is not any more has just ended
+        if self.live_ids.get(url, set()) - live_now:
+            self.last_final[url] = now
+        self.live_ids[url] = live_now
+
+        if live_now or (next_ko is not None and next_ko - now <= 900):
+            interval = self.LIVE_INTERVAL
+        elif now - self.last_final.get(url, 0) <= self.FINAL_GRACE:
+            interval = self.FINAL_INTERVAL
+        elif next_ko is not None and next_ko - now <= 3600:
+            interval = self.SOON_INTERVAL
+        else:
+            if next_ko is not None:
+                # Wake up ~15 min before the next kick-off
+                interval = next_ko - now - 900
+            else:
+                interval = self.IDLE_MAX_INTERVAL
+            interval = max(self.IDLE_MIN_INTERVAL, min(self.IDLE_MAX_INTERVAL, int(interval)))
+            if ui_open:
+                interval = min(interval, self.UI_IDLE_CAP)
+
+        self.intervals[url] = interval
+        self.next_due[url] = now + interval
+        return interval
+
+
+# ==============================================================================
+# NOTIFICATION SCHEDULER
+# ==============================================================================
+# Seconds during which a new score for a match still merges into its queued
+# toast instead of adding another one (0 = never merge). Keyed by
+# _notification_sport().
+NOTIFY_MERGE_WINDOWS = {
+    'basketball': 60,
+    'soccer': 0,
+    'other': 0,
+}
+NOTIFY_TIER_RETRY = -1      # re-queued after a failed open: shown next
+NOTIFY_TIER_SOCCER = 0
+NOTIFY_TIER_OTHER = 1
+
+
+def _notification_sport(league_url):
+    league_url = (league_url or '').lower()
+    if '/basketball/' in league_url or 'euroleague' in league_url: return 'basketball'
+    if '/soccer/' in league_url: return 'soccer'
+    return 'other'
+
+
+class NotificationScheduler(object):
+    """
+    Toast queue for SportsMonitor: a heap ordered by (tier, sequence) so
+    soccer goes first and each tier stays FIFO, plus two indexes for O(1)
+    checks on push - (match_id, event_type) -> newest queued entry for
+    merging, and (match_id, score, event_type) -> count for dedup.
+
+    Items are the monitor's (match_id, score, scorer, event_type,
+    scoring_team, sound_type) tuples. Heap entries are
+    [tier, seq, item, queued_ts, merge_key].
+    """
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+        self._by_match = {}
+        self._dedup = {}
+        self.max_depth = 0
+        self.pushed = 0
+        self.merged = 0
+        self.deduped = 0
+        self.delivered = 0
+        self._latency_total = 0.0
+        self._last_wait = 0.0
+        self.max_latency = 0.0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+    __nonzero__ = __bool__
+
+    @staticmethod
+    def _dedup_key(item):
+        return (item[0], item[1], item[3])
+
+    def is_queued(self, item):
+        return self._dedup.get(self._dedup_key(item), 0) > 0
+
+    def _count(self, item, delta):
+        key = self._dedup_key(item)
+        n = self._dedup.get(key, 0) + delta
+        if n > 0: self._dedup[key] = n
+        else: self._dedup.pop(key, None)
+
+    def merge(self, item, window, combine):
+        """Fold item into the queued entry for the same match/event type when
+        it was queued less than window seconds ago. combine(old, new) returns
+        the merged item. Returns True when merged."""
+        if window <= 0:
+            return False
+        entry = self._by_match.get((item[0], item[3]))
+        if entry is None or time.time() - entry[3] > window:
+            return False
+        self._count(entry[2], -1)
+        entry[2] = combine(entry[2], item)
+        self._count(entry[2], 1)
+        self.merged += 1
+        return True
+
+    def push(self, item, tier, queued_ts=None):
+        """Queue item; returns False (and drops it) when an identical one is queued."""
+        if queued_ts is None and self.is_queued(item):
+            self.deduped += 1
+            return False
+        self._seq += 1
+        key = (item[0], item[3])
+        entry = [tier, self._seq, item, queued_ts or time.time(), key]
+        heapq.heappush(self._heap, entry)
+        self._by_match[key] = entry
+        self._count(item, 1)
+        if queued_ts is None:
+            self.pushed += 1
+        if len(self._heap) > self.max_depth:
+            self.max_depth = len(self._heap)
+        return True
+
+    def requeue(self, item, queued_ts=None):
+        """Put an item that could not be shown back at the head of the queue."""
+        self.delivered -= 1
+        self._latency_total -= self._last_wait
+        self._last_wait = 0.0
+        self.push(item, NOTIFY_TIER_RETRY, queued_ts or time.time())
+
+    def pop(self):
+        """Next item to show as (item, queued_ts), or (None, None) when empty."""
+        if not self._heap:
+            return None, None
+        entry = heapq.heappop(self._heap)
+        item, queued_ts, key = entry[2], entry[3], entry[4]
+        if self._by_match.get(key) is entry:
+            del self._by_match[key]
+        self._count(item, -1)
+        wait = max(0.0, time.time() - queued_ts)
+        self.delivered += 1
+        self._latency_total += wait
+        self._last_wait = wait
+        if wait > self.max_latency:
+            self.max_latency = wait
+        return item, queued_ts
+
+    def clear(self):
+        del self._heap[:]
+        self._by_match.clear()
+        self._dedup.clear()
+
+    def stats(self):
+        return {
+            'depth': len(self._heap), 'max_depth': self.max_depth,
+            'pushed': self.pushed, 'merged': self.merged, 'deduped': self.deduped,
+            'delivered': self.delivered,
+            'avg_latency': (self._latency_total / self.delivered) if self.delivered > 0 else 0.0,
+            'max_latency': self.max_latency,
+        }
+
+
+# ==============================================================================
+# SHARED ESPN SUMMARY FETCHES
+# ==============================================================================
+class SummaryFetchService(object):
+    """
+    One summary/boxscore request per event and URL, shared by every consumer
+    (scorer resolver, live patcher, bet referee, GameInfo). Requests go
+    through the monitor's pooled Agent; a second caller asking while one is
+    in flight subscribes to it, and a finished response is served from a
+    short TTL cache. fetch() fires with the body bytes, fetch_json() with
+    the decoded JSON, parsed at most once per response - treat it as
+    read-only. Cache hits are delivered on the next reactor turn, like a
+    network response would be.
+
+    max_age overrides TTL_SECS per call; 0 skips the cache but still joins a
+    request already in flight.
+    """
+    TTL_SECS = 20
+    MAX_ENTRIES = 64
+    TIMEOUT_SECS = 10
+
+    def __init__(self, agent):
+        self.agent = RedirectAgent(agent) if RedirectAgent else agent
+        self._cache = collections.OrderedDict()     # (eid, url) -> [fetched_ts, body, data]
+        self._inflight = {}                         # (eid, url) -> [Deferred, ...]
+        self.requests = 0
+        self.joined = 0
+        self.cache_hits = 0
+        self.parses = 0
+
+    def fetch(self, eid, url, max_age=None):
+        return self._slot(eid, url, max_age).addCallback(lambda slot: slot[1])
+
+    def fetch_json(self, eid, url, max_age=None):
+        return self._slot(eid, url, max_age).addCallback(self._json)
+
+    def _json(self, slot):
+        if slot[2] is None:
+            slot[2] = json.loads(slot[1].decode('utf-8', errors='ignore'))
+            self.parses += 1
+        return slot[2]
+
+    def _slot(self, eid, url, max_age):
+        key = (str(eid), url)
+        ttl = self.TTL_SECS if max_age is None else max_age
+        d = defer.Deferred()
+        slot = self._cache.get(key)
+        if slot is not None and time.time() - slot[0] < ttl:
+            self.cache_hits += 1
+            reactor.callLater(0, d.callback, slot)
+            return d
+        waiters = self._inflight.get(key)
+        if waiters is not None:
+            self.joined += 1
+            waiters.append(d)
+            return d
+        self._inflight[key] = [d]
+        self.requests += 1
+        try:
+            req = self.agent.request(b'GET', url.encode('utf-8'))
+        except Exception:
+            req = defer.fail()
+        else:
+            # A stalled pooled connection must not keep every subscriber waiting
+            timeout_call = reactor.callLater(self.TIMEOUT_SECS, req.cancel)
+            req.addBoth(lambda x, tc=timeout_call: (tc.cancel() if tc.active() else None, x)[1])
+            req.addCallback(self._read)
+        req.addCallback(self._done, key)
+        req.addErrback(self._failed, key)
+        return d
+
+    def _read(self, response):
+        code = response.code
+        def _check(body):
+            if code != 200:
+                raise IOError("HTTP {}".format(code))
+            return body
+        return readBody(response).addCallback(_check)
+
+    def _done(self, body, key):
+        # ESPN may return gzip-compressed responses
+        if body[:2] == b'\x1f\x8b':
+            import gzip, io
+            try:
+                body = gzip.GzipFile(fileobj=io.BytesIO(body)).read()
+            except Exception:
+                pass
+        slot = [time.time(), body, None]
+        self._cache.pop(key, None)
+        self._cache[key] = slot
+        while len(self._cache) > self.MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        for d in self._inflight.pop(key, ()):
+            d.callback(slot)
+
+    def _failed(self, failure, key):
+        # Always release the key so the next caller starts a fresh request
+        for d in self._inflight.pop(key, ()):
+            d.errback(failure)
+        return None
+
+    def stats(self):
+        return {'requests': self.requests, 'joined': self.joined,
+                'cache_hits': self.cache_hits, 'parses': self.parses,
+                'inflight': len(self._inflight), 'cached': len(self._cache)}
+
+
+# ==============================================================================
+# WHERE-TO-WATCH PRECOMPUTE
+# ==============================================================================
+class WhereToWatchPrecomputer:
+    """
+    Background "where to watch" for upcoming and live fixtures. After each
+    data refresh schedule() queues every snapshot kicking off within
+    HORIZON_SECS (or live) whose channels are missing or stale; the queue is
+    drained CHUNK fixtures at a time through GLOBAL_EPG_ENGINE.match_many()
+    on a worker thread, with PAUSE_SECS between chunks so no tick holds the
+    CPU for long. Results are persisted so a restart shows them immediately.
+
+    entries: {eid: {'ko': ts, 'at': computed_ts, 'ch': [[sref, name, title, color], ...]}}
+    """
+    VERSION = 1
+    CHUNK = 6
+    PAUSE_SECS = 3
+    HORIZON_SECS = 36 * 3600
+    REFRESH_SECS = 1800      # recompute every fixture this often (EPG imports add channels)
+    KEEP_CHANNELS = 20
+
+    def __init__(self, path):
+        self._path = path        # str, or callable resolved on first use
+        self._entries = None     # loaded on first use, after the boot-time mounts
+        self._queue = []
+        self._queued = set()
+        self._running = False
+        self._dirty = False
+
+    @property
+    def path(self):
+        if callable(self._path):
+            self._path = self._path()
+        return self._path
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                cutoff = time.time() - 4 * 3600
+                return dict((k, v) for k, v in data.get('entries', {}).items()
+                            if v.get('ko', 0) >= cutoff)
+        except Exception:
+            pass
+        return {}
+
+    def save(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            d = os.path.dirname(self.path)
+            if not os.path.exists(d):
+                os.makedirs(d)
+            tmp = self.path + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump({'version': self.VERSION, 'entries': self.entries}, f, separators=(',', ':'))
+            os.rename(tmp, self.path)
+        except Exception as e:
+            log_dbg("WhereToWatch save error: " + str(e))
+
+    def get(self, eid):
+        """Precomputed [(sref, full_name, display_title, cat_color)] for an event, or None."""
+        e = self.entries.get(str(eid))
+        if e is None:
+            return None
+        return [tuple(c) for c in e['ch']]
+
+    def best_channel(self, eid):
+        """(sref, channel name) of the top precomputed channel, or (None, '')."""
+        ch = self.get(eid)
+        if not ch:
+            return None, ""
+        return ch[0][0], ch[0][1]
+
+    def _needs_compute(self, eid, ko, now):
+        e = self.entries.get(eid)
+        if e is None or e.get('ko') != ko:
+            return True
+        # Empty or not, far off or close: channels appear with every EPG import
+        return now - e.get('at', 0) > self.REFRESH_SECS
+
+    def schedule(self, snapshots):
+        """Queue stale/missing fixtures from match_snapshots and start draining."""
+        now = time.time()
+        for eid, snap in list(snapshots.items()):
+            eid = str(eid)
+            if eid in self._queued:
+                continue
+            state = snap.get('state', 'pre')
+            ko = snap.get('start_ts') or 0
+            if not ko or state == 'post':
+                continue
+            if state == 'pre' and not (-3 * 3600 <= ko - now <= self.HORIZON_SECS):
+                continue
+            if not self._needs_compute(eid, ko, now):
+                continue
+            self._queued.add(eid)
+            self._queue.append((ko, eid, snap.get('h_name', ''), snap.get('a_name', ''),
+                                snap.get('league_name', '')))
+        # Soonest kick-offs first
+        self._queue.sort()
+        if self._queue and not self._running:
+            self._running = True
+            reactor.callLater(self.PAUSE_SECS, self._next_chunk)
+
+    def _next_chunk(self):
+        if not self._queue:
+            self._running = False
+            self.save()
+            return
+        chunk, self._queue = self._queue[:self.CHUNK], self._queue[self.CHUNK:]
+        queries = []
+        for ko, eid, home, away, league in chunk:
+            self._queued.discard(eid)
+            queries.append((eid,
+                            [normalize_text(kw) for kw in get_search_keywords(home)],
+                            [normalize_text(kw) for kw in get_search_keywords(away)],
+                            [normalize_text(kw) for kw in get_search_keywords(league)],
+                            ko))
+        try:
+            services = get_all_services()   # main thread: eServiceCenter
+        except Exception:
+            services = []
+        if not services:
+            self._queue = []
+            self._queued.clear()
+            self._running = False
+            return
+
+        kos = dict((q[0], q[4]) for q in queries)
+
+        def _store(results):
+            now = time.time()
+            for eid, rows in results.items():
+                self.entries[eid] = {'ko': kos[eid], 'at': now,
+                                     'ch': [list(r[:4]) for r in rows]}
+            self._dirty = True
+
+        def _continue(result):
+            if hasattr(result, 'getErrorMessage'):
+                log_dbg("WhereToWatch chunk error: " + result.getErrorMessage())
+            reactor.callLater(self.PAUSE_SECS, self._next_chunk)
+            return None
+
+        threads.deferToThread(GLOBAL_EPG_ENGINE.match_many, queries, services,
+                              self.KEEP_CHANNELS).addCallback(_store).addBoth(_continue)
+
+
 # ==============================================================================
 # SPORTS MONITOR (FIXED: Stable Sorting)
 # ==============================================================================
@@ -4412,7 +6171,6 @@ class SportsMonitor:
 
         self.logo_path_cache = {}
         self.missing_logo_cache = set()
-        self.pending_logos = set()
         self.voter_name = "Anonymous"
         self.current_league_index = 0
         self.reminders = []
@@ -4449,10 +6207,12 @@ class SportsMonitor:
 
         self.session = None
         self.cached_events = []
-        self.match_snapshots = {}  # Unified snapshots for all UI consumers
+        self.match_snapshots = MatchSnapshotStore()  # Unified snapshots for all UI consumers
+        self.where_to_watch = WhereToWatchPrecomputer(
+            lambda: logo_state_file("where_to_watch.json"))
         self.callbacks = []
         self.status_message = "Initializing..."
-        self.notification_queue = []
+        self.notification_queue = NotificationScheduler()
         self.notification_active = False
         self.current_toast = None  # Reference to active GoalToast for live updates
         self.current_toast_match = None  # (home, away) tuple of active toast
@@ -4465,8 +6225,14 @@ class SportsMonitor:
         self.batch_is_active = False
         self.batch_timer = eTimer()
         safe_connect(self.batch_timer, self.finalize_batch)
+        self.poll_scheduler = LeaguePollScheduler()  # per-league next-due times (custom mode)
         self.processing_queue = []
         self.processing_active = False
+        # Worker-thread normalise stage (see process_events_data)
+        self._process_generation = 0
+        self._pending_normalise = 0
+        self._finalize_waiting = False
+        self._finalize_wait_start = 0
 
         self.logo_cache = LogoCacheManager()
         self.last_update = 0
@@ -4477,6 +6243,8 @@ class SportsMonitor:
         self.pool.maxPersistentPerHost = 50  # Allow all 67 leagues to connect concurrently
         self.pool._factory.noisy = False
         self.agent = Agent(reactor, pool=self.pool)
+        self.summaries = SummaryFetchService(self.agent)  # shared per-event summary fetches
+        self.http_validators = HTTPValidatorCache()  # ETag/Last-Modified/hash per scoreboard URL
         self.active_requests = set()
         self.last_cache_save = 0
         self.last_callback_time = 0
@@ -4484,6 +6252,7 @@ class SportsMonitor:
         self.callback_debounce_timer = eTimer()
         safe_connect(self.callback_debounce_timer, self._execute_pending_callback)
         self.event_map = {} # optimization: O(1) lookup
+        self.event_index = SortedEventIndex()  # cached_events order, updated incrementally
         self.live_summary_timer = None  # Timer for direct summary fetches for live American
         self._summary_fail_counts = {}   # {eid: consecutive_fail_count}
         self._dead_summary_eids = set()  # EIDs that failed 3+ times, skip for session
@@ -4527,9 +6296,12 @@ class SportsMonitor:
     def set_session(self, session):
         self.session = session
         self._start_ai_timer()  # Start AI timer when session is available
+        GLOBAL_XMLTV_INDEX.start_watch()
     def register_callback(self, func):
         if func not in self.callbacks:
             self.callbacks.append(func)
+            # Leagues that backed off to the 30-min idle interval come down to the UI cap
+            self.poll_scheduler.cap(time.time(), LeaguePollScheduler.UI_IDLE_CAP)
             # If this is the first UI listener, fetch votes immediately so
             # the screen doesn't have to wait up to 60 s for the timer tick.
             self.ensure_timer_state() # Ensure timer starts if it was idle
@@ -4970,6 +6742,9 @@ class SportsMonitor:
                     # Goal sound preference
                     self.goal_sound_file = data.get("goal_sound_file", "pop.mp3")
 
+                    # Remote XMLTV spool revalidation age
+                    self.xmltv_max_age_hours = int(data.get("xmltv_max_age_hours", XMLTV_SPOOL_MAX_AGE_HOURS))
+
                     # FIX: Ensure timer state is set correctly (handles active and reminders)
                     try:
                         self.ensure_timer_state()
@@ -4994,6 +6769,7 @@ class SportsMonitor:
         self.favorite_teams = []
         self.fav_notified = set()
         self.goal_sound_file = "pop.mp3"
+        self.xmltv_max_age_hours = XMLTV_SPOOL_MAX_AGE_HOURS
         self.saved_custom_league_indices = []
         self.favorite_league_indices = []
         self.is_favorite_mode = False
@@ -5056,6 +6832,7 @@ class SportsMonitor:
             },
             "favorite_teams": self.favorite_teams[:10],  # enforce max 10
             "goal_sound_file": self.goal_sound_file,
+            "xmltv_max_age_hours": getattr(self, "xmltv_max_age_hours", XMLTV_SPOOL_MAX_AGE_HOURS),
         }
         try:
             with open(CONFIG_FILE, "w") as f: json.dump(data, f)
@@ -5254,23 +7031,13 @@ class SportsMonitor:
             if url in self.active_requests: continue
 
             self.active_requests.add(url)
-            d = self.agent.request(b'GET', url.encode('utf-8'))
-            d.addCallback(readBody)
+            d = self.summaries.fetch_json(eid, url)
             d.addCallback(self._on_summary_resolved, eid, bet)
             d.addErrback(lambda x: log_dbg("Referee error for {}: {}".format(eid, x)))
             d.addBoth(lambda x, u=url: self.active_requests.discard(u))
 
-    def _on_summary_resolved(self, body, eid, bet):
+    def _on_summary_resolved(self, data, eid, bet):
         try:
-            # ESPN may return gzip-compressed responses
-            if body[:2] == b'\x1f\x8b':
-                import gzip
-                try:
-                    body = gzip.decompress(body)
-                except Exception:
-                    import io
-                    body = gzip.GzipFile(fileobj=io.BytesIO(body)).read()
-            data = json.loads(body)
             header = data.get('header', {})
             comps = header.get('competitions', [{}])
             if not comps: return
@@ -5308,7 +7075,7 @@ class SportsMonitor:
                 # (summary body carries the final status shortDetail)
                 is_pk_decided = False
                 try:
-                    summary_comps = body.get('header', {}).get('competitions', [{}])
+                    summary_comps = data.get('header', {}).get('competitions', [{}])
                     pk_detail = (summary_comps[0].get('status', {})
                                                .get('type', {})
                                                .get('shortDetail', '')).lower()
@@ -5511,7 +7278,10 @@ class SportsMonitor:
         # Flush stale cache — we're looking at a different day now
         self.cached_events    = []
         self.event_map        = {}
-        self.match_snapshots  = {}
+        self.event_index.clear()
+        self.match_snapshots.reset()
+        self.http_validators.clear()
+        self.poll_scheduler.reset()
         self.status_message   = "Loading..."
         self._trigger_callbacks(False)      # show loading state immediately
         self.check_goals(from_ui=True)      # fire the dated request right away
@@ -5533,6 +7303,10 @@ class SportsMonitor:
         if self.batch_timer.isActive():
             self.batch_timer.stop()
 
+        # Results of bodies still on the worker thread are discarded on arrival
+        self._process_generation += 1
+        self._pending_normalise = 0
+        self._finalize_waiting = False
         self.processing_queue = []
         if hasattr(self, 'lazy_processor') and self.lazy_processor and self.lazy_processor.active():
             try:
@@ -5554,6 +7328,15 @@ class SportsMonitor:
             self.active_deferreds.remove(d)
         return result
 
+    def _read_conditional_body(self, response, name, fetch_url, league_url=None):
+        """readBody() replacement for scoreboard requests. Fires with the body,
+        or None when the server answered 304 / the body hash is unchanged."""
+        code = response.code
+        headers = response.headers
+        d = readBody(response)
+        d.addCallback(lambda body: self.http_validators.resolve(name, fetch_url, code, headers, body, league_url))
+        return d
+
     def _fire_batch_request(self, name, url):
         # Guard: if the batch is no longer active (cancelled because user moved to another day), abort!
         if not self.batch_is_active:
@@ -5571,7 +7354,8 @@ class SportsMonitor:
         fetch_url = self._build_dated_url(url)
         self.active_requests.add(url)
         try:
-            d = self.agent.request(b'GET', fetch_url.encode('utf-8'))
+            d = self.agent.request(b'GET', fetch_url.encode('utf-8'),
+                                   self.http_validators.request_headers(fetch_url))
         except Exception as e:
             log_dbg("[SportsMonitor] Request failed immediately: " + str(e))
             self.batch_remaining -= 1
@@ -5581,7 +7365,7 @@ class SportsMonitor:
             self.active_deferreds = []
         self.active_deferreds.append(d)
 
-        d.addCallback(readBody)
+        d.addCallback(self._read_conditional_body, name, fetch_url, url)
         d.addCallback(self.collect_batch_response_incremental, name, url)
         d.addErrback(self.collect_batch_error, url)
         d.addBoth(self._on_batch_request_finished, url, d)
@@ -5602,7 +7386,7 @@ class SportsMonitor:
         # FIX: Clear pending notifications immediately when toggling OFF
         # This prevents queued notifications from showing after disabling Goal Alert
         if self.discovery_mode == 0:
-            self.notification_queue = []
+            self.notification_queue.clear()
             self.notification_active = False
 
         self.ensure_timer_state()
@@ -5620,10 +7404,40 @@ class SportsMonitor:
         """Return timer interval in ms."""
         # UI is active or Background-Live: 30s
         if len(self.callbacks) > 0 or live_count > 0:
-            return 30000
+            interval = 30000
+        else:
+            # Idle background: 300s (5 mins)
+            interval = 300000
+
+        # Custom mode: wake up no later than the next league falls due
+        if self.is_custom_mode:
+            wait_ms = int(self._seconds_to_next_due(time.time()) * 1000)
+            interval = max(15000, min(interval, wait_ms))
+        return interval
+
+    def _seconds_to_next_due(self, now):
+        urls = [DATA_SOURCES[idx][1] for idx in self.custom_league_indices if idx < len(DATA_SOURCES)]
+        soonest = self.poll_scheduler.soonest(urls)
+        if soonest is None:
+            return 0
+        return max(0, soonest - now)
+
+    def _schedule_league(self, url, events):
+        """Give one league its own next-due time from its current events."""
+        if not self.is_custom_mode or not url:
+            return
+        interval = self.poll_scheduler.update(url, events, time.time(), ui_open=bool(self.callbacks))
+        log_diag("SCHEDULER: {} events={} next poll in {}s".format(url[-60:], len(events), interval))
 
-        # Idle background: 300s (5 mins)
-        return 300000
+    def _restart_poll_timer(self, live_count=0):
+        # FIX: Restart timer even if self.active is False, as long as UI is open or reminders exist
+        should_run = self.active or (len(self.reminders) > 0) or (len(self.callbacks) > 0)
+        if should_run:
+            new_interval = self._get_timer_interval(live_count)
+            log_diag("POLL_TIMER: Restarting timer in {}ms (active={} callbacks={} reminders={})".format(
+                new_interval, self.active, len(self.callbacks), len(self.reminders)))
+            self.timer.start(new_interval, False)
+            self._last_interval = new_interval
 
     def ensure_timer_state(self):
         # Timer should run if:
@@ -5683,6 +7497,8 @@ class SportsMonitor:
             self.current_league_index = index; self.last_scores = {}; self.last_red_cards = {}; self.last_states = {}; self.last_periods = {}; self.last_details_seen = {}; self.notified_events = set()
             # FIX: Clear cache to remove old events from previous selection
             self.event_map = {}; self.cached_events = []
+            self.event_index.clear()
+            self.http_validators.clear()
             self.save_config()
             # Restart timer with single-league interval (60s)
             if self.timer.isActive(): self.timer.start(self._get_timer_interval(), False)
@@ -5702,6 +7518,9 @@ class SportsMonitor:
 
         # FIX: Clear cache to remove old events from previous selection
         self.event_map = {}; self.cached_events = []
+        self.event_index.clear()
+        self.http_validators.clear()
+        self.poll_scheduler.reset()
         self.save_config()
         # Restart timer with custom-mode interval (180s)
         if self.timer.isActive(): self.timer.start(self._get_timer_interval(), False)
@@ -5720,11 +7539,15 @@ class SportsMonitor:
         self.batch_queue = []
         self.active_requests.clear()
         self.event_map = {}; self.cached_events = []
+        self.event_index.clear()
+        self.http_validators.clear()
+        self.poll_scheduler.reset()
         self.save_config()
         if self.timer.isActive(): self.timer.start(self._get_timer_interval(), False)
         self.check_goals()
-    def add_reminder(self, match_name, trigger_time, league_name, h_logo, a_logo, label, sref=None, h_id=None, a_id=None):
+    def add_reminder(self, match_name, trigger_time, league_name, h_logo, a_logo, label, sref=None, h_id=None, a_id=None, eid=None):
         new_rem = {"match": match_name, "trigger": trigger_time, "league": league_name, "h_logo": h_logo, "a_logo": a_logo, "label": label, "sref": sref}
+        if eid: new_rem["eid"] = eid
         for r in self.reminders:
             if r["match"] == match_name and r["trigger"] == trigger_time: return
 
@@ -5752,6 +7575,10 @@ class SportsMonitor:
         now = time.time(); active_reminders = []; reminders_triggered = False
         for rem in self.reminders:
             if now >= rem["trigger"]:
+                if not rem.get("sref") and rem.get("eid"):
+                    # Precomputed "where to watch" turns a plain reminder into a zap alert
+                    sref, _ch = self.where_to_watch.best_channel(rem["eid"])
+                    if sref: rem = dict(rem, sref=sref)
                 if rem.get("sref"):
                     # Interactive Zap Reminder
                     self.trigger_zap_alert(rem)
@@ -5871,7 +7698,8 @@ class SportsMonitor:
                     rem.get("h_logo", ""),
                     rem.get("a_logo", ""),
                     rem.get("sref"),
-                    timeout_seconds=30
+                    timeout_seconds=30,
+                    channel_name=GLOBAL_SERVICE_SNAPSHOT.name_for(rem.get("sref")) or ""
                 )
 
             reactor.callLater(0, _open_zap)
@@ -6054,11 +7882,12 @@ class SportsMonitor:
                     self.cancel_active_requests()
                     fetch_url = self._build_dated_url(url)
                     self.active_requests.add(url)
-                    d = self.agent.request(b'GET', fetch_url.encode('utf-8'))
+                    d = self.agent.request(b'GET', fetch_url.encode('utf-8'),
+                                           self.http_validators.request_headers(fetch_url))
                     if not hasattr(self, 'active_deferreds'):
                         self.active_deferreds = []
                     self.active_deferreds.append(d)
-                    d.addCallback(readBody)
+                    d.addCallback(self._read_conditional_body, name, fetch_url, url)
                     d.addCallback(self.parse_single_json, name, url)
                     d.addErrback(self.handle_error)
                     d.addBoth(self._on_single_request_finished, url, d)
@@ -6073,15 +7902,29 @@ class SportsMonitor:
                 self._trigger_callbacks(True)
                 return
 
+            # PER-LEAGUE SCHEDULING: only re-fetch leagues whose own interval elapsed.
+            # A UI request (manual refresh, screen opening) fetches every league.
+            selected_indices = [idx for idx in self.custom_league_indices if idx < len(DATA_SOURCES)]
+            now = time.time()
+            if from_ui:
+                due_indices = selected_indices
+            else:
+                due_indices = [idx for idx in selected_indices
+                               if self.poll_scheduler.is_due(DATA_SOURCES[idx][1], now)]
+            if not due_indices:
+                log_diag("CHECK_GOALS: CUSTOM MODE - 0/{} leagues due, next in {}s".format(
+                    len(selected_indices), int(self._seconds_to_next_due(now))))
+                self._restart_poll_timer()
+                return
             # Cancel previous active requests before starting a new batch
             self.cancel_active_requests()
 
             # Mark batch as active
             self.batch_is_active = True
             self.batch_queue = []
-            selected_indices = [idx for idx in self.custom_league_indices if idx < len(DATA_SOURCES)]
-            self.batch_remaining = len(selected_indices)
-            log_diag("CHECK_GOALS: CUSTOM MODE - Starting batch for {} leagues".format(len(selected_indices)))
+            self.batch_remaining = len(due_indices)
+            log_diag("CHECK_GOALS: CUSTOM MODE - Starting batch for {}/{} due leagues".format(
+                len(due_indices), len(selected_indices)))
 
             # 10-second safety timer
             self.batch_timer.start(10000, True)
@@ -6089,27 +7932,27 @@ class SportsMonitor:
 
             fired = 0
             delay = 0.0
-            for idx in selected_indices:
+            for idx in due_indices:
                 name, url = DATA_SOURCES[idx]
                 reactor.callLater(delay, self._fire_batch_request, name, url)
                 delay += 0.1  # Stagger requests by 100ms
                 fired += 1
             log_diag("CHECK_GOALS: CUSTOM MODE - Queued {} staggered requests (10s timeout), batch_remaining={}".format(fired, self.batch_remaining))
 
-    def _save_cache_bg(self):
+    def _save_cache_bg(self, data):
         try:
             cache_dir = os.path.dirname(self.cache_file)
             if not os.path.exists(cache_dir):
                 os.makedirs(cache_dir)
 
-            # Take a shallow copy of the list to prevent mid-iteration modification
-            events_copy = list(self.cached_events)
-            data = {
-                'timestamp': self.last_update,
-                'events': events_copy
-            }
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f)
+            # Atomic replace: a crash or power cut mid-write never leaves a
+            # truncated cache.json behind for the next boot
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.rename(tmp_file, self.cache_file)
         except Exception as e:
             print("[SportsMonitor] Cache Save BG Error: ", e)
 
@@ -6120,8 +7963,20 @@ class SportsMonitor:
 
         self.last_cache_save = time.time()
 
+        # Snapshot rows are taken here on the reactor thread, where snapshots
+        # are updated, so the writer thread never sees one half-changed
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'timestamp': self.last_update,
+            'day': datetime.date.today().isoformat(),
+            'fields': list(MatchSnapshot._FIELDS),
+            'events': list(self.cached_events),
+            'snapshots': dict((k, v.to_row()) for k, v in self.match_snapshots.items()
+                              if isinstance(v, MatchSnapshot)),
+        }
+
         import threading
-        t = threading.Thread(target=self._save_cache_bg)
+        t = threading.Thread(target=self._save_cache_bg, args=(data,))
         t.daemon = True
         t.start()
 
@@ -6132,22 +7987,53 @@ class SportsMonitor:
                     data = json.load(f)
                     self.last_update = data.get('timestamp', 0)
                     events = data.get('events', [])
+                    current = (data.get('version') == CACHE_FORMAT_VERSION and
+                               data.get('fields') == list(MatchSnapshot._FIELDS))
                     # Quick validation
                     if isinstance(events, list):
                         self.cached_events = events
-                        self.match_snapshots = {}
+                        self.match_snapshots.reset()
                         self.event_map = {}
-                        for ev in self.cached_events:
+                        for i, ev in enumerate(self.cached_events):
+                            # Legacy caches (no version) hold full, unpruned events
+                            if not current:
+                                ev = self.cached_events[i] = prune_raw_event(ev)
                             eid = ev.get('id')
                             if eid:
-                                str_eid = str(eid)
-                                self.match_snapshots[str_eid] = build_match_snapshot(ev)
-                                self.event_map[str_eid] = ev
+                                self.event_map[str(eid)] = ev
+                        restored = 0
+                        if current:
+                            restored = self.match_snapshots.restore(
+                                self.event_map, data.get('snapshots') or {}, data.get('day'))
+                        self.event_index.rebuild(self.event_map)
+                        self.cached_events = self.event_index.view()
+                        # Builds only what the cache could not supply
+                        rebuilt, _ = self.match_snapshots.sync(self.event_map)
+                        log_diag("CACHE_LOAD: v{} events={} restored={} rebuilt={}".format(
+                            data.get('version', 1), len(self.event_map), restored, rebuilt))
                         self.status_message = "Restored from Cache"
         except Exception as e:
              print("[SportsMonitor] Cache Load Error: ", e)
              self.cached_events = []
 
+    def log_snapshot_memory(self, on_done=None):
+        """DIAG (on demand, settings menu): snapshot footprint, legacy dict vs
+        MatchSnapshot, for the current match day. Runs on a worker thread;
+        on_done(report or None) is called back on the reactor."""
+        events = list(self.cached_events)
+
+        def _done(r):
+            if isinstance(r, dict):
+                log_diag("SNAPSHOT_MEM: events={} dict={}KB slots={}KB saved={:.1f}%".format(
+                    r['events'], r['dict_bytes'] // 1024, r['slot_bytes'] // 1024, r['saved_pct']))
+            else:
+                log_diag("SNAPSHOT_MEM: report failed: {}".format(r))
+                r = None
+            if on_done:
+                on_done(r)
+            return None
+        threads.deferToThread(snapshot_memory_report, events).addBoth(_done)
+
     def collect_batch_error(self, failure, url=None):
         """Handle request errors - only fires for network/timeout failures"""
         if not self.batch_is_active:
@@ -6180,11 +8066,16 @@ class SportsMonitor:
 
             self.active_requests.discard(url)
 
-            # Process data incrementally immediately!
-            try:
-                self.process_events_data([(body, name, url)], append_mode=True)
-            except Exception as e:
-                log_diag("BATCH_RESPONSE: ERROR processing '{}': {}".format(name, e))
+            # Process data incrementally immediately! (None = unchanged since last poll)
+            if body is not None:
+                try:
+                    self.process_events_data([(body, name, url)], append_mode=True)
+                except Exception as e:
+                    log_diag("BATCH_RESPONSE: ERROR processing '{}': {}".format(name, e))
+            else:
+                # Unchanged: reschedule from the events we already hold
+                self._schedule_league(url, [ev for ev in self.event_map.values()
+                                            if ev.get('league_url') == url])
 
             self.batch_remaining -= 1
             log_diag("BATCH_RESPONSE: '{}' remaining={}".format(name, self.batch_remaining))
@@ -6203,6 +8094,19 @@ class SportsMonitor:
         if not self.batch_is_active:
             return
 
+        # Bodies may still be on the worker thread or in the merge queue;
+        # finalizing now would sync/evaluate a half-merged event_map.
+        if not self._processing_idle():
+            now = time.time()
+            if not self._finalize_waiting:
+                self._finalize_waiting = True
+                self._finalize_wait_start = now
+            if now - self._finalize_wait_start < 10:
+                self.batch_timer.start(2000, True)
+                return
+            log_diag("FINALIZE_BATCH: processing still busy after 10s, finalizing anyway")
+        self._finalize_waiting = False
+
         # Mark as inactive immediately to prevent double-firing
         self.batch_is_active = False
 
@@ -6224,23 +8128,19 @@ class SportsMonitor:
 
         self.save_cache()
 
-        # FINAL REBUILD: One full snapshot rebuild after all batch responses
-        self.match_snapshots = {}
-        for ev in self.cached_events:
-            eid = ev.get('id')
-            if eid:
-                self.match_snapshots[str(eid)] = build_match_snapshot(ev)
-
-        # Remove stale snapshot keys for reaped events
-        stale_keys = [k for k in self.match_snapshots if k not in self.event_map]
-        for k in stale_keys:
-            del self.match_snapshots[k]
+        # FINAL SYNC: rebuild only snapshots dirtied during this batch,
+        # drop reaped events and keep the rest untouched
+        rebuilt, reused = self.match_snapshots.sync(self.event_map)
 
-        log_dbg("FINALIZE_BATCH: Final snapshot rebuild -- {} snapshots".format(len(self.match_snapshots)))
+        log_dbg("FINALIZE_BATCH: Snapshot sync -- rebuilt={} reused={} total={}".format(
+            rebuilt, reused, len(self.match_snapshots)))
 
         # Evaluate goals ONCE after all batch data is complete
         self.evaluate_goals()
 
+        # Channel discovery for upcoming/live fixtures, in the background
+        self.where_to_watch.schedule(self.match_snapshots)
+
         log_diag("FINALIZE_BATCH: DONE cached_events={}".format(len(self.cached_events)))
 
         # Determine live_count for timer interval
@@ -6261,13 +8161,7 @@ class SportsMonitor:
                             live_count += 1
                 except: pass
 
-        # FIX: Restart timer even if self.active is False, as long as UI is open or reminders exist
-        should_run = self.active or (len(self.reminders) > 0) or (len(self.callbacks) > 0)
-        if should_run:
-            new_interval = self._get_timer_interval(live_count)
-            log_diag("FINALIZE_BATCH: Restarting timer in {}ms (active={} callbacks={} reminders={})".format(
-                new_interval, self.active, len(self.callbacks), len(self.reminders)))
-            self.timer.start(new_interval, False)
+        self._restart_poll_timer(live_count)
 
         # Ensure direct summary fetches are active if live matches exist
         if live_count > 0:
@@ -6299,7 +8193,7 @@ class SportsMonitor:
 
                 summary_url = "https://cdn.espn.com/core/{}/{}/boxscore?xhr=1&gameId={}".format(
                     sport, league_slug, eid)
-                d = getPage(summary_url.encode('utf-8'))
+                d = self.summaries.fetch_json(eid, summary_url)
                 d.addCallback(self.on_live_summary, str(eid))
                 d.addErrback(self._on_summary_error, str(eid))
                 live_found += 1
@@ -6310,6 +8204,9 @@ class SportsMonitor:
         if self.live_summary_timer and self.live_summary_timer.active():
             self.live_summary_timer.cancel()
         if live_found > 0:
+            st = self.summaries.stats()
+            log_diag("SUMMARY_FETCH: live={} requests={} joined={} cache_hits={} parses={} inflight={}".format(
+                live_found, st['requests'], st['joined'], st['cache_hits'], st['parses'], st['inflight']))
             self.live_summary_timer = reactor.callLater(30, self.fetch_live_summaries)
         else:
             self.live_summary_timer = None
@@ -6323,11 +8220,11 @@ class SportsMonitor:
         else:
             log_diag("on_live_summary FETCH_ERR eid={} attempt={} {}".format(eid, count, str(failure)[:80]))
 
-    def on_live_summary(self, body, eid):
-        """Parse the summary API response and patch fresh score/status into event_map."""
+    def on_live_summary(self, data, eid):
+        """Patch fresh score/status from the (shared, already parsed) summary into event_map.
+        The summary is shared with other consumers: only copies of its dicts are stored."""
         self._summary_fail_counts.pop(eid, None)
         try:
-            data = json.loads(body)
             # Summary API structure: header.competitions[0].competitors[].score
             # and header.competitions[0].status  -- same as what GameInfo's parse_details reads
             header = data.get('header', {})
@@ -6340,6 +8237,7 @@ class SportsMonitor:
             ev = self.event_map.get(eid)
             if not ev: return
 
+            changed = False
             # Patch scores onto the existing event's competitor entries (preserves logos, names, etc.)
             ev_competitors = ev.get('competitions', [{}])[0].get('competitors', [])
             for nc in new_competitors:
@@ -6348,14 +8246,18 @@ class SportsMonitor:
                 if ha and score is not None:
                     for ec in ev_competitors:
                         if ec.get('homeAway') == ha:
-                            ec['score'] = score
+                            if ec.get('score') != score:
+                                ec['score'] = score
+                                changed = True
                             break
 
             # Patch status (clock, period, state)
-            if new_status:
+            if new_status and new_status != ev.get('status'):
+                new_status = copy.deepcopy(new_status)
                 ev['status'] = new_status
                 if ev.get('competitions'):
                     ev['competitions'][0]['status'] = new_status
+                changed = True
 
             # Patch venue from summary into competitions[0] so build_match_snapshot
             # can resolve the WC host-city flag. The scoreboard API never includes
@@ -6366,17 +8268,20 @@ class SportsMonitor:
             if not summary_venue:
                 # Fallback: some ESPN endpoints nest it directly under the boxscore game node
                 summary_venue = data.get('boxscore', {}).get('venue', {})
-            if summary_venue and ev.get('competitions'):
-                ev['competitions'][0]['venue'] = summary_venue
+            if (summary_venue and ev.get('competitions')
+                    and ev['competitions'][0].get('venue') != summary_venue):
+                ev['competitions'][0]['venue'] = copy.deepcopy(summary_venue)
+                changed = True
+
+            if not changed:
+                return   # same data as 30 s ago: keep the snapshot (and its cached rows)
 
             # Rebuild snapshot so main screen and mini bars read fresh data
             self.match_snapshots[eid] = build_match_snapshot(ev)
 
-            # Update cached_events entry reference
-            for i, ce in enumerate(self.cached_events):
-                if str(ce.get('id', '')) == eid:
-                    self.cached_events[i] = ev
-                    break
+            # Status may have moved: reposition it in the index and republish
+            self.event_index.upsert(eid, ev)
+            self.cached_events = self.event_index.view()
             # Trigger notification evaluator immediately on live score changes
             self._debounced_evaluate_goals()
 
@@ -6438,7 +8343,8 @@ class SportsMonitor:
 
     @profile_function("SportsMonitor")
     def parse_single_json(self, body, league_name_fixed="", league_url=""):
-        self.process_events_data([(body, league_name_fixed, league_url)], append_mode=False)
+        if body is not None:
+            self.process_events_data([(body, league_name_fixed, league_url)], append_mode=False)
         reactor.callLater(0.5, self.fetch_live_summaries)
 
     # ==========================================================================
@@ -7053,28 +8959,20 @@ class SportsMonitor:
         snap = self.match_snapshots.get(match_id)
         if not snap: return
 
-        sport_type = snap['sport_type']
-        league_url = snap.get('league_url', '').lower()
-        is_basketball = '/basketball/' in league_url or 'euroleague' in league_url
-        is_soccer = '/soccer/' in league_url
+        sport = _notification_sport(snap.get('league_url', ''))
         notification = (match_id, score, scorer, event_type, scoring_team, sound_type)
 
-        # BASKETBALL MERGE: If same basketball match already in queue, merge scorer text
-        if is_basketball and event_type == 'goal':
-            for i, existing in enumerate(self.notification_queue):
-                ex_match_id = existing[0]
-                ex_event_type = existing[3]
-                if ex_match_id == match_id and ex_event_type == 'goal':
-                    # Merge: append new scorer text to existing
-                    merged_scorer = u"{}  |  {}".format(existing[2], scorer)
-                    # Update score to latest and merge scorer
-                    self.notification_queue[i] = (
-                        match_id, score, merged_scorer,
-                        existing[3], existing[4], existing[5]
-                    )
-                    return  # Merged, no new entry needed
-
-            # LIVE UPDATE: If current active toast is for the same basketball match, update it
+        # MERGE: a queued toast for the same match takes the newer score and
+        # appends the scorer text (basketball by default, see NOTIFY_MERGE_WINDOWS)
+        window = NOTIFY_MERGE_WINDOWS.get(sport, 0)
+        if window and event_type == 'goal':
+            def _combine(existing, new):
+                return (existing[0], new[1], u"{}  |  {}".format(existing[2], new[2]),
+                        existing[3], existing[4], existing[5])
+            if self.notification_queue.merge(notification, window, _combine):
+                return  # Merged, no new entry needed
+
+            # LIVE UPDATE: If current active toast is for the same match, update it
             if self.notification_active and self.current_toast and self.current_toast_match == match_id:
                 try:
                     old_scorer = self.current_toast["scorer"].getText()
@@ -7087,37 +8985,26 @@ class SportsMonitor:
                 except: pass
                 return  # Updated live, no new entry needed
 
-        # DEDUP: Prevent identical notifications
-        dedup_key = (match_id, score, event_type)
-        for existing in self.notification_queue:
-            existing_key = (existing[0], existing[1], existing[3])
-            if existing_key == dedup_key:
-                return
-
-        # PRIORITY: Soccer first, others after (FIFO within each tier)
-        if is_soccer:
-            # Insert after any existing soccer entries but before non-soccer
-            insert_pos = 0
-            for i, existing in enumerate(self.notification_queue):
-                ex_snap = self.match_snapshots.get(str(existing[0]))
-                if ex_snap and '/soccer/' in ex_snap.get('league_url', '').lower():
-                    insert_pos = i + 1
-                else:
-                    break
-            self.notification_queue.insert(insert_pos, notification)
-        else:
-            self.notification_queue.append(notification)
+        # PRIORITY: Soccer first, others after (FIFO within each tier).
+        # Identical (match, score, event) toasts already queued are dropped.
+        tier = NOTIFY_TIER_SOCCER if sport == 'soccer' else NOTIFY_TIER_OTHER
+        if not self.notification_queue.push(notification, tier):
+            return
 
         self.process_queue()
 
     def process_queue(self):
         if self.discovery_mode == 0:
-            self.notification_queue = []
+            self.notification_queue.clear()
             return
         if self.notification_active or not self.notification_queue: return
 
         try:
-            item = self.notification_queue.pop(0)
+            item, queued_ts = self.notification_queue.pop()
+            st = self.notification_queue.stats()
+            log_diag("NOTIFY_QUEUE: depth={} max_depth={} waited={:.1f}s avg={:.1f}s max={:.1f}s merged={} deduped={}".format(
+                st['depth'], st['max_depth'], time.time() - queued_ts, st['avg_latency'],
+                st['max_latency'], st['merged'], st['deduped']))
             # Simplified item: (match_id, score, scorer, event_type, scoring_team, sound_type)
             match_id, score, scorer, event_type, scoring_team, sound_type = item[:6]
             self.notification_active = True
@@ -7140,7 +9027,7 @@ class SportsMonitor:
                         except Exception as e:
                             print("[SimplySport] Error opening GoalToast: {}".format(e))
                             # RE-QUEUE: Don't lose notification on screen stack error
-                            self.notification_queue.insert(0, item)
+                            self.notification_queue.requeue(item, queued_ts)
                             self.notification_active = False
                             self.current_toast = None
                             reactor.callLater(2, self.process_queue)
@@ -7148,20 +9035,20 @@ class SportsMonitor:
                     reactor.callLater(0, _open_toast)
                 except Exception as e:
                     print("[SimplySport] Error setting up notification thread: {}".format(e))
-                    self.notification_queue.insert(0, item)
+                    self.notification_queue.requeue(item, queued_ts)
                     self.notification_active = False
                     self.current_toast = None
                     reactor.callLater(2, self.process_queue)
             else:
                 # No session yet - wait and retry
-                self.notification_queue.insert(0, item)
+                self.notification_queue.requeue(item, queued_ts)
                 self.notification_active = False
                 self.current_toast = None
                 reactor.callLater(5, self.process_queue)
         except Exception as e:
             print("[SimplySport] Critical error in process_queue: {}".format(e))
-            if 'item' in locals():
-                self.notification_queue.insert(0, item)
+            if 'item' in locals() and item is not None:
+                self.notification_queue.requeue(item, queued_ts)
             self.notification_active = False
             self.current_toast = None
             reactor.callLater(2, self.process_queue)
@@ -7247,9 +9134,8 @@ class SportsMonitor:
             if not summary_url:
                 return callback(None)
 
-            def on_summary_success(body):
+            def on_summary_success(data):
                 try:
-                    data = json.loads(body.decode('utf-8', errors='ignore'))
                     header = data.get('header', {})
                     competitions = header.get('competitions', [])
                     if not competitions:
@@ -7298,7 +9184,8 @@ class SportsMonitor:
                     print("[SimplySport] fetch_summary_for_scorer error parsing:", e)
                     return callback(None)
 
-            getPage(summary_url.encode('utf-8')).addCallback(on_summary_success).addErrback(lambda err: callback(None))
+            # max_age=0: a cached body may predate this goal, but an in-flight request is shared
+            self.summaries.fetch_json(event_id, summary_url, max_age=0).addCallback(on_summary_success).addErrback(lambda err: callback(None))
         except Exception as e:
             print("[SimplySport] fetch_summary_for_scorer error:", e)
             return callback(None)
@@ -7429,45 +9316,21 @@ class SportsMonitor:
         return score
 
 
-    def prefetch_logo(self, url, team_id):
+    def prefetch_logo(self, url, team_id, priority=LOGO_PRIO_PREFETCH):
         """Pre-download logo to cache using team ID naming (like GameInfoScreen)"""
         if not url or not team_id: return
         if team_id in self.logo_path_cache: return # Skip disk check if already cached in memory
-        if team_id in self.pending_logos: return # Skip if already downloading
-
-        try:
-            cache_dir = "/tmp/simplysports/logos/"
-            if not os.path.exists(cache_dir):
-                try: os.makedirs(cache_dir)
-                except: pass
-
-            target_path = cache_dir + str(team_id) + ".png"
 
-            # Download only if missing or empty
-            if not os.path.exists(target_path) or os.path.getsize(target_path) == 0:
-                self.pending_logos.add(team_id)
-
-                def on_download_success(data):
-                    if data:
-                        with open(target_path, 'wb') as f: f.write(data)
-                        self.logo_path_cache[team_id] = target_path # Register globally
-                        self.missing_logo_cache.discard(team_id)
-                        GLOBAL_VALID_LOGO_PATHS.add(target_path)
-                    self.pending_logos.discard(team_id)
-                    return data
+        cached = GLOBAL_LOGO_INDEX.lookup(team_id)
+        if cached:
+            self.logo_path_cache[team_id] = cached # Register globally so subsequent calls skip the index
+            return
+        target_path = logo_cache_dir() + "/" + str(team_id) + ".png"
+        GLOBAL_LOGO_DOWNLOADER.request(url, team_id, target_path, priority, self._on_logo_ready)
 
-                def on_download_error(err):
-                    self.pending_logos.discard(team_id)
-                    return None
-
-                self.agent.request(b'GET', url.encode('utf-8')) \
-                    .addCallback(readBody) \
-                    .addCallback(on_download_success) \
-                    .addErrback(on_download_error)
-            else:
-                self.logo_path_cache[team_id] = target_path # Register globally so subsequent calls skip os.path.exists
-        except:
-            self.pending_logos.discard(team_id)
+    def _on_logo_ready(self, team_id, path):
+        self.logo_path_cache[team_id] = path # Register globally
+        self.missing_logo_cache.discard(team_id)
 
     def prefetch_favorite_logos(self):
         """Pre-download logos for all saved favourite teams into the logo cache."""
@@ -7946,24 +9809,262 @@ class SportsMonitor:
                                     match_id, score_fmt, "GOAL DISALLOWED",
                                     event_type="goal_disallowed")
 
-                        if var_count > prev_detail_counts['var']:
-                            dedup_key = (match_id, 'var_{}'.format(var_count))
-                            if dedup_key not in self.notified_events:
-                                self.notified_events.add(dedup_key)
-                                self.queue_notification(
-                                    match_id, score_fmt, var_last_text,
-                                    event_type="var_decision")
+                        if var_count > prev_detail_counts['var']:
+                            dedup_key = (match_id, 'var_{}'.format(var_count))
+                            if dedup_key not in self.notified_events:
+                                self.notified_events.add(dedup_key)
+                                self.queue_notification(
+                                    match_id, score_fmt, var_last_text,
+                                    event_type="var_decision")
+
+                        self.last_details_seen[match_id] = {
+                            'disallowed': disallowed_count,
+                            'var':        var_count
+                        }
+        except Exception as e:
+            print("[SimplySport] Error in evaluate_goals: {}".format(e))
+
+    def process_events_data(self, data_list, single_league_name="", append_mode=False):
+        """Decode and normalise the bodies on a worker thread; the reactor
+        thread only merges the finished events into event_map."""
+        generation = self._process_generation
+        self._pending_normalise += 1
+        d = threads.deferToThread(self._normalise_bodies, data_list, single_league_name)
+        d.addCallback(self._on_bodies_normalised, generation, append_mode)
+        d.addErrback(self._on_normalise_error, generation)
+
+    def _on_bodies_normalised(self, results, generation, append_mode):
+        if generation != self._process_generation:
+            return  # cancelled (day/league changed) while the worker was busy
+        self._pending_normalise -= 1
+        self.processing_queue.append((results, append_mode))
+        self.ensure_processing_active()
+
+    def _on_normalise_error(self, failure, generation):
+        if generation != self._process_generation:
+            return
+        self._pending_normalise -= 1
+        log_diag("NORMALISE: worker failed: {}".format(str(failure)[:200]))
+        self._maybe_resume_finalize()
+
+    def _processing_idle(self):
+        return (self._pending_normalise <= 0 and not self.processing_active
+                and not self.processing_queue)
+
+    def _maybe_resume_finalize(self):
+        """Run a finalize_batch() that was waiting for worker/merge stages."""
+        if self._finalize_waiting and self._processing_idle():
+            self.finalize_batch()
+
+    def _normalise_bodies(self, data_list, single_league_name=""):
+        """
+        WORKER THREAD: decode each scoreboard body, flatten tennis draws,
+        construct logo URLs/IDs and build a snapshot per event.
+        Must not touch Twisted or mutate monitor state; returns one dict per
+        league: {'name', 'url', 'events': [(eid, event, snapshot)], 'logos': [(url, id)]}.
+        """
+        results = []
+        for item in data_list:
+            if isinstance(item, tuple): body, l_name, l_url = item
+            else: body, l_name, l_url = item, single_league_name, ""
+            try:
+                data = parse_scoreboard(body.decode('utf-8', errors='ignore'))
+                _leagues_list = data.get('leagues') or [{}]
+                league_obj = _leagues_list[0]
+                _league_logos = league_obj.get('logos') or [{}]
+                cur_l_logo = _league_logos[0].get('href', '') if _league_logos else ''
+                cur_l_id = str(league_obj.get('id', ''))
+                if l_name: league_name = l_name
+                else: league_name = league_obj.get('name') or league_obj.get('shortName') or ""
+                sport_type = get_sport_type(l_url)
+
+                out_events = []
+                prefetch = []
+                for ev in data.get('events', []):
+                    ev['league_name'] = league_name
+                    ev['league_url'] = l_url
+
+                    if sport_type == SPORT_TYPE_TENNIS:
+                        current_batch = self._extract_tennis_matches(ev, league_name, l_url)
+                    else:
+                        current_batch = [ev]
+
+                    for processed_ev in current_batch:
+                        eid = processed_ev.get('id')
+                        if not eid: continue
+                        self._normalise_event_logos(processed_ev, cur_l_logo, cur_l_id, prefetch)
+                        processed_ev = prune_raw_event(processed_ev)
+                        out_events.append((str(eid), processed_ev, build_match_snapshot(processed_ev)))
+
+                results.append({'name': league_name, 'url': l_url,
+                                'events': out_events, 'logos': prefetch})
+            except Exception as _proc_e:
+                log_dbg("[process_events_data] Skipped league '{}' ({}) due to error: {}".format(
+                    l_name or '?', l_url or '?', _proc_e))
+        return results
+
+    def _event_changed(self, old_ev, processed_ev):
+        """Compare fresh scoreboard data with the stored event."""
+        is_changed = True
+        if old_ev:
+            # Status & Meta comparison
+            old_status = old_ev.get('status', {})
+            new_status = processed_ev.get('status', {})
+
+            old_type = old_status.get('type', {})
+            new_type = new_status.get('type', {})
+
+            # 1. Check basic state (pre, in, post)
+            if old_type.get('state') != new_type.get('state'):
+                is_changed = True
+            # 2. Check Detailed status (PPD, Suspended, etc)
+            elif old_type.get('name') != new_type.get('name'):
+                is_changed = True
+            # 3. Check Clock and Period (IMPORTANT for real-time updates)
+            elif old_status.get('displayClock') != new_status.get('displayClock'):
+                is_changed = True
+            elif old_status.get('period') != new_status.get('period'):
+                is_changed = True
+            # 4. Rescheduled kick-off
+            elif old_ev.get('date') != processed_ev.get('date'):
+                is_changed = True
+            else:
+                # 5. Check Competitors & Scores
+                old_comps = old_ev.get('competitions', [{}])[0].get('competitors', [])
+                new_comps = processed_ev.get('competitions', [{}])[0].get('competitors', [])
+
+                if len(old_comps) != len(new_comps):
+                    is_changed = True
+                else:
+                    scores_match = True
+                    for i in range(len(old_comps)):
+                        if old_comps[i].get('score') != new_comps[i].get('score'):
+                            scores_match = False; break
+                    # 6. Other snapshot inputs: red cards (details), stats,
+                    # tennis sets (linescores) and the status text
+                    if scores_match and _snapshot_extra_inputs(old_ev) != _snapshot_extra_inputs(processed_ev):
+                        scores_match = False
+                    if scores_match:
+                        is_changed = False
+                        # Special case for Racing: ALWAYS trigger UI refresh because they have no score tracking pre-race
+                        event_sport_type_early = get_sport_type(processed_ev.get('league_url', ''))
+                        if event_sport_type_early == SPORT_TYPE_RACING:
+                            is_changed = True
+        return is_changed
+
+    def _normalise_event_logos(self, processed_ev, cur_l_logo, cur_l_id, prefetch):
+        """Fill h/a/l logo URL + ID fields; appends (url, id, priority) to prefetch."""
+        # =====================================================
+        # LOGO URL/ID CONSTRUCTION - RUN FOR ALL EVENTS
+        # This ensures every event has logo data, not just changed ones
+        # =====================================================
+        comps = processed_ev.get('competitions', [{}])[0].get('competitors', [])
+        league_name = processed_ev.get('league_name', '')
+        league_url = processed_ev.get('league_url', '')
+        sport_cdn = self.get_cdn_sport_name(league_name)
+        is_live = processed_ev.get('status', {}).get('type', {}).get('state') == 'in'
+        prio = LOGO_PRIO_LIVE if is_live else LOGO_PRIO_PREFETCH
+        event_sport_type = get_sport_type(league_url)
+
+        # Skip logo construction for golf/combat (no team logos)
+        if len(comps) >= 2 and event_sport_type not in [SPORT_TYPE_GOLF, SPORT_TYPE_COMBAT]:
+            if event_sport_type == SPORT_TYPE_TENNIS:
+                # Fix: Tennis flags reversed. Force index 0=Home, 1=Away to match MiniBar
+                team_h = comps[0]
+                team_a = comps[1]
+            else:
+                team_h = next((t for t in comps if t.get('homeAway') == 'home'), None)
+                team_a = next((t for t in comps if t.get('homeAway') == 'away'), None)
+                if not team_h and len(comps) > 0: team_h = comps[0]
+                if not team_a and len(comps) > 1: team_a = comps[1]
 
-                        self.last_details_seen[match_id] = {
-                            'disallowed': disallowed_count,
-                            'var':        var_count
-                        }
-        except Exception as e:
-            print("[SimplySport] Error in evaluate_goals: {}".format(e))
+            h_id, h_logo = '', ''
+            a_id, a_logo = '', ''
 
-    def process_events_data(self, data_list, single_league_name="", append_mode=False):
-        self.processing_queue.append((data_list, single_league_name, append_mode))
-        self.ensure_processing_active()
+            if team_h:
+                if 'athlete' in team_h or event_sport_type == SPORT_TYPE_TENNIS:
+                    # Tennis/Individual: Robust flag extraction (singles + doubles)
+                    ath = team_h.get('athlete', {})
+                    h_id = ath.get('id', '')
+                    flag = ath.get('flag', {})
+                    h_logo = flag.get('href') or flag.get('alt') or ''
+                    if not h_logo and flag.get('iso2'):
+                        h_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(flag['iso2'].lower())
+                    # Doubles: try roster entries
+                    if not h_logo or not h_id:
+                        ros = team_h.get('roster', {})
+                        entries = ros.get('entries', [])
+                        if entries:
+                            p1 = entries[0].get('athlete', {})
+                            if not h_id: h_id = p1.get('id', '')
+                            if not h_logo:
+                                pf = p1.get('flag', {})
+                                h_logo = pf.get('href') or pf.get('alt') or ''
+                                if not h_logo and pf.get('iso2'):
+                                    h_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(pf['iso2'].lower())
+                    # Country fallback
+                    if not h_logo:
+                        country = team_h.get('country', {})
+                        if country.get('iso2'):
+                            h_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(country['iso2'].lower())
+                else:
+                    team_obj = team_h.get('team', {})
+                    h_id = team_obj.get('id', '')
+                    h_logo = team_obj.get('logo', '')
+                    if not h_logo and h_id:
+                        h_logo = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/{}/500/{}.png".format(sport_cdn, h_id)
+
+            if team_a:
+                if 'athlete' in team_a or event_sport_type == SPORT_TYPE_TENNIS:
+                    # Tennis/Individual: Robust flag extraction (singles + doubles)
+                    ath = team_a.get('athlete', {})
+                    a_id = ath.get('id', '')
+                    flag = ath.get('flag', {})
+                    a_logo = flag.get('href') or flag.get('alt') or ''
+                    if not a_logo and flag.get('iso2'):
+                        a_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(flag['iso2'].lower())
+                    # Doubles: try roster entries
+                    if not a_logo or not a_id:
+                        ros = team_a.get('roster', {})
+                        entries = ros.get('entries', [])
+                        if entries:
+                            p1 = entries[0].get('athlete', {})
+                            if not a_id: a_id = p1.get('id', '')
+                            if not a_logo:
+                                pf = p1.get('flag', {})
+                                a_logo = pf.get('href') or pf.get('alt') or ''
+                                if not a_logo and pf.get('iso2'):
+                                    a_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(pf['iso2'].lower())
+                    # Country fallback
+                    if not a_logo:
+                        country = team_a.get('country', {})
+                        if country.get('iso2'):
+                            a_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(country['iso2'].lower())
+                else:
+                    # FIX: Added missing else block for standard away teams
+                    team_obj = team_a.get('team', {})
+                    a_id = team_obj.get('id', '')
+                    a_logo = team_obj.get('logo', '')
+                    if not a_logo and a_id:
+                        a_logo = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/{}/500/{}.png".format(sport_cdn, a_id)
+
+            # Prefix logo IDs with unique sport name to prevent cross-sport collisions
+            sport_prefix = get_sport_id_prefix(league_url)
+            processed_ev['h_logo_id'] = sport_prefix + str(h_id) if h_id else ''
+            processed_ev['a_logo_id'] = sport_prefix + str(a_id) if a_id else ''
+
+            # Pre-fetch logos for all events (cache warmup)
+            if h_logo and h_id: prefetch.append((h_logo, processed_ev['h_logo_id'], prio))
+            if a_logo and a_id: prefetch.append((a_logo, processed_ev['a_logo_id'], prio))
+
+            processed_ev['h_logo_url'] = h_logo
+            processed_ev['a_logo_url'] = a_logo
+
+        # League Logo ALWAYS assigned (Fixes Racing/Individual sports missing logos)
+        processed_ev['l_logo_url'] = cur_l_logo
+        processed_ev['l_logo_id'] = "league_" + cur_l_id if cur_l_id else ''
+        if cur_l_logo and cur_l_id:
+            prefetch.append((cur_l_logo, processed_ev['l_logo_id'], prio))
 
     def ensure_processing_active(self):
         if self.processing_active:
@@ -7972,8 +10073,8 @@ class SportsMonitor:
             self.processing_active = False
             return
         self.processing_active = True
-        data_list, single_league_name, append_mode = self.processing_queue.pop(0)
-        self.lazy_gen = self._run_lazy_process_events_data(data_list, single_league_name, append_mode)
+        results, append_mode = self.processing_queue.pop(0)
+        self.lazy_gen = self._run_lazy_process_events_data(results, append_mode)
         self.do_lazy_process()
 
     def do_lazy_process(self):
@@ -7999,16 +10100,22 @@ class SportsMonitor:
                     pass
             
             self.ensure_processing_active()
+            self._maybe_resume_finalize()
         except Exception as e:
             print("[SimplySport] Error in background lazy UI sync:", e)
             self.lazy_processor = None
             self.processing_active = False
             self.ensure_processing_active()
+            self._maybe_resume_finalize()
 
-    def _run_lazy_process_events_data(self, data_list, single_league_name="", append_mode=False):
+    def _run_lazy_process_events_data(self, results, append_mode=False):
+        """REACTOR THREAD: merge normalised league results into event_map."""
         self.last_update = time.time()
 
-        # Optimization: Clear map if not appending (fresh load)
+        # Optimization: Clear map if not appending (fresh load).
+        # The previous map is kept for change detection so unchanged events
+        # keep their snapshots.
+        prev_map = self.event_map
         if not append_mode:
             self.event_map = {}
 
@@ -8016,274 +10123,88 @@ class SportsMonitor:
         has_changes = False
 
         try:
-            for item in data_list:
-                if isinstance(item, tuple): body, l_name, l_url = item
-                else: body, l_name, l_url = item, single_league_name, ""
+            for res in results:
+                league_name = res['name']
+                l_url = res['url']
                 try:
-                    json_str = body.decode('utf-8', errors='ignore')
-                    data = json.loads(json_str)
-                    _leagues_list = data.get('leagues') or [{}]
-                    league_obj = _leagues_list[0]
-                    _league_logos = league_obj.get('logos') or [{}]
-                    cur_l_logo = _league_logos[0].get('href', '') if _league_logos else ''
-                    cur_l_id = str(league_obj.get('id', ''))
-                    if l_name: league_name = l_name
-                    else: league_name = league_obj.get('name') or league_obj.get('shortName') or ""
-                    events = data.get('events', [])
                     league_seen_ids = set()
+                    for i, (eid_str, processed_ev, snap) in enumerate(res['events']):
+                        # Yield Enigma2 processor control every 50 merged events
+                        if i > 0 and i % 50 == 0: yield
 
-                    sport_type = get_sport_type(l_url)
-
-                    for i, ev in enumerate(events):
-                        # Yield Enigma2 processor control every 20 events
-                        if i > 0 and i % 20 == 0: yield
-
-                        ev['league_name'] = league_name
-                        ev['league_url'] = l_url
-
-                        current_batch = []
-                        if sport_type == SPORT_TYPE_TENNIS:
-                            current_batch = self._extract_tennis_matches(ev, league_name, l_url)
-                        else:
-                            current_batch = [ev]
-
-                        # Process batch and update map
-                        for processed_ev in current_batch:
-                            eid = processed_ev.get('id')
-                            if not eid: continue
+                        league_seen_ids.add(eid_str)
+                        is_changed = self._event_changed(prev_map.get(eid_str), processed_ev)
 
-                            eid_str = str(eid)
-                            league_seen_ids.add(eid_str)
-                            status_type_state = processed_ev.get('status', {}).get('type', {}).get('state', '')
-
-                            # Check for changes using fresh scoreboard data vs stored state
-                            old_ev = self.event_map.get(eid_str)
-
-                            is_changed = True
-                            if old_ev:
-                                # Status & Meta comparison
-                                old_status = old_ev.get('status', {})
-                                new_status = processed_ev.get('status', {})
-
-                                old_type = old_status.get('type', {})
-                                new_type = new_status.get('type', {})
-
-                                # 1. Check basic state (pre, in, post)
-                                if old_type.get('state') != new_type.get('state'):
-                                    is_changed = True
-                                # 2. Check Detailed status (PPD, Suspended, etc)
-                                elif old_type.get('name') != new_type.get('name'):
-                                    is_changed = True
-                                # 3. Check Clock and Period (IMPORTANT for real-time updates)
-                                elif old_status.get('displayClock') != new_status.get('displayClock'):
-                                    is_changed = True
-                                elif old_status.get('period') != new_status.get('period'):
-                                    is_changed = True
-                                else:
-                                    # 4. Check Competitors & Scores
-                                    old_comps = old_ev.get('competitions', [{}])[0].get('competitors', [])
-                                    new_comps = processed_ev.get('competitions', [{}])[0].get('competitors', [])
+                        self.event_map[eid_str] = processed_ev
+                        self.event_index.upsert(eid_str, processed_ev)
+                        if is_changed:
+                            changed_events.append(processed_ev)
+                            self.match_snapshots.put(eid_str, snap)
+                            has_changes = True
 
-                                    if len(old_comps) != len(new_comps):
-                                        is_changed = True
-                                    else:
-                                        scores_match = True
-                                        for i in range(len(old_comps)):
-                                            if old_comps[i].get('score') != new_comps[i].get('score'):
-                                                scores_match = False; break
-                                        if scores_match:
-                                            is_changed = False
-                                            # Special case for Racing: ALWAYS trigger UI refresh because they have no score tracking pre-race
-                                            event_sport_type_early = get_sport_type(processed_ev.get('league_url', ''))
-                                            if event_sport_type_early == SPORT_TYPE_RACING:
-                                                is_changed = True
-
-
-                            # =====================================================
-                            # LOGO URL/ID CONSTRUCTION - RUN FOR ALL EVENTS
-                            # This ensures every event has logo data, not just changed ones
-                            # =====================================================
-                            comps = processed_ev.get('competitions', [{}])[0].get('competitors', [])
-                            league_name = processed_ev.get('league_name', '')
-                            league_url = processed_ev.get('league_url', '')
-                            sport_cdn = self.get_cdn_sport_name(league_name)
-                            event_sport_type = get_sport_type(league_url)
-
-                            # Skip logo construction for golf/combat (no team logos)
-                            if len(comps) >= 2 and event_sport_type not in [SPORT_TYPE_GOLF, SPORT_TYPE_COMBAT]:
-                                if event_sport_type == SPORT_TYPE_TENNIS:
-                                    # Fix: Tennis flags reversed. Force index 0=Home, 1=Away to match MiniBar
-                                    team_h = comps[0]
-                                    team_a = comps[1]
-                                else:
-                                    team_h = next((t for t in comps if t.get('homeAway') == 'home'), None)
-                                    team_a = next((t for t in comps if t.get('homeAway') == 'away'), None)
-                                    if not team_h and len(comps) > 0: team_h = comps[0]
-                                    if not team_a and len(comps) > 1: team_a = comps[1]
-
-                                h_id, h_logo = '', ''
-                                a_id, a_logo = '', ''
-
-                                if team_h:
-                                    if 'athlete' in team_h or event_sport_type == SPORT_TYPE_TENNIS:
-                                        # Tennis/Individual: Robust flag extraction (singles + doubles)
-                                        ath = team_h.get('athlete', {})
-                                        h_id = ath.get('id', '')
-                                        flag = ath.get('flag', {})
-                                        h_logo = flag.get('href') or flag.get('alt') or ''
-                                        if not h_logo and flag.get('iso2'):
-                                            h_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(flag['iso2'].lower())
-                                        # Doubles: try roster entries
-                                        if not h_logo or not h_id:
-                                            ros = team_h.get('roster', {})
-                                            entries = ros.get('entries', [])
-                                            if entries:
-                                                p1 = entries[0].get('athlete', {})
-                                                if not h_id: h_id = p1.get('id', '')
-                                                if not h_logo:
-                                                    pf = p1.get('flag', {})
-                                                    h_logo = pf.get('href') or pf.get('alt') or ''
-                                                    if not h_logo and pf.get('iso2'):
-                                                        h_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(pf['iso2'].lower())
-                                        # Country fallback
-                                        if not h_logo:
-                                            country = team_h.get('country', {})
-                                            if country.get('iso2'):
-                                                h_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(country['iso2'].lower())
-                                    else:
-                                        team_obj = team_h.get('team', {})
-                                        h_id = team_obj.get('id', '')
-                                        h_logo = team_obj.get('logo', '')
-                                        if not h_logo and h_id:
-                                            h_logo = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/{}/500/{}.png".format(sport_cdn, h_id)
-
-                                if team_a:
-                                    if 'athlete' in team_a or event_sport_type == SPORT_TYPE_TENNIS:
-                                        # Tennis/Individual: Robust flag extraction (singles + doubles)
-                                        ath = team_a.get('athlete', {})
-                                        a_id = ath.get('id', '')
-                                        flag = ath.get('flag', {})
-                                        a_logo = flag.get('href') or flag.get('alt') or ''
-                                        if not a_logo and flag.get('iso2'):
-                                            a_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(flag['iso2'].lower())
-                                        # Doubles: try roster entries
-                                        if not a_logo or not a_id:
-                                            ros = team_a.get('roster', {})
-                                            entries = ros.get('entries', [])
-                                            if entries:
-                                                p1 = entries[0].get('athlete', {})
-                                                if not a_id: a_id = p1.get('id', '')
-                                                if not a_logo:
-                                                    pf = p1.get('flag', {})
-                                                    a_logo = pf.get('href') or pf.get('alt') or ''
-                                                    if not a_logo and pf.get('iso2'):
-                                                        a_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(pf['iso2'].lower())
-                                        # Country fallback
-                                        if not a_logo:
-                                            country = team_a.get('country', {})
-                                            if country.get('iso2'):
-                                                a_logo = "https://a.espncdn.com/i/teamlogos/countries/500/{}.png".format(country['iso2'].lower())
-                                    else:
-                                        # FIX: Added missing else block for standard away teams
-                                        team_obj = team_a.get('team', {})
-                                        a_id = team_obj.get('id', '')
-                                        a_logo = team_obj.get('logo', '')
-                                        if not a_logo and a_id:
-                                            a_logo = "https://a.espncdn.com/combiner/i?img=/i/teamlogos/{}/500/{}.png".format(sport_cdn, a_id)
-
-                                # Prefix logo IDs with unique sport name to prevent cross-sport collisions
-                                sport_prefix = get_sport_id_prefix(league_url)
-                                processed_ev['h_logo_id'] = sport_prefix + str(h_id) if h_id else ''
-                                processed_ev['a_logo_id'] = sport_prefix + str(a_id) if a_id else ''
-
-                                # Pre-fetch logos for all events (cache warmup)
-                                if h_logo and h_id: self.prefetch_logo(h_logo, processed_ev['h_logo_id'])
-                                if a_logo and a_id: self.prefetch_logo(a_logo, processed_ev['a_logo_id'])
-
-                                processed_ev['h_logo_url'] = h_logo
-                                processed_ev['a_logo_url'] = a_logo
-
-                            # League Logo ALWAYS assigned (Fixes Racing/Individual sports missing logos)
-                            processed_ev['l_logo_url'] = cur_l_logo
-                            processed_ev['l_logo_id'] = "league_" + cur_l_id if cur_l_id else ''
-                            if cur_l_logo and cur_l_id:
-                                self.prefetch_logo(cur_l_logo, processed_ev['l_logo_id'])
-
-                            self.event_map[str(eid)] = processed_ev
-                            if is_changed:
-                                changed_events.append(processed_ev)
-                                has_changes = True
+                    # Pre-fetch logos for all events (cache warmup)
+                    for logo_url, logo_id, prio in res['logos']:
+                        self.prefetch_logo(logo_url, logo_id, prio)
 
                     # REAPING Stability Fix: Remove entries for THIS specific league that were not in this response.
                     # This prevents matches from appearing/disappearing if unrelated requests fail/timeout.
                     now_date = datetime.datetime.now().strftime("%Y-%m-%d")
                     reap_keys = []
+                    league_events = []
                     for mid, ex_ev in self.event_map.items():
                         if ex_ev.get('league_name') != league_name: continue
                         if ex_ev.get('league_url') != l_url: continue
-                        if mid in league_seen_ids: continue
+                        if mid in league_seen_ids:
+                            league_events.append(ex_ev)
+                            continue
 
                         ex_state = ex_ev.get('status', {}).get('type', {}).get('state', 'pre')
                         ex_date  = ex_ev.get('date', '')[:10]
                         if ex_state == 'pre' and ex_date > now_date:
+                            league_events.append(ex_ev)
                             continue # Keep tomorrow's matches
                         reap_keys.append(mid)
                     for rk in reap_keys:
                         if rk in self.event_map: del self.event_map[rk]
+                        self.event_index.remove(rk)
                     if reap_keys: has_changes = True
+
+                    # Per-league polling: next-due time from this league's own events
+                    if append_mode:
+                        self._schedule_league(l_url, league_events)
+                    self.http_validators.commit(l_url)
                 except Exception as _proc_e:
                     log_dbg("[process_events_data] Skipped league '{}' ({}) due to error: {}".format(
-                        l_name or '?', l_url or '?', _proc_e))
-
-            # Rebuild cached_events from map
-            unique_list = list(self.event_map.values())
+                        league_name or '?', l_url or '?', _proc_e))
 
-            # --- STABLE SORT: STATUS + SPORT + DATE + LEAGUE + ID ---
-            # Priority (Ascending for now, consumed/sorted elsewhere):
-            # 1) Post=0, Pre=1, Live=2
-            # 2) Other=0, Soccer=1
-            def get_sort_key(ev):
-                status = ev.get('status', {})
-                state = status.get('type', {}).get('state', 'pre')
-                if state == 'post': status_priority = 0
-                elif state == 'pre': status_priority = 1
-                else: status_priority = 2  # 'in'
-
-                # Soccer Priority
-                l_url = ev.get('league_url', '')
-                sport_priority = 1 if 'soccer' in l_url else 0
+            # Fresh load dropped events that the new response no longer carries
+            if not append_mode:
+                for k in prev_map:
+                    if k not in self.event_map:
+                        self.event_index.remove(k)
+                        has_changes = True
 
-                return (status_priority, sport_priority, ev.get('date', ''), ev.get('league_name', ''), ev.get('id', ''))
-
-            unique_list.sort(key=get_sort_key)
+            # Publish cached_events from the sorted index (no re-sort)
+            unique_list = self.event_index.view()
             self.cached_events = unique_list
 
             # Build normalized snapshots for all UI consumers
             if append_mode:
-                # INCREMENTAL: Only rebuild snapshots for events that actually changed
-                for ev in changed_events:
-                    eid = ev.get('id')
-                    if eid:
-                        self.match_snapshots[str(eid)] = build_match_snapshot(ev)
-                # Also rebuild snapshots for any new events not yet in match_snapshots
-                for ev in self.cached_events:
-                    eid = ev.get('id')
-                    if eid and str(eid) not in self.match_snapshots:
-                        self.match_snapshots[str(eid)] = build_match_snapshot(ev)
+                # INCREMENTAL: Only rebuild snapshots for events that actually changed.
+                # New events are always marked dirty; finalize_batch() runs the full sync.
+                self.match_snapshots.rebuild_dirty(self.event_map)
                 log_dbg("SNAPSHOTS: Incremental \u2014 rebuilt {} changed, {} total".format(
                     len(changed_events), len(self.match_snapshots)))
                 # NOTE: evaluate_goals() deferred to finalize_batch() for append_mode
             else:
-                # FULL REBUILD: Single league mode \u2014 rebuild everything
-                self.match_snapshots = {}
-                for ev in self.cached_events:
-                    eid = ev.get('id')
-                    if eid:
-                        self.match_snapshots[str(eid)] = build_match_snapshot(ev)
+                # SYNC: Single league mode \u2014 rebuild changed events, reuse the rest
+                rebuilt, reused = self.match_snapshots.sync(self.event_map)
 
                 # TRIGGER: Evaluate goals IMMEDIATELY after snapshots are built
                 self.evaluate_goals()
-                log_dbg("SNAPSHOTS: Full rebuild \u2014 {} snapshots".format(len(self.match_snapshots)))
+                self.where_to_watch.schedule(self.match_snapshots)
+                log_dbg("SNAPSHOTS: Sync \u2014 rebuilt={} reused={} total={}".format(
+                    rebuilt, reused, len(self.match_snapshots)))
 
             # Only set status message if there's an actual issue (no matches)
             if len(self.cached_events) == 0:
@@ -8320,19 +10241,15 @@ class SportsMonitor:
                                     live_count += 1
                         except: pass
 
-                # ADAPTIVE POLLING: 60s for Live/Near-start, 300s for Idle
+                # ADAPTIVE POLLING: 30s for Live/Near-start, 300s for Idle
                 # FIX: Ensure timer restarts if UI is active (callbacks) or reminders exist
-                should_run = self.active or (len(self.callbacks) > 0) or (len(self.reminders) > 0)
-                if should_run:
-                    new_interval = self._get_timer_interval(live_count)
-                    log_diag("LAZY_PROCESS: Restarting timer in {}ms (active={} callbacks={} reminders={})".format(
-                        new_interval, self.active, len(self.callbacks), len(self.reminders)))
-                    self.timer.start(new_interval, False)
+                self._restart_poll_timer(live_count)
         except Exception:
             self.status_message = "JSON Parse Error"
             if not self.batch_is_active:
                 for cb in self.callbacks: cb(True)
 
+
 if global_sports_monitor is None:
     global_sports_monitor = SportsMonitor()
 
@@ -10246,12 +12163,12 @@ class GameInfoScreen(Screen):
 
         if self.cdn_url and is_live:
             # OPTIMIZATION: Use high-speed CDN endpoint for live matches (avoids 60s ESPN latency)
-            getPage(self.cdn_url.encode('utf-8')).addCallback(self.parse_details).addErrback(self.error_cdn)
+            global_sports_monitor.summaries.fetch(self.event_id, self.cdn_url).addCallback(self.parse_details).addErrback(self.error_cdn)
         elif self.summary_url:
             if getattr(self, '_is_euroleague', False):
-                getPage(self.summary_url.encode('utf-8')).addCallback(self.parse_euroleague_stats).addErrback(self.error_details)
+                global_sports_monitor.summaries.fetch(self.event_id, self.summary_url).addCallback(self.parse_euroleague_stats).addErrback(self.error_details)
             else:
-                getPage(self.summary_url.encode('utf-8')).addCallback(self.parse_details).addErrback(self.error_details)
+                global_sports_monitor.summaries.fetch(self.event_id, self.summary_url).addCallback(self.parse_details).addErrback(self.error_details)
         else:
             self.error_details(None)
 
@@ -10268,9 +12185,9 @@ class GameInfoScreen(Screen):
         print("[SimplySport] CDN Boxscore fetch failed. Falling back to primary summary endpoint.")
         if self.summary_url:
             if getattr(self, '_is_euroleague', False):
-                getPage(self.summary_url.encode('utf-8')).addCallback(self.parse_euroleague_stats).addErrback(self.error_details)
+                global_sports_monitor.summaries.fetch(self.event_id, self.summary_url).addCallback(self.parse_euroleague_stats).addErrback(self.error_details)
             else:
-                getPage(self.summary_url.encode('utf-8')).addCallback(self.parse_details).addErrback(self.error_details)
+                global_sports_monitor.summaries.fetch(self.event_id, self.summary_url).addCallback(self.parse_details).addErrback(self.error_details)
         else:
             self.error_details(error)
 
@@ -12572,7 +14489,7 @@ class GoalToast(Screen):
 # ZAP NOTIFICATION SCREEN (Interactive)
 # ==============================================================================
 class ZapNotificationScreen(Screen):
-    def __init__(self, session, match_name, league, h_logo, a_logo, sref, timeout_seconds=30):
+    def __init__(self, session, match_name, league, h_logo, a_logo, sref, timeout_seconds=30, channel_name=""):
         # Calculate Layout similar to GoalToast
         width = 800
         height = 300
@@ -12617,7 +14534,10 @@ class ZapNotificationScreen(Screen):
 
         self["title"] = Label(str(league))
         self["match_name"] = Label(str(match_name))
-        self["prompt"] = Label(_t("Match is starting! Zap to channel?"))
+        prompt = _t("Match is starting! Zap to channel?")
+        if channel_name:
+            prompt += u" (" + channel_name + u")"
+        self["prompt"] = Label(prompt)
         self["key_ok"] = Label(_t("Zap Now"))
         self["key_cancel"] = Label(_t("Cancel"))
 
@@ -12625,7 +14545,7 @@ class ZapNotificationScreen(Screen):
         self["a_logo"] = Pixmap()
 
         # Logo Cache Path
-        self.logo_cache_path = "/tmp/simplysports/logos/"
+        self.logo_cache_path = logo_cache_dir() + "/"
 
         self["actions"] = ActionMap(["OkCancelActions", "ColorActions"], {
             "ok": self.ok,
@@ -12759,12 +14679,11 @@ class FavoriteTeamsManagerScreen(Screen):
             # ── resolve logo path ────────────────────────────────────────────
             logo_path = logo_cache.get(cache_key)
             if not logo_path:
-                # Check disk directly (in case prefetch finished but cache not updated)
-                candidate = "/tmp/simplysports/logos/{}.png".format(cache_key)
-                if os.path.exists(candidate) and os.path.getsize(candidate) > 0:
+                # Check the logo index (in case prefetch finished but cache not updated)
+                candidate = GLOBAL_LOGO_INDEX.lookup(cache_key)
+                if candidate:
                     logo_path = candidate
                     logo_cache[cache_key] = candidate
-                    GLOBAL_VALID_LOGO_PATHS.add(candidate)
                 elif logo_url and team_id:
                     # Kick off async download; refresh the list after a short delay
                     global_sports_monitor.prefetch_logo(logo_url, cache_key)
@@ -13457,7 +15376,6 @@ class LeagueSelector(Screen):
 
     def download_league_logos(self):
         """Download league logos from ESPN API for each league"""
-        from twisted.web.client import downloadPage
         for sorted_idx, original_idx in enumerate(self.sorted_indices):
             url = DATA_SOURCES[original_idx][1]
             logo_id = "league_{}".format(original_idx)
@@ -13470,8 +15388,10 @@ class LeagueSelector(Screen):
                 try:
                     logo_url = self.get_league_logo_url(url, original_idx)
                     if logo_url:
-                        downloadPage(logo_url.encode('utf-8'), logo_file).addCallback(
-                            self.logo_downloaded, sorted_idx, logo_file).addErrback(self.logo_error)
+                        GLOBAL_LOGO_DOWNLOADER.request(
+                            logo_url, "selector_" + logo_id, logo_file, LOGO_PRIO_VISIBLE,
+                            lambda _id, path, i=sorted_idx: self.logo_downloaded(None, i, path),
+                            owner=self)
                 except: pass
 
     def get_league_logo_url(self, api_url, idx):
@@ -15595,7 +17515,7 @@ class SimpleSportsMiniBar2(Screen):
     def __init__(self, session):
         Screen.__init__(self, session)
 
-        self.logo_path = "/tmp/simplysports/logos/"
+        self.logo_path = logo_cache_dir() + "/"
         if not os.path.exists(self.logo_path):
             try: os.makedirs(self.logo_path)
             except: pass
@@ -15853,10 +17773,12 @@ class SimpleSportsMiniBar2(Screen):
         tomorrow_str = (now + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
         yesterday_str = (now - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
 
+        passing = global_sports_monitor.match_snapshots.filter_ids(mode, today_str, tomorrow_str, yesterday_str)
         for event in events:
-            snap = global_sports_monitor.match_snapshots.get(str(event.get('id', '')))
+            eid = str(event.get('id', ''))
+            if eid not in passing: continue
+            snap = global_sports_monitor.match_snapshots.get(eid)
             if not snap: continue
-            if not snapshot_passes_filter(snap, mode, today_str, tomorrow_str, yesterday_str): continue
 
             # Racing events (>2 competitors) -- use event shortName
             comps = event.get('competitions', [{}])[0].get('competitors', [])
@@ -16267,7 +18189,7 @@ class SimpleSportsMiniBar(Screen):
         Screen.__init__(self, session)
 
         # RAM Path
-        self.logo_path = "/tmp/simplysports/logos/"
+        self.logo_path = logo_cache_dir() + "/"
         if not os.path.exists(self.logo_path):
             try: os.makedirs(self.logo_path)
             except: pass
@@ -16597,10 +18519,12 @@ class SimpleSportsMiniBar(Screen):
         tomorrow_str = (now + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
         yesterday_str = (now - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
 
+        passing = global_sports_monitor.match_snapshots.filter_ids(mode, today_str, tomorrow_str, yesterday_str)
         for event in events:
-            snap = global_sports_monitor.match_snapshots.get(str(event.get('id', '')))
+            eid = str(event.get('id', ''))
+            if eid not in passing: continue
+            snap = global_sports_monitor.match_snapshots.get(eid)
             if not snap: continue
-            if not snapshot_passes_filter(snap, mode, today_str, tomorrow_str, yesterday_str): continue
 
             # Racing events (>2 competitors) -- use event shortName
             comps = event.get('competitions', [{}])[0].get('competitors', [])
@@ -17050,210 +18974,407 @@ def _words_to_core(word_set):
     return u' '.join(sorted(word_set))
 
 
-def _scan_bouquet_for_name(name, country=None):
-    """
-    Multi-signal weighted bouquet scanner.
-
-    Signals (applied in cheap-first order)
-    ───────────────────────────────────────
-    Guard 1  Token overlap (set intersection)         cheap – O(n)
-    Guard 2  Number guard  (subset check)             cheap – O(n)
-    Signal 1 Token coverage ratio      weight 0.55    after guards only
-    Signal 2 SequenceMatcher ratio     weight 0.30    after guards only
-    Signal 3 Country prefix bonus/penalty ±0.15       after guards only
+class BouquetIndexSnapshot(object):
+    """One immutable build of BouquetChannelIndex; readers only ever hold one of these."""
+    __slots__ = ('files', 'entries', 'tokens')
 
-    Performance
-    ───────────
-    SequenceMatcher is created once per scan_file_list call and reused
-    via set_seq2().  It is never called on entries that fail Guard 1 or 2.
-    Typical ARM hardware: 20 000-entry bouquet set → 0.3–0.6 s.
-    """
-    from difflib import SequenceMatcher
-    import os
+    def __init__(self, files=(), entries=(), tokens=None):
+        self.files = files        # [(path, fname, bq_name)]
+        self.entries = entries    # [(sref, words, prefix, nums, core, file_idx)]
+        self.tokens = tokens or {}  # token -> [entry_idx ascending]
 
-    bq_dir = u'/etc/enigma2/'
+    def candidates(self, q_words):
+        """Entry indices sharing at least one token with the query, in bouquet order."""
+        found = set()
+        for w in q_words:
+            found.update(self.tokens.get(w, ()))
+        return sorted(found)
 
-    try:
-        # ── Prepare query ────────────────────────────────────────────────
-        q_words, _ = _clean_for_scan(name)
-        if not q_words:
-            return None
 
-        q_core = _words_to_core(q_words)
-        q_nums = frozenset(w for w in q_words if w.isdigit())
+class BouquetChannelIndex(object):
+    """
+    Inverted token index over every #SERVICE/#DESCRIPTION pair in the user
+    bouquets, so _scan_bouquet_for_name() scores only entries that share a
+    token with the query instead of re-reading and re-cleaning ~20k lines.
+
+    Entries keep bouquet file order (listdir order, then line order) so the
+    first-best / early-exit semantics of the old linear scan are unchanged.
+    The index is invalidated by bouquet file mtimes (checked at most every
+    CHECK_INTERVAL seconds) and persisted next to the logo store so a reboot
+    only pays for a JSON load. Each build is published as one
+    BouquetIndexSnapshot, swapped in with a single assignment, so lookups
+    running on other threads never mix files/entries/tokens of two builds.
+    """
+    VERSION = 1
+    CHECK_INTERVAL = 30
+
+    def __init__(self, bq_dir, index_file):
+        self.bq_dir = bq_dir
+        self._index_file = index_file   # str, or callable resolved on first use
+        self._lock = threading.Lock()
+        self._signature = None   # {fname: mtime}
+        self._checked = 0
+        self.snapshot = BouquetIndexSnapshot()
+
+    @property
+    def index_file(self):
+        if callable(self._index_file):
+            self._index_file = self._index_file()
+        return self._index_file
+
+    def _current_signature(self):
+        sig = {}
+        for fname in os.listdir(self.bq_dir):
+            if not fname.endswith(u'.tv') or fname == u'bouquets.tv':
+                continue
+            try: sig[fname] = int(os.path.getmtime(os.path.join(self.bq_dir, fname)))
+            except OSError: pass
+        return sig
 
-        # ── Build country token set ──────────────────────────────────────
-        lstv_codes = set()
-        if country:
-            if isinstance(country, bytes):
-                try:
-                    country = country.decode('utf-8', 'ignore')
-                except Exception:
-                    pass
-            import re
-            norm = re.sub(u'[^a-z0-9]', u'', country.lower())
-            lstv_codes.add(norm)
-            for alias in _BS_COUNTRY_MAP.get(norm, ()):
-                lstv_codes.add(alias)
+    @staticmethod
+    def _read_bouquet_name(path):
+        bq_name = u''
+        try:
+            with open(path, u'r') as f:
+                for _ in range(10):
+                    line = f.readline()
+                    if not line:
+                        break
+                    line = line.strip()
+                    if line.startswith(u'#NAME'):
+                        bq_name = line[5:].strip()
+                        break
+        except Exception:
+            pass
+        if isinstance(bq_name, bytes):
+            try:
+                bq_name = bq_name.decode('utf-8', 'ignore')
+            except Exception:
+                bq_name = u''
+        return bq_name
 
-        # ── Split bouquet files into country-priority and others ─────────
-        country_bouquets = []
-        other_bouquets   = []
+    @staticmethod
+    def _read_entries(path):
+        """Yield (sref, d_words, d_prefix) for each described service in a bouquet."""
+        try:
+            with open(path, u'r') as f:
+                sref = None
+                for raw_line in f:
+                    line = raw_line.strip()
+                    if line.startswith(u'#SERVICE'):
+                        sref = (line.split(u' ', 1)[1]
+                                if u' ' in line else None)
+                        continue
+                    if not line.startswith(u'#DESCRIPTION') or not sref:
+                        continue
+                    d_words, d_prefix = _clean_for_scan(line[12:].strip())
+                    if d_words:
+                        yield sref, d_words, d_prefix
+                    sref = None
+        except Exception:
+            pass
 
-        for fname in os.listdir(bq_dir):
-            if not fname.endswith(u'.tv') or fname == u'bouquets.tv':
+    def _install(self, files, rows):
+        entries = []
+        tokens = {}
+        for sref, words, prefix, file_idx in rows:
+            words = frozenset(words)
+            idx = len(entries)
+            entries.append((sref, words, prefix,
+                            frozenset(w for w in words if w.isdigit()),
+                            _words_to_core(words), file_idx))
+            for w in words:
+                tokens.setdefault(w, []).append(idx)
+        self.snapshot = BouquetIndexSnapshot(files, entries, tokens)
+
+    def _build(self, sig):
+        files = []
+        rows = []
+        for fname in os.listdir(self.bq_dir):
+            if fname not in sig:
                 continue
-            path = os.path.join(bq_dir, fname)
+            path = os.path.join(self.bq_dir, fname)
+            file_idx = len(files)
+            files.append((path, fname, self._read_bouquet_name(path)))
+            for sref, d_words, d_prefix in self._read_entries(path):
+                rows.append((sref, d_words, d_prefix, file_idx))
+        self._install(files, rows)
+        self._save(sig)
+
+    def _load(self, sig):
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or data.get('signature') != sig:
+                return False
+            files = [(os.path.join(self.bq_dir, fn), fn, bq) for fn, bq in data['files']]
+            self._install(files, data['entries'])
+            return True
+        except Exception:
+            return False
+
+    def _save(self, sig):
+        try:
+            d = os.path.dirname(self.index_file)
+            if not os.path.exists(d):
+                os.makedirs(d)
+            snap = self.snapshot
+            data = {
+                'version': self.VERSION,
+                'signature': sig,
+                'files': [[fn, bq] for _, fn, bq in snap.files],
+                'entries': [[e[0], sorted(e[1]), e[2], e[5]] for e in snap.entries],
+            }
+            tmp = self.index_file + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.rename(tmp, self.index_file)
+        except Exception as e:
+            log_dbg(u'BouquetChannelIndex save error: ' + str(e))
+
+    def ensure(self):
+        """Return an up-to-date BouquetIndexSnapshot (blocking; safe from any thread)."""
+        with self._lock:
+            now = time.time()
+            if self._signature is not None and now - self._checked < self.CHECK_INTERVAL:
+                return self.snapshot
+            self._checked = now
+            sig = self._current_signature()
+            if sig == self._signature:
+                return self.snapshot
+            t0 = time.time()
+            source = "disk"
+            if not self._load(sig):
+                source = "scan"
+                self._build(sig)
+            changed = self._signature is not None
+            self._signature = sig
+            snap = self.snapshot
+            log_diag("BOUQUET_INDEX: {} entries, {} tokens from {} in {:.0f}ms".format(
+                len(snap.entries), len(snap.tokens), source, (time.time() - t0) * 1000.0))
+        if changed:
+            notify_bouquets_changed()
+        return self.snapshot
+
+    def warm(self):
+        """Build/refresh the index on a worker thread ahead of the first lookup."""
+        threads.deferToThread(self.ensure).addErrback(lambda f: None)
+
+
+GLOBAL_BOUQUET_INDEX = BouquetChannelIndex(
+    u'/etc/enigma2/', lambda: logo_state_file("bouquet_index.json"))
+
+
+def _prepare_bouquet_query(name, country=None):
+    """Tokenise a channel name (+ optional country) once; None if nothing to match."""
+    q_words, _ = _clean_for_scan(name)
+    if not q_words:
+        return None
 
-            bq_name = u''
+    # ── Build country token set ──────────────────────────────────────────
+    lstv_codes = set()
+    if country:
+        if isinstance(country, bytes):
             try:
-                with open(path, u'r') as f:
-                    for _ in range(10):
-                        line = f.readline()
-                        if not line:
-                            break
-                        line = line.strip()
-                        if line.startswith(u'#NAME'):
-                            bq_name = line[5:].strip()
-                            break
+                country = country.decode('utf-8', 'ignore')
             except Exception:
                 pass
+        norm = _re.sub(u'[^a-z0-9]', u'', country.lower())
+        lstv_codes.add(norm)
+        for alias in _BS_COUNTRY_MAP.get(norm, ()):
+            lstv_codes.add(alias)
+
+    return (q_words, _words_to_core(q_words),
+            frozenset(w for w in q_words if w.isdigit()),
+            frozenset(lstv_codes))
+
+
+def _country_bouquet_files(files, lstv_codes):
+    """Indices of bouquet files whose file name or #NAME label carries the country."""
+    country_files = set()
+    if not lstv_codes:
+        return country_files
+    for file_idx, (_, fname, bq_name) in enumerate(files):
+        slug = _re.sub(u'[^a-z0-9]', u' ',
+                       fname.lower()
+                           .replace(u'userbouquet.', u'')
+                           .replace(u'.tv', u''))
+        label = _re.sub(u'[^a-z0-9]', u' ', bq_name.lower())
+        slug_words  = set(slug.split())
+        label_words = set(label.split())
+
+        for tok in lstv_codes:
+            if len(tok) <= 3:
+                if tok in slug_words or tok in label_words:
+                    country_files.add(file_idx)
+                    break
+            else:
+                combined = slug.replace(u' ', u'') + label.replace(u' ', u'')
+                if tok in combined:
+                    country_files.add(file_idx)
+                    break
+    return country_files
 
-            if isinstance(bq_name, bytes):
-                try:
-                    bq_name = bq_name.decode('utf-8', 'ignore')
-                except Exception:
-                    bq_name = u''
 
-            is_country_bq = False
-            if lstv_codes:
-                import re
-                slug = re.sub(u'[^a-z0-9]', u' ',
-                              fname.lower()
-                                  .replace(u'userbouquet.', u'')
-                                  .replace(u'.tv', u''))
-                label = re.sub(u'[^a-z0-9]', u' ', bq_name.lower())
-                slug_words  = set(slug.split())
-                label_words = set(label.split())
-
-                for tok in lstv_codes:
-                    if len(tok) <= 3:
-                        if tok in slug_words or tok in label_words:
-                            is_country_bq = True
-                            break
-                    else:
-                        combined = slug.replace(u' ', u'') + label.replace(u' ', u'')
-                        if tok in combined:
-                            is_country_bq = True
-                            break
+def _score_bouquet_query(index, query, country_files):
+    """
+    Score one prepared query against the index; returns (sref or None, score).
 
-            if is_country_bq:
-                country_bouquets.append(path)
-            else:
-                other_bouquets.append(path)
+    Signals (applied in cheap-first order)
+    ───────────────────────────────────────
+    Guard 1  Token overlap (inverted index lookup)
+    Guard 2  Number guard  (subset check)             cheap – O(n)
+    Signal 1 Token coverage ratio      weight 0.55    after guards only
+    Signal 2 SequenceMatcher ratio     weight 0.30    after guards only
+    Signal 3 Country prefix bonus/penalty ±0.15       after guards only
+    """
+    from difflib import SequenceMatcher
 
-        # ── Inner scan function ──────────────────────────────────────────
-        def scan_file_list(files):
-            # Create SequenceMatcher once; reuse with set_seq2() per entry.
-            # autojunk=False avoids population-analysis overhead on short strings.
-            sm = SequenceMatcher(None, q_core, None, autojunk=False)
+    q_words, q_core, q_nums, lstv_codes = query
+    entries = index.entries
 
-            best_sref  = None
-            best_score = -9999.0
+    # ── GUARD 1: token overlap via the inverted index ────────────────────
+    country_cands = []
+    other_cands   = []
+    for idx in index.candidates(q_words):
+        if entries[idx][5] in country_files:
+            country_cands.append(idx)
+        else:
+            other_cands.append(idx)
 
-            for path in files:
-                try:
-                    with open(path, u'r') as f:
-                        sref = None
-                        for raw_line in f:
-                            line = raw_line.strip()
-
-                            if line.startswith(u'#SERVICE'):
-                                sref = (line.split(u' ', 1)[1]
-                                        if u' ' in line else None)
-                                continue
+    # One SequenceMatcher per query; autojunk=False avoids population-analysis
+    # overhead on short strings.
+    sm = SequenceMatcher(None, q_core, None, autojunk=False)
 
-                            if not line.startswith(u'#DESCRIPTION') or not sref:
-                                continue
+    def score_candidates(cands):
+        best_sref  = None
+        best_score = -9999.0
 
-                            desc_raw = line[12:].strip()  # faster than replace()
+        for idx in cands:
+            sref, d_words, d_prefix, d_nums, d_core, _ = entries[idx]
+            common = q_words & d_words
 
-                            # ── Pre-process description ───────────────────
-                            d_words, d_prefix = _clean_for_scan(desc_raw)
+            # ── GUARD 2: strict number guard (cheap) ──────────────────────
+            if q_nums and not q_nums.issubset(d_nums):
+                continue
 
-                            # ── GUARD 1: token overlap (cheap) ────────────
-                            common = q_words & d_words
-                            if not common:
-                                sref = None
-                                continue
+            # ── SIGNAL 2: SequenceMatcher (expensive) ─────────────────────
+            sm.set_seq2(d_core)
+            seq_ratio = sm.ratio()
 
-                            # ── GUARD 2: strict number guard (cheap) ──────
-                            d_nums = frozenset(w for w in d_words if w.isdigit())
-                            if q_nums and not q_nums.issubset(d_nums):
-                                sref = None
-                                continue
+            # ── SIGNAL 1: token coverage ratio ────────────────────────────
+            coverage = len(common) / float(max(len(q_words), 1))
 
-                            # ── Build d_core only now (lazy) ─────────────
-                            d_core = _words_to_core(d_words)
+            # ── SIGNAL 3: country bonus / penalty ─────────────────────────
+            country_bonus = 0.0
+            if d_prefix and lstv_codes:
+                if d_prefix in lstv_codes:
+                    country_bonus = +0.15
+                else:
+                    country_bonus = -0.10
+            elif d_prefix:
+                country_bonus = +0.02
 
-                            # ── SIGNAL 2: SequenceMatcher (expensive) ─────
-                            sm.set_seq2(d_core)
-                            seq_ratio = sm.ratio()
+            # ── Length penalty ────────────────────────────────────────────
+            extra = max(0, len(d_words) - len(q_words))
+            length_penalty  = 0.02 * extra
+            if not q_nums and d_nums:
+                length_penalty += 0.15
 
-                            # ── SIGNAL 1: token coverage ratio ────────────
-                            coverage = len(common) / float(max(len(q_words), 1))
+            # ── Final score ───────────────────────────────────────────────
+            score = (_SCAN_W_TOKEN * coverage
+                     + _SCAN_W_SEQ   * seq_ratio
+                     + country_bonus
+                     - length_penalty)
 
-                            # ── SIGNAL 3: country bonus / penalty ─────────
-                            country_bonus = 0.0
-                            if d_prefix and lstv_codes:
-                                if d_prefix in lstv_codes:
-                                    country_bonus = +0.15
-                                else:
-                                    country_bonus = -0.10
-                            elif d_prefix:
-                                country_bonus = +0.02
+            if score > best_score:
+                best_score = score
+                best_sref  = sref
 
-                            # ── Length penalty ────────────────────────────
-                            extra = max(0, len(d_words) - len(q_words))
-                            length_penalty  = 0.02 * extra
-                            if not q_nums and d_nums:
-                                length_penalty += 0.15
+                # Early exit on near-perfect match
+                if score >= _SCAN_PERFECT:
+                    return best_sref, best_score
 
-                            # ── Final score ───────────────────────────────
-                            score = (_SCAN_W_TOKEN * coverage
-                                     + _SCAN_W_SEQ   * seq_ratio
-                                     + country_bonus
-                                     - length_penalty)
+        if best_score < _SCAN_THRESHOLD:
+            return None, best_score
+        return best_sref, best_score
 
-                            if score > best_score:
-                                best_score = score
-                                best_sref  = sref
+    # ── Two-pass scan: country bouquets first ────────────────────────────
+    if country_cands:
+        sref, score = score_candidates(country_cands)
+        if sref is not None:
+            return sref, score
 
-                                # Early exit on near-perfect match
-                                if score >= _SCAN_PERFECT:
-                                    return best_sref, best_score
+    return score_candidates(other_cands)
 
-                            sref = None
 
-                except Exception:
-                    pass
+def match_bouquet_names(queries, progress=None):
+    """
+    Resolve many channel names to bouquet srefs against one index snapshot.
 
-            if best_score < _SCAN_THRESHOLD:
-                return None, best_score
-            return best_sref, best_score
+    queries  : list of name or (name, country)
+    progress : optional progress(i, name, sref, score), called per query as it
+               is resolved (on the calling thread)
+    Returns a list of (sref or None, score) aligned with queries.
 
-        # ── Two-pass scan ────────────────────────────────────────────────
-        if country_bouquets:
-            sref, score = scan_file_list(country_bouquets)
-            if sref is not None:
-                return sref
+    Identical (name, country) pairs are tokenised and scored once; country
+    bouquet sets are computed once per country. Blocking — run it on a worker
+    thread (see match_bouquet_names_async) for more than a handful of names.
+    """
+    results = []
+    try:
+        index = GLOBAL_BOUQUET_INDEX.ensure()
+    except Exception as e:
+        log_dbg(u'match_bouquet_names index error: ' + str(e))
+        index = None
+
+    memo = {}
+    country_sets = {}
+    for i, q in enumerate(queries):
+        name, country = q if isinstance(q, (tuple, list)) else (q, None)
+        key = (name, country or None)
+        res = memo.get(key)
+        if res is None:
+            res = (None, 0.0)
+            if index is not None:
+                try:
+                    query = _prepare_bouquet_query(name, country)
+                    if query is not None:
+                        codes = query[3]
+                        if codes not in country_sets:
+                            country_sets[codes] = _country_bouquet_files(index.files, codes)
+                        sref, score = _score_bouquet_query(index, query, country_sets[codes])
+                        res = (sref, max(score, 0.0))
+                except Exception as e:
+                    log_dbg(u'match_bouquet_names error: ' + str(e))
+            memo[key] = res
+        results.append(res)
+        if progress:
+            try: progress(i, name, res[0], res[1])
+            except Exception: pass
+    return results
 
-        sref, _ = scan_file_list(other_bouquets)
-        return sref
 
-    except Exception as e:
-        log_dbg(u'_scan_bouquet_for_name error: ' + str(e))
-    return None
+def match_bouquet_names_async(queries, on_progress=None, on_done=None):
+    """
+    match_bouquet_names() on a worker thread. on_progress(i, name, sref, score)
+    is delivered on the reactor thread as each name resolves, so screens can
+    update rows progressively; on_done(results) fires once at the end.
+    """
+    def _progress(*args):
+        reactor.callFromThread(on_progress, *args)
+
+    d = threads.deferToThread(match_bouquet_names, list(queries),
+                              _progress if on_progress else None)
+    if on_done:
+        d.addCallback(on_done)
+    d.addErrback(lambda f: log_dbg(u'match_bouquet_names_async error: ' + str(f)))
+    return d
+
+
+def _scan_bouquet_for_name(name, country=None):
+    """Best bouquet sref for a single channel name (see match_bouquet_names)."""
+    return match_bouquet_names([(name, country)])[0][0]
 
 def get_sat_position(ref_str):
     if ref_str.startswith("4097:") or ref_str.startswith("5001:"): return "IPTV"
@@ -17372,24 +19493,573 @@ def _build_epgimport_channel_map():
             except Exception:
                 continue
 
-    _EPGIMPORT_CHANNEL_MAP = channel_map
-    log_dbg("EPGImport channel map: %d XMLTV IDs mapped" % len(channel_map))
-    return channel_map
+    _EPGIMPORT_CHANNEL_MAP = channel_map
+    log_dbg("EPGImport channel map: %d XMLTV IDs mapped" % len(channel_map))
+    return channel_map
+
+
+def _xmltv_time_to_epoch(value):
+    """XMLTV '20260331220000 +0300' -> UTC epoch (0 if unparsable); no strptime."""
+    try:
+        parts = value.split()
+        d = parts[0]
+        ts = calendar.timegm((int(d[0:4]), int(d[4:6]), int(d[6:8]),
+                              int(d[8:10] or 0), int(d[10:12] or 0), int(d[12:14] or 0), 0, 0, 0))
+        if len(parts) > 1:
+            tz = parts[1]
+            sign = 1 if tz[0] == '+' else -1
+            ts -= sign * (int(tz[1:3]) * 3600 + (int(tz[3:5]) if len(tz) >= 5 else 0) * 60)
+        return ts
+    except Exception:
+        return 0
+
+
+def _xmltv_index_dir():
+    """Index next to the logo store when that is on HDD/USB, else in /tmp (never
+    flash), where the build is capped (XMLTV_TMP_INDEX_MAX_BYTES / _HORIZON)."""
+    base = os.path.dirname(logo_cache_dir())
+    if not base.startswith("/media/"):
+        base = "/tmp/simplysports"
+    return os.path.join(base, "xmltv_index")
+
+
+def _xmltv_store_persistent():
+    """False when the index lives in RAM-backed /tmp (no HDD/USB): the remote
+    guide is then streamed per search instead of spooled and indexed."""
+    return not GLOBAL_XMLTV_INDEX.index_dir.startswith("/tmp/")
+
+
+class XmltvProgrammeIndex(object):
+    """
+    Time-bucketed on-disk index of the XMLTV programme files under
+    /etc/epgimport (plus the remote guide spool), so match-to-channel searches read a few small bucket
+    files instead of iterparsing every (gzipped) source per search.
+
+    Layout in index_dir:
+        meta.json            version, source signature, build generation,
+                             sources, channel ids and display names, buckets
+        b<gen>_<bucket>.jl   one JSON row per programme starting in that
+                             BUCKET_SECS window: [src, ch, start, stop, title, norm, blob]
+    where norm is normalize_text(title + desc) (word matching) and blob is
+    _normalize_name(title + desc) (the green-button substring matcher).
+    Queries take a meta snapshot so channel/source ids always resolve
+    against the build that produced the rows. The index is rebuilt on a worker
+    thread whenever the source files' mtime/size signature changes (i.e.
+    after an EPGImport run); start_watch() polls that signature. On tmpfs
+    (no HDD/USB) a build covers only the next XMLTV_TMP_INDEX_HORIZON, stops
+    at XMLTV_TMP_INDEX_MAX_BYTES and is redone as that horizon runs out.
+    """
+    VERSION = 2
+    BUCKET_SECS = 6 * 3600
+    KEEP_PAST_SECS = 86400          # programmes older than this are not indexed
+    CHECK_INTERVAL = 900
+    MAX_CACHED_BUCKETS = 12
+
+    def __init__(self, epg_root, index_dir, extra_files=()):
+        self.epg_root = epg_root
+        self._index_dir = index_dir   # str, or callable resolved on first use
+        self._extra_files = tuple(extra_files)   # spooled remote guides (str or callable)
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._meta = None
+        self._buckets = collections.OrderedDict()   # (gen, bucket) -> [rows], small LRU
+        self._building = False
+        self._checked = 0
+        self._watching = False
+
+    @property
+    def index_dir(self):
+        if callable(self._index_dir):
+            self._index_dir = self._index_dir()
+        return self._index_dir
+
+    def extra_files(self):
+        return [f() if callable(f) else f for f in self._extra_files]
+
+    @property
+    def on_tmpfs(self):
+        """Index in RAM-backed /tmp (no HDD/USB): built under a hard size cap."""
+        return self.index_dir.startswith("/tmp/")
+
+    # ── sources ────────────────────────────────────────────────────────────
+    def _signature(self):
+        sig = {}
+        for fpath in self.extra_files():
+            try:
+                st = os.stat(fpath)
+                sig[fpath] = [int(st.st_mtime), st.st_size]
+            except OSError:
+                pass
+        if not os.path.isdir(self.epg_root):
+            return sig
+        for dirpath, _dirnames, filenames in os.walk(self.epg_root):
+            for fn in filenames:
+                if not (fn.endswith('.xml') or fn.endswith('.gz')):
+                    continue
+                if fn.endswith('sources.xml') or fn.endswith('.channels.xml'):
+                    continue
+                fpath = os.path.join(dirpath, fn)
+                try:
+                    st = os.stat(fpath)
+                except OSError:
+                    continue
+                if st.st_size < 1024:   # sources/channel stubs, not programmes
+                    continue
+                sig[fpath] = [int(st.st_mtime), st.st_size]
+        return sig
+
+    def _load_meta(self):
+        if self._meta is None:
+            try:
+                with open(os.path.join(self.index_dir, "meta.json"), 'r') as f:
+                    meta = json.load(f)
+                if meta.get('version') == self.VERSION:
+                    self._meta = meta
+            except Exception:
+                pass
+        return self._meta
+
+    # ── build (worker thread) ──────────────────────────────────────────────
+    def _build(self, sig):
+        import xml.etree.ElementTree as ET
+        import gzip
+
+        t0 = time.time()
+        old = self._load_meta()
+        gen = (old.get('gen', 0) + 1) if old else 1
+        if not os.path.exists(self.index_dir):
+            os.makedirs(self.index_dir)
+
+        cutoff = int(time.time()) - self.KEEP_PAST_SECS
+        horizon = None
+        max_bytes = None
+        if self.on_tmpfs:
+            # RAM is the budget: drop the previous build first, index only the
+            # next XMLTV_TMP_INDEX_HORIZON and stop writing at the byte cap
+            horizon = int(time.time()) + XMLTV_TMP_INDEX_HORIZON
+            max_bytes = XMLTV_TMP_INDEX_MAX_BYTES
+            with self._lock:
+                self._meta = None
+                self._buckets.clear()
+            try: os.remove(os.path.join(self.index_dir, "meta.json"))
+            except OSError: pass
+            self._remove_buckets(keep_prefix=None)
+        written = 0
+        truncated = False
+        sources = sorted(sig)
+        ch_ids = []
+        ch_pos = {}
+        ch_names = {}
+        handles = {}
+        count = 0
+        try:
+            for src_idx, fpath in enumerate(sources):
+                try:
+                    fobj = gzip.open(fpath, 'rb') if fpath.endswith('.gz') else open(fpath, 'rb')
+                except Exception:
+                    continue
+                try:
+                    context = ET.iterparse(fobj, events=('start', 'end'))
+                    try:
+                        _, root = next(context)
+                    except StopIteration:
+                        continue
+                    for evt, elem in context:
+                        if evt != 'end':
+                            continue
+                        if elem.tag == 'channel':
+                            ch_id = elem.get('id')
+                            display = elem.find('display-name')
+                            if ch_id and display is not None and display.text and ch_id not in ch_names:
+                                ch_names[ch_id] = display.text
+                            root.clear()
+                        elif elem.tag == 'programme':
+                            ch_id = (elem.get('channel') or '').strip()
+                            start = _xmltv_time_to_epoch(elem.get('start', ''))
+                            if (ch_id and start >= cutoff and not truncated
+                                    and (horizon is None or start <= horizon)):
+                                title_elem = elem.find('title')
+                                title = (title_elem.text or u'') if title_elem is not None else u''
+                                if title:
+                                    desc_elem = elem.find('desc')
+                                    text = title
+                                    if desc_elem is not None and desc_elem.text:
+                                        text = title + u' ' + desc_elem.text
+                                    ch = ch_pos.get(ch_id)
+                                    if ch is None:
+                                        ch = ch_pos[ch_id] = len(ch_ids)
+                                        ch_ids.append(ch_id)
+                                    bucket = start // self.BUCKET_SECS
+                                    fh = handles.get(bucket)
+                                    if fh is None:
+                                        fh = handles[bucket] = open(os.path.join(
+                                            self.index_dir, "b{}_{}.jl".format(gen, bucket)), 'w')
+                                    line = json.dumps([src_idx, ch, start,
+                                                       _xmltv_time_to_epoch(elem.get('stop', '')),
+                                                       title, normalize_text(text),
+                                                       _normalize_name(text)]) + "\n"
+                                    fh.write(line)
+                                    count += 1
+                                    written += len(line)
+                                    if max_bytes is not None and written >= max_bytes:
+                                        truncated = True
+                            root.clear()
+                except Exception as e:
+                    log_dbg("XMLTV index: error in {}: {}".format(fpath, e))
+                finally:
+                    fobj.close()
+        finally:
+            for fh in handles.values():
+                fh.close()
+
+        meta = {
+            'version': self.VERSION,
+            'gen': gen,
+            'signature': sig,
+            'sources': sources,
+            'channels': ch_ids,
+            'names': ch_names,
+            'buckets': sorted(handles),
+            'truncated': truncated,
+            'horizon': horizon,
+        }
+        tmp = os.path.join(self.index_dir, "meta.json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(meta, f, separators=(',', ':'))
+        os.rename(tmp, os.path.join(self.index_dir, "meta.json"))
+
+        with self._lock:
+            self._meta = meta
+            self._buckets.clear()
+
+        self._remove_buckets(keep_prefix="b{}_".format(gen))
+
+        log_diag("XMLTV_INDEX: {} programmes, {} channels, {} buckets from {} sources in {:.1f}s{}".format(
+            count, len(ch_ids), len(handles), len(sources), time.time() - t0,
+            " (truncated at {} KB on tmpfs)".format(written // 1024) if truncated else ""))
+
+    def _remove_buckets(self, keep_prefix):
+        for fn in os.listdir(self.index_dir):
+            if fn.endswith(".jl") and not (keep_prefix and fn.startswith(keep_prefix)):
+                try: os.remove(os.path.join(self.index_dir, fn))
+                except OSError: pass
+
+    def refresh(self):
+        """Rebuild if the sources changed since the last build (blocking)."""
+        with self._build_lock:
+            sig = self._signature()
+            meta = self._load_meta()
+            if (meta is not None and meta.get('signature') == sig
+                    and not (meta.get('horizon') and time.time() > meta['horizon'] - 86400)):
+                return False
+            if not sig:
+                return False
+            self._build(sig)
+            return True
+
+    @property
+    def generation(self):
+        meta = self._load_meta()
+        return meta.get('gen', 0) if meta else 0
+
+    def ensure(self):
+        """Up-to-date index for a worker-thread search; rechecks at most every CHECK_INTERVAL."""
+        now = time.time()
+        if self._meta is None or now - self._checked > self.CHECK_INTERVAL:
+            self._checked = now
+            try:
+                self.refresh()
+            except Exception as e:
+                log_dbg("XMLTV index refresh error: " + str(e))
+        return self
+
+    def refresh_async(self):
+        if self._building:
+            return
+        self._building = True
+
+        def _done(result):
+            self._building = False
+            self._checked = time.time()
+            return None
+        threads.deferToThread(self.refresh).addBoth(_done)
+
+    def start_watch(self, first_delay=120):
+        """Poll the source signature and rebuild in the background after EPGImport runs."""
+        if self._watching:
+            return
+        self._watching = True
+
+        def _tick():
+            self.refresh_async()
+            reactor.callLater(self.CHECK_INTERVAL, _tick)
+        reactor.callLater(first_delay, _tick)
+
+    # ── queries ────────────────────────────────────────────────────────────
+    @property
+    def ready(self):
+        return self._load_meta() is not None
+
+    def snapshot(self):
+        """The current build's meta; pass it to programmes() and the resolvers."""
+        return self._load_meta()
+
+    @staticmethod
+    def channel_id(meta, ch):
+        return meta['channels'][ch]
+
+    @staticmethod
+    def channel_name(meta, ch_id):
+        return meta['names'].get(ch_id)
+
+    @staticmethod
+    def source(meta, src):
+        return meta['sources'][src]
+
+    def _bucket_rows(self, meta, bucket):
+        key = (meta['gen'], bucket)
+        with self._lock:
+            rows = self._buckets.get(key)
+            if rows is not None:
+                del self._buckets[key]
+                self._buckets[key] = rows
+                return rows
+        rows = []
+        try:
+            with open(os.path.join(self.index_dir, "b{}_{}.jl".format(meta['gen'], bucket)), 'r') as f:
+                for line in f:
+                    rows.append(json.loads(line))
+        except Exception:
+            pass
+        with self._lock:
+            self._buckets[key] = rows
+            while len(self._buckets) > self.MAX_CACHED_BUCKETS:
+                self._buckets.popitem(last=False)
+        return rows
+
+    def programmes(self, t_from=None, t_to=None, meta=None):
+        """Yield [src, ch, start, stop, title, norm, blob] rows of the meta
+        snapshot's build starting within [t_from, t_to]."""
+        if meta is None:
+            meta = self._load_meta()
+        if meta is None:
+            return
+        lo = (t_from // self.BUCKET_SECS) if t_from is not None else None
+        hi = (t_to // self.BUCKET_SECS) if t_to is not None else None
+        for bucket in meta['buckets']:
+            if (lo is not None and bucket < lo) or (hi is not None and bucket > hi):
+                continue
+            for row in self._bucket_rows(meta, bucket):
+                if t_from is not None and row[2] < t_from:
+                    continue
+                if t_to is not None and row[2] > t_to:
+                    continue
+                yield row
+
+
+class RemoteXmltvSpool(object):
+    """
+    Local gzip copy of a remote XMLTV guide (XMLTV_EPG_URL), revalidated
+    with ETag / Last-Modified once it is older than the configured max age.
+    A 304 only refreshes the timestamp; a 200 is streamed into
+    <spool>.part (gzipped if the server sent plain XML) and renamed into
+    place, so a failed transfer never replaces a good spool. Transfers over
+    XMLTV_SPOOL_MAX_BYTES are abandoned. The spool is one of
+    GLOBAL_XMLTV_INDEX's sources; it is only kept on HDD/USB
+    (see _xmltv_store_persistent).
+    """
+    def __init__(self, url, path):
+        self.url = url
+        self._path = path        # str, or callable resolved on first use
+        self._lock = threading.Lock()
+        self._updating = False
+
+    @property
+    def path(self):
+        if callable(self._path):
+            self._path = self._path()
+        return self._path
+
+    @property
+    def meta_path(self):
+        return self.path + ".json"
+
+    def _meta(self):
+        try:
+            with open(self.meta_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def is_fresh(self, max_age_hours):
+        return self.exists() and time.time() - self._meta().get('fetched', 0) < max_age_hours * 3600
+
+    def update(self):
+        """Conditional GET into the spool (blocking). Returns True if the file changed."""
+        try:
+            import urllib.request as urllib2
+            from urllib.error import HTTPError
+        except ImportError:
+            import urllib2
+            from urllib2 import HTTPError
+        import gzip
+
+        with self._lock:
+            meta = self._meta() if self.exists() else {}
+            headers = {'User-Agent': 'Mozilla/5.0'}
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+            t0 = time.time()
+            try:
+                response = urllib2.urlopen(urllib2.Request(self.url, headers=headers),
+                                           timeout=EPG_SEARCH_TIMEOUT)
+            except HTTPError as e:
+                if e.code == 304:
+                    meta['fetched'] = time.time()
+                    self._write_meta(meta)
+                    log_dbg("XMLTV spool: not modified")
+                    return False
+                raise
+
+            d = os.path.dirname(self.path)
+            if not os.path.exists(d):
+                os.makedirs(d)
+            tmp = self.path + ".part"
+            try:
+                head = response.read(2)
+                if head == b'\x1f\x8b':
+                    out = open(tmp, 'wb')
+                else:
+                    out = gzip.open(tmp, 'wb')
+                with out:
+                    out.write(head)
+                    total = len(head)
+                    while True:
+                        chunk = response.read(64 * 1024)
+                        if not chunk:
+                            break
+                        total += len(chunk)
+                        if total > XMLTV_SPOOL_MAX_BYTES:
+                            raise IOError("remote guide exceeds {} MB".format(
+                                XMLTV_SPOOL_MAX_BYTES // (1024 * 1024)))
+                        out.write(chunk)
+                os.rename(tmp, self.path)
+            except Exception:
+                try: os.remove(tmp)
+                except OSError: pass
+                raise
+            finally:
+                response.close()
+
+            info = response.info()
+            self._write_meta({
+                'fetched': time.time(),
+                'etag': info.get('ETag', ''),
+                'last_modified': info.get('Last-Modified', ''),
+            })
+            log_diag("XMLTV_SPOOL: downloaded {} bytes in {:.1f}s".format(
+                os.path.getsize(self.path), time.time() - t0))
+            return True
+
+    def _write_meta(self, meta):
+        try:
+            tmp = self.meta_path + ".tmp"
+            with open(tmp, 'w') as f:
+                json.dump(meta, f)
+            os.rename(tmp, self.meta_path)
+        except Exception:
+            pass
+
+    def update_async(self, on_changed=None):
+        """Revalidate on a worker thread; on_changed() runs there if the spool changed."""
+        if self._updating:
+            return
+        self._updating = True
+
+        def _work():
+            if self.update() and on_changed:
+                on_changed()
+
+        def _done(result):
+            self._updating = False
+            if hasattr(result, 'getErrorMessage'):
+                log_dbg("XMLTV spool update failed: " + result.getErrorMessage())
+            return None
+        threads.deferToThread(_work).addBoth(_done)
+
+
+def _stream_xmltv_matches(url, h_terms, a_terms, channels, matched, label, time_limit=45):
+    """Search a remote XMLTV guide while streaming it, without keeping it.
+    Fills channels {ch_id: name} and matched {ch_id: label}."""
+    import xml.etree.ElementTree as ET
+    try:
+        import urllib.request as urllib2
+    except ImportError:
+        import urllib2
+
+    t_start = time.time()
+    response = urllib2.urlopen(urllib2.Request(url, headers={'User-Agent': 'Mozilla/5.0'}),
+                               timeout=EPG_SEARCH_TIMEOUT)
+    try:
+        context = ET.iterparse(response, events=("start", "end"))
+        try:
+            _, root = next(context)
+        except StopIteration:
+            return
+        for event, elem in context:
+            if event != "end":
+                continue
+            if time.time() - t_start > time_limit:
+                log_dbg("XMLTV stream search aborted after {}s limit".format(time_limit))
+                break
+            if elem.tag == "channel":
+                ch_id = elem.get("id")
+                display = elem.find("display-name")
+                if ch_id and display is not None and display.text:
+                    channels[ch_id] = display.text
+                root.clear()
+            elif elem.tag == "programme":
+                title = elem.find("title")
+                desc = elem.find("desc")
+                text = (title.text or u"") if title is not None else u""
+                if desc is not None and desc.text:
+                    text = text + u" " + desc.text
+                blob = _normalize_name(text)
+                h_ok = any(t in blob for t in h_terms) if h_terms else True
+                a_ok = any(t in blob for t in a_terms) if a_terms else True
+                if h_ok and a_ok:
+                    ch_id = elem.get("channel")
+                    if ch_id and ch_id not in matched:
+                        matched[ch_id] = label
+                root.clear()
+    finally:
+        response.close()
+
+
+GLOBAL_XMLTV_SPOOL = RemoteXmltvSpool(
+    XMLTV_EPG_URL, lambda: os.path.join(os.path.dirname(GLOBAL_XMLTV_INDEX.index_dir), "remote_epg.xml.gz"))
+
+
+GLOBAL_XMLTV_INDEX = XmltvProgrammeIndex("/etc/epgimport", _xmltv_index_dir,
+                                         extra_files=(lambda: GLOBAL_XMLTV_SPOOL.path,))
 
 
 def _scan_epgimport_xmltv(h_words, a_words, l_words, match_time_ts):
-    """Scan XMLTV programme files under /etc/epgimport/ for matching events.
+    """Match EPGImport XMLTV programmes (via GLOBAL_XMLTV_INDEX) against a fixture.
 
-    Uses iterative parsing to keep memory low. Returns list of tuples:
+    Returns list of tuples:
         [(sref_str, channel_name, display_title, cat_color, score), ...]
     """
-    import xml.etree.ElementTree as ET
-    import gzip
-    import calendar
-    import datetime
+    index = GLOBAL_XMLTV_INDEX.ensure()
 
-    # Cache check
-    cache_key = (tuple(sorted(h_words + a_words)), match_time_ts // 300)
+    # Cache check (a rebuilt index invalidates earlier results)
+    cache_key = (tuple(sorted(h_words + a_words)), match_time_ts // 300, index.generation)
     now = time.time()
     if cache_key in _EPGIMPORT_CACHE:
         ts, cached_results = _EPGIMPORT_CACHE[cache_key]
@@ -17405,9 +20075,6 @@ def _scan_epgimport_xmltv(h_words, a_words, l_words, match_time_ts):
     if not channel_map:
         return []
 
-    # Collect all XMLTV IDs we can resolve
-    resolvable_ids = set(channel_map.keys())
-
     STOP_WORDS = set(['al', 'el', 'the', 'fc', 'sc', 'fk', 'sk', 'club',
                       'sport', 'sports', 'vs', 'live', 'hd', 'fhd', '4k', 'uhd'])
 
@@ -17421,146 +20088,80 @@ def _scan_epgimport_xmltv(h_words, a_words, l_words, match_time_ts):
         return found, len(sig)
 
     results = []
-    epg_root = "/etc/epgimport"
-    if not os.path.isdir(epg_root):
+    meta = index.snapshot()
+    if meta is None:
         return results
 
-    # Time window: match_time +/- 3 hours
-    time_window_start = match_time_ts - 10800
-    time_window_end = match_time_ts + 10800
-
     seen_srefs = set()
 
-    for dirpath, _dirnames, filenames in os.walk(epg_root):
-        for fn in filenames:
-            # Only process XMLTV programme files (not channels files)
-            if not (fn.endswith('.xml') or fn.endswith('.xml.gz')):
-                continue
-            fpath = os.path.join(dirpath, fn)
-            try:
-                fsize = os.path.getsize(fpath)
-                # Skip tiny files (likely sources/channels, not programmes)
-                if fsize < 1024:
-                    continue
+    # Time window: match_time +/- 3 hours
+    for _src, ch, prog_start, _stop, title, blob, _name_blob in index.programmes(
+            match_time_ts - 10800, match_time_ts + 10800, meta):
+        ch_id = index.channel_id(meta, ch)
+        # Skip if we can't resolve this channel
+        if ch_id not in channel_map:
+            continue
 
-                # Open file (support gzip)
-                if fn.endswith('.gz'):
-                    fobj = gzip.open(fpath, 'rb')
-                else:
-                    fobj = open(fpath, 'rb')
+        h_found, h_total = match_score(h_words, blob)
+        a_found, a_total = match_score(a_words, blob) if a_words else (0, 0)
+        l_found, l_total = match_score(l_words, blob)
+
+        h_ratio = h_found / float(h_total) if h_total > 0 else 0.0
+        a_ratio = a_found / float(a_total) if a_total > 0 else 0.0
+        l_ratio = l_found / float(l_total) if l_total > 0 else 0.0
+
+        score = 0.0
+        score += h_ratio * 40 + a_ratio * 40 + l_ratio * 20
+        if h_ratio == 1.0: score += 10
+        if a_ratio == 1.0: score += 10
+        if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): score += 30
+        score += (h_found + a_found + l_found)
+
+        # Time proximity bonus
+        if prog_start:
+            diff_min = abs(prog_start - match_time_ts) / 60.0
+            if diff_min <= 15: score += 20
+            elif diff_min <= 45: score += 10
+            elif diff_min <= 90: score += 5
+            elif diff_min > 120: score -= 15
+
+        valid = False
+        if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): valid = True
+        elif h_ratio >= 0.5 and a_ratio >= 0.5: valid = True
+        elif (h_ratio == 1.0 or a_ratio == 1.0) and l_ratio >= 0.5: valid = True
+
+        if valid and score > 40:
+            cat_color = 0xffffff
+            if score >= 100: cat_color = 0x00FF00
+            elif score >= 80: cat_color = 0xFFFF00
+
+            # Resolve all service refs for this channel
+            for sref in channel_map.get(ch_id, []):
+                if sref in seen_srefs:
+                    continue
+                seen_srefs.add(sref)
 
+                # Try to get channel name from service handler
+                ch_display = ch_id.split('.')[0].replace('_', ' ').title()
                 try:
-                    context = ET.iterparse(fobj, events=('end',))
-                    for evt_type, elem in context:
-                        if elem.tag == 'programme':
-                            ch_id = elem.get('channel', '').strip()
-                            # Skip if we can't resolve this channel
-                            if ch_id not in resolvable_ids:
-                                elem.clear()
-                                continue
+                    from enigma import eServiceReference, eServiceCenter
+                    svc = eServiceCenter.getInstance()
+                    if svc:
+                        info = svc.info(eServiceReference(sref))
+                        if info:
+                            n = info.getName(eServiceReference(sref))
+                            if n: ch_display = n
+                except Exception:
+                    pass
 
-                            # Parse start time
-                            start_str = elem.get('start', '')
-                            prog_start = 0
-                            if start_str:
-                                try:
-                                    # XMLTV format: 20260331220000 +0300
-                                    clean_ts = start_str.split()[0][:14]
-                                    dt = datetime.datetime.strptime(clean_ts, '%Y%m%d%H%M%S')
-                                    prog_start = int(calendar.timegm(dt.timetuple()))
-                                    # Adjust for timezone if present
-                                    if len(start_str.split()) > 1:
-                                        tz_str = start_str.split()[1]
-                                        try:
-                                            tz_sign = 1 if tz_str[0] == '+' else -1
-                                            tz_hours = int(tz_str[1:3])
-                                            tz_mins = int(tz_str[3:5]) if len(tz_str) >= 5 else 0
-                                            prog_start -= tz_sign * (tz_hours * 3600 + tz_mins * 60)
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    elem.clear()
-                                    continue
-
-                            # Time filter
-                            if prog_start and (prog_start < time_window_start or prog_start > time_window_end):
-                                elem.clear()
-                                continue
+                sat_pos = get_sat_position(sref)
+                full_name = ch_display + ((" (" + sat_pos + ")") if sat_pos else "")
 
-                            # Extract title and description
-                            title_elem = elem.find('title')
-                            desc_elem = elem.find('desc')
-                            title = (title_elem.text or '') if title_elem is not None else ''
-                            desc = (desc_elem.text or '') if desc_elem is not None else ''
-
-                            blob = normalize_text(title + ' ' + desc)
-
-                            h_found, h_total = match_score(h_words, blob)
-                            a_found, a_total = match_score(a_words, blob) if a_words else (0, 0)
-                            l_found, l_total = match_score(l_words, blob)
-
-                            h_ratio = h_found / float(h_total) if h_total > 0 else 0.0
-                            a_ratio = a_found / float(a_total) if a_total > 0 else 0.0
-                            l_ratio = l_found / float(l_total) if l_total > 0 else 0.0
-
-                            score = 0.0
-                            score += h_ratio * 40 + a_ratio * 40 + l_ratio * 20
-                            if h_ratio == 1.0: score += 10
-                            if a_ratio == 1.0: score += 10
-                            if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): score += 30
-                            score += (h_found + a_found + l_found)
-
-                            # Time proximity bonus
-                            if prog_start:
-                                diff_min = abs(prog_start - match_time_ts) / 60.0
-                                if diff_min <= 15: score += 20
-                                elif diff_min <= 45: score += 10
-                                elif diff_min <= 90: score += 5
-                                elif diff_min > 120: score -= 15
-
-                            valid = False
-                            if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): valid = True
-                            elif h_ratio >= 0.5 and a_ratio >= 0.5: valid = True
-                            elif (h_ratio == 1.0 or a_ratio == 1.0) and l_ratio >= 0.5: valid = True
-
-                            if valid and score > 40:
-                                cat_color = 0xffffff
-                                if score >= 100: cat_color = 0x00FF00
-                                elif score >= 80: cat_color = 0xFFFF00
-
-                                # Resolve all service refs for this channel
-                                for sref in channel_map.get(ch_id, []):
-                                    if sref in seen_srefs:
-                                        continue
-                                    seen_srefs.add(sref)
-
-                                    # Try to get channel name from service handler
-                                    ch_display = ch_id.split('.')[0].replace('_', ' ').title()
-                                    try:
-                                        from enigma import eServiceReference, eServiceCenter
-                                        svc = eServiceCenter.getInstance()
-                                        if svc:
-                                            info = svc.info(eServiceReference(sref))
-                                            if info:
-                                                n = info.getName(eServiceReference(sref))
-                                                if n: ch_display = n
-                                    except Exception:
-                                        pass
-
-                                    sat_pos = get_sat_position(sref)
-                                    full_name = ch_display + ((" (" + sat_pos + ")") if sat_pos else "")
-
-                                    diff_min_display = abs(prog_start - match_time_ts) / 60.0 if prog_start else 999
-                                    time_info = "T+0" if diff_min_display < 1 else "T-%d" % int(diff_min_display) if prog_start < match_time_ts else "T+%d" % int(diff_min_display)
-                                    display_title = "[%d|%s] %s" % (int(score), time_info, title)
-
-                                    results.append((sref, full_name, display_title, cat_color, score))
-
-                            elem.clear()
-                finally:
-                    fobj.close()
-            except Exception:
-                continue
+                diff_min_display = abs(prog_start - match_time_ts) / 60.0 if prog_start else 999
+                time_info = "T+0" if diff_min_display < 1 else "T-%d" % int(diff_min_display) if prog_start < match_time_ts else "T+%d" % int(diff_min_display)
+                display_title = "[%d|%s] %s" % (int(score), time_info, title)
+
+                results.append((sref, full_name, display_title, cat_color, score))
 
     results.sort(key=lambda x: x[4], reverse=True)
     results = results[:100]  # Cap XML results
@@ -17615,114 +20216,402 @@ def classify_enhanced(channel_name, event_name):
     return "Other", CAT_DEFAULT
 
 
+class ServiceListSnapshot(object):
+    """
+    Process-wide snapshot of every TV service in the user's bouquets, shared
+    by all screens and the favourite-team toasts instead of each walking
+    eServiceCenter per call.
+
+    services    : [(sref, name), ...] in bouquet order (read-only, shared)
+    by_sref     : {sref: name} for O(1) lookups
+    norm_names  : {sref: normalize_text(name)} precomputed for EPG scoring
+
+    Rebuilt on the main thread (eServiceCenter is not thread-safe) when the
+    bouquet file mtimes change — checked at most every CHECK_INTERVAL
+    seconds — or after invalidate().
+    """
+    CHECK_INTERVAL = 30
+    MAX_SERVICES = 10000
+
+    def __init__(self, bq_dir):
+        self.bq_dir = bq_dir
+        self.services = []
+        self.by_sref = {}
+        self.norm_names = {}
+        self._signature = None
+        self._checked = 0
+
+    def _current_signature(self):
+        sig = {}
+        try:
+            for fname in os.listdir(self.bq_dir):
+                if fname.endswith('.tv'):
+                    try: sig[fname] = int(os.path.getmtime(os.path.join(self.bq_dir, fname)))
+                    except OSError: pass
+        except OSError:
+            pass
+        return sig
+
+    def invalidate(self):
+        """Force a rebuild on next use (e.g. after bouquets were reloaded)."""
+        self._signature = None
+        self._checked = 0
+
+    def _build(self):
+        services_list = []
+        service_handler = eServiceCenter.getInstance()
+        if not service_handler: return services_list
+
+        # Root of all bouquets
+        ref_str = '1:7:1:0:0:0:0:0:0:0:FROM BOUQUET "bouquets.tv" ORDER BY bouquet'
+        bouquet_list = service_handler.list(eServiceReference(ref_str))
+        if not bouquet_list: return services_list
+
+        bouquet_content = bouquet_list.getContent("SN", True)
+        if not bouquet_content: return services_list
+
+        for bouquet in bouquet_content:
+            # bouquet[0] is the service reference string
+            srvs = service_handler.list(eServiceReference(bouquet[0]))
+            if srvs:
+                # get content returns list of (ref, name)
+                chan_list = srvs.getContent("SN", True)
+                if chan_list:
+                    for c in chan_list:
+                        # Filter markers/separators
+                        if "::" not in c[0]:
+                            services_list.append(c)
+                            if len(services_list) > self.MAX_SERVICES: return services_list
+        return services_list
+
+    def get(self):
+        """Current snapshot list; rebuilds first if the bouquets changed."""
+        now = time.time()
+        if self._signature is not None and now - self._checked < self.CHECK_INTERVAL:
+            return self.services
+        self._checked = now
+        sig = self._current_signature()
+        if sig == self._signature and self.services:
+            return self.services
+        t0 = time.time()
+        if self._signature is not None and sig != self._signature:
+            GLOBAL_EPG_ENGINE.invalidate()   # windows of the old service list
+        services = self._build()
+        self.services = services
+        self.by_sref = dict((sref, name) for sref, name in services)
+        self.norm_names = dict((sref, normalize_text(name)) for sref, name in services)
+        self._signature = sig
+        log_diag("SERVICE_SNAPSHOT: {} services in {:.0f}ms".format(
+            len(services), (time.time() - t0) * 1000.0))
+        return services
+
+    def name_for(self, sref):
+        return self.by_sref.get(sref)
+
+    def norm_name(self, sref, name=u""):
+        n = self.norm_names.get(sref)
+        return n if n is not None else normalize_text(name)
+
+
+GLOBAL_SERVICE_SNAPSHOT = ServiceListSnapshot("/etc/enigma2")
+
+
 def get_all_services():
-    # Helper to get all TV services from bouquets
-    services_list = []
-    service_handler = eServiceCenter.getInstance()
-    if not service_handler: return []
-
-    # Root of all bouquets
-    ref_str = '1:7:1:0:0:0:0:0:0:0:FROM BOUQUET "bouquets.tv" ORDER BY bouquet'
-    bouquet_root = eServiceReference(ref_str)
-    bouquet_list = service_handler.list(bouquet_root)
-    if not bouquet_list: return []
-
-    bouquet_content = bouquet_list.getContent("SN", True)
-    if not bouquet_content: return []
-
-    for bouquet in bouquet_content:
-        # bouquet[0] is the service reference string
-        srvs = service_handler.list(eServiceReference(bouquet[0]))
-        if srvs:
-            # get content returns list of (ref, name)
-            chan_list = srvs.getContent("SN", True)
-            if chan_list:
-                for c in chan_list:
-                    # Filter markers/separators
-                    if "::" not in c[0]:
-                        services_list.append(c)
-                        # Safety limit?
-                        if len(services_list) > 10000: return services_list
-    return services_list
+    """All TV services from bouquets as [(sref, name)] — shared snapshot, do not mutate."""
+    return GLOBAL_SERVICE_SNAPSHOT.get()
 
 
-def _epg_quick_channel_for_match(home_name, away_name, league_name, kick_off_ts, services=None):
+_EPG_STOP_WORDS = frozenset(['al', 'el', 'the', 'fc', 'sc', 'fk', 'sk', 'club', 'sport', 'sports',
+                             'vs', 'live', 'hd', 'fhd', '4k', 'uhd'])
+
+
+def _epg_ref_key(sref):
+    """Comparable form of a service reference (first 10 fields, upper-case)."""
+    return clean_service_ref(sref).upper()
+
+
+def score_epg_blob(h_words, a_words, l_words, blob, evt_start, m_time):
     """
-    Fast synchronous EPG scan to find the best broadcasting channel name for a match.
-    Returns a channel name string, or "" if nothing found.
-    Intentionally lightweight — called from the main thread just before showing the toast.
+    Keyword/time score of one EPG event blob against a fixture.
+    Returns (score, valid, diff_min) using the search_and_display_epg rules.
     """
-    try:
-        from enigma import eEPGCache, eServiceReference
-        import time as _t
+    def match_sig_score(keywords, text_blob):
+        sig = [w for w in keywords if w not in _EPG_STOP_WORDS and len(w) > 1]
+        if not sig: sig = keywords
+        return sum(1 for w in sig if w in text_blob), len(sig)
+
+    h_found, h_total = match_sig_score(h_words, blob)
+    a_found, a_total = match_sig_score(a_words, blob) if a_words else (0, 0)
+    l_found, l_total = match_sig_score(l_words, blob)
+
+    h_ratio = h_found / float(h_total) if h_total > 0 else 0.0
+    a_ratio = a_found / float(a_total) if a_total > 0 else 0.0
+    l_ratio = l_found / float(l_total) if l_total > 0 else 0.0
+
+    score = h_ratio * 40 + a_ratio * 40 + l_ratio * 20
+    if h_ratio == 1.0: score += 10
+    if a_ratio == 1.0: score += 10
+    if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): score += 30
+    score += (h_found + a_found + l_found)
+
+    diff_min = abs(evt_start - m_time) / 60.0
+    if diff_min <= 15: score += 20
+    elif diff_min <= 45: score += 10
+    elif diff_min <= 90: score += 5
+    elif diff_min > 120: score -= 15
+
+    valid = False
+    if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): valid = True
+    elif h_ratio >= 0.5 and a_ratio >= 0.5: valid = True
+    elif (h_ratio == 1.0 or a_ratio == 1.0) and l_ratio >= 0.5: valid = True
+    return score, valid, diff_min
+
+
+class EpgWindow(object):
+    """
+    Events of every service intersecting [start, end), fetched in one batched
+    eEPGCache.lookupEvent() call (per-service lookupEventTime() probes only if
+    the image lacks the batch API). IPTV services (4097/5001) fall back to the
+    events of their DVB twin, as the per-service search did.
 
+    events : {sref: [(begin, duration, title, blob), ...]} sorted by begin,
+             blob = normalize_text(title + short description) + channel name
+    """
+    def __init__(self, services, start, end):
+        self.services = services
+        self.start = start
+        self.end = end
+        self.built = time.time()
+        self.events = {}
+        self._fetch()
+
+    def _fetch(self):
         epg = eEPGCache.getInstance()
         if not epg:
-            return ""
+            return
+        by_key = {}        # ref key -> [sref, ...] (IPTV twins included)
+        query_refs = []
+        for sref, _name in self.services:
+            keys = [_epg_ref_key(sref)]
+            if sref.startswith("4097:") or sref.startswith("5001:"):
+                parts = sref.split(':')
+                if len(parts) > 10:
+                    keys.append(_epg_ref_key("1:0:1:%s:%s:%s:%s:0:0:0" % tuple(parts[3:7])))
+            for i, key in enumerate(keys):
+                if key not in by_key:
+                    by_key[key] = []
+                    query_refs.append(sref if i == 0 else key)
+                by_key[key].append((sref, i))
+
+        raw = {}           # (sref, twin) -> [(begin, dur, title, short)]
+        minutes = max(1, (self.end - self.start) // 60)
+        try:
+            rows = epg.lookupEvent(['RBDTS'] + [(r, 0, self.start, minutes) for r in query_refs]) or []
+            for ref, begin, dur, title, short in rows:
+                if begin is None:
+                    continue
+                for sref, twin in by_key.get(_epg_ref_key(ref or ''), ()):
+                    raw.setdefault((sref, twin), []).append((begin, dur or 0, title or '', short or ''))
+        except Exception:
+            # No batched API on this image: probe each service across the window
+            for key, owners in by_key.items():
+                ref_obj = eServiceReference(owners[0][0] if owners[0][1] == 0 else key)
+                seen = set()
+                t = self.start
+                while t < self.end:
+                    try:
+                        evt = epg.lookupEventTime(ref_obj, t)
+                    except Exception:
+                        evt = None
+                    if evt:
+                        begin = evt.getBeginTime()
+                        if begin not in seen:
+                            seen.add(begin)
+                            row = (begin, evt.getDuration() or 0, evt.getEventName() or '',
+                                   evt.getShortDescription() or '')
+                            for owner in owners:
+                                raw.setdefault(owner, []).append(row)
+                        t = max(t + 60, begin + (evt.getDuration() or 0))
+                    else:
+                        t += 900
 
-        if not services:
-            services = get_all_services()
-        if not services:
-            return ""
+        for sref, name in self.services:
+            rows = raw.get((sref, 0)) or raw.get((sref, 1))
+            if not rows:
+                continue
+            ch_norm = GLOBAL_SERVICE_SNAPSHOT.norm_name(sref, name)
+            self.events[sref] = sorted(
+                (b, d, t, normalize_text(t + " " + sd) + " " + ch_norm) for b, d, t, sd in rows)
+
+    def event_at(self, sref, ts):
+        for ev in self.events.get(sref, ()):
+            if ev[0] <= ts < ev[0] + ev[1]:
+                return ev
+        return None
 
-        h_norm = [normalize_text(kw) for kw in get_search_keywords(home_name)]
-        a_norm = [normalize_text(kw) for kw in get_search_keywords(away_name)]
-        l_norm = [normalize_text(kw) for kw in get_search_keywords(league_name)]
 
-        STOP = {'al','el','the','fc','sc','fk','sk','club','sport','sports','vs',
-                'live','hd','fhd','4k','uhd'}
+class EpgMatchEngine(object):
+    """
+    Match-to-channel discovery over shared EpgWindow snapshots.
+
+    Kick-offs are grouped into hourly windows; each window snapshot covers
+    [hour - 45 min, hour + 2 h) for every bouquet service and is cached for
+    SNAPSHOT_TTL, so a whole match day's fixtures are scored against a few
+    snapshots instead of ~4 lookupEventTime() calls per service per match.
+    Per service the event is chosen with the old probe order (kick-off
+    +15 min, kick-off, +60 min, -15 min, then "now" for imminent matches
+    when now falls inside the window). Full windows are built by worker-thread
+    callers; match_quick() serves the reactor thread without one.
+    """
+    WINDOW_SECS = 3600
+    SNAPSHOT_TTL = 600
+    MAX_WINDOWS = 8
+    QUICK_SCAN_SERVICES = 300   # services a synchronous match_quick() may sweep
 
-        def _sig(words):
-            s = [w for w in words if w not in STOP and len(w) > 1]
-            return s if s else words
+    def __init__(self):
+        self._windows = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._prefetching = set()
+
+    def _key(self, kick_off_ts, services):
+        return (int(kick_off_ts) // self.WINDOW_SECS, id(services))
+
+    def cached_window(self, kick_off_ts, services):
+        """The fresh snapshot for this kick-off hour, or None (never builds)."""
+        with self._lock:
+            win = self._windows.get(self._key(kick_off_ts, services))
+        if win is not None and time.time() - win.built < self.SNAPSHOT_TTL:
+            return win
+        return None
 
-        h_sig = _sig(h_norm)
-        a_sig = _sig(a_norm)
-        l_sig = _sig(l_norm)
+    def prefetch(self, kick_off_ts, services):
+        """Build the window for this kick-off hour on a worker thread."""
+        key = self._key(kick_off_ts, services)
+        if key in self._prefetching:
+            return
+        self._prefetching.add(key)
 
-        best_score = 0
-        best_name  = ""
-        offsets    = [0, 900, -900, 3600]
-        now        = int(_t.time())
+        def _done(result):
+            self._prefetching.discard(key)
+            return None
+        threads.deferToThread(self.window, kick_off_ts, services).addBoth(_done)
+
+    def window(self, kick_off_ts, services):
+        win = self.cached_window(kick_off_ts, services)
+        if win is not None:
+            return win
+        key = self._key(kick_off_ts, services)
+        t0 = time.time()
+        start = key[0] * self.WINDOW_SECS
+        win = EpgWindow(services, start - 2700, start + 2 * self.WINDOW_SECS)
+        log_diag("EPG_WINDOW: {} services with events for {} in {:.0f}ms".format(
+            len(win.events), datetime.datetime.fromtimestamp(start).strftime('%d/%m %H:%M'),
+            (time.time() - t0) * 1000.0))
+        with self._lock:
+            self._windows[key] = win
+            while len(self._windows) > self.MAX_WINDOWS:
+                self._windows.popitem(last=False)
+        return win
+
+    def invalidate(self):
+        with self._lock:
+            self._windows.clear()
+
+    def match(self, h_words, a_words, l_words, m_time, services=None, limit=200):
+        """Scored channels for one fixture: [(sref, full_name, display_title, cat_color, score)]."""
+        return self.match_many([(None, h_words, a_words, l_words, m_time)], services, limit).get(None, [])
+
+    def match_many(self, queries, services=None, limit=200):
+        """
+        queries: [(key, h_words, a_words, l_words, kick_off_ts)] with normalised keywords.
+        Returns {key: [(sref, full_name, display_title, cat_color, score)]} best first.
+        """
+        if services is None:
+            services = get_all_services()
+        out = {}
+        now = int(time.time())
+        for key, h_words, a_words, l_words, m_time in queries:
+            out[key] = self._score(self.window(m_time, services), services,
+                                   h_words, a_words, l_words, m_time, limit, now)
+        return out
 
-        # Cap scan at 300 channels to stay fast
-        for sref_raw, ch_name in services[:300]:
-            try:
-                sref_obj = eServiceReference(sref_raw)
-                evt = None
-                for off in offsets:
-                    evt = epg.lookupEventTime(sref_obj, kick_off_ts + off)
-                    if evt:
-                        break
-                if not evt and abs(kick_off_ts - now) < 7200:
-                    evt = epg.lookupEventTime(sref_obj, now)
-                if not evt:
-                    continue
+    def match_quick(self, h_words, a_words, l_words, m_time, services, limit=1):
+        """
+        Reactor-thread variant of match(): uses the shared window when one is
+        fresh, otherwise prefetches it on a worker and scores a small window
+        over the first QUICK_SCAN_SERVICES services so the UI never waits for
+        a full EPG sweep.
+        """
+        win = self.cached_window(m_time, services)
+        if win is None:
+            self.prefetch(m_time, services)
+            services = services[:self.QUICK_SCAN_SERVICES]
+            start = int(m_time) // self.WINDOW_SECS * self.WINDOW_SECS
+            win = EpgWindow(services, start - 2700, start + 2 * self.WINDOW_SECS)
+        return self._score(win, services, h_words, a_words, l_words, m_time, limit, int(time.time()))
+
+    def _score(self, win, services, h_words, a_words, l_words, m_time, limit, now):
+        probes = [m_time + 900, m_time, m_time + 3600, m_time - 900]
+        if m_time <= now + 21600 and abs(m_time - now) < 7200 and win.start <= now < win.end:
+            probes.append(now)
+        results = []
+        seen = set()
+        for sref, ch_name in services:
+            if sref in seen or sref not in win.events:
+                continue
+            seen.add(sref)
+            evt = None
+            for t in probes:
+                evt = win.event_at(sref, t)
+                if evt: break
+            if not evt:
+                continue
+            evt_start, _dur, title, blob = evt
+            score, valid, diff_min = score_epg_blob(h_words, a_words, l_words, blob, evt_start, m_time)
+            if valid and score > 40:
+                cat_color = 0xffffff
+                if score >= 100: cat_color = 0x00FF00
+                elif score >= 80: cat_color = 0xFFFF00
 
-                title = evt.getEventName() or ""
-                desc  = evt.getShortDescription() or ""
-                blob  = normalize_text(title + " " + desc + " " + ch_name)
+                sat_pos = get_sat_position(sref)
+                full_name = ch_name + ((" (" + sat_pos + ")") if sat_pos else "")
+                time_info = "T+0" if diff_min < 1 else "T-%d" % int(diff_min) if evt_start < m_time else "T+%d" % int(diff_min)
+                display_title = "[%d|%s] %s" % (int(score), time_info, title)
+                results.append((sref, full_name, display_title, cat_color, score))
+        results.sort(key=lambda x: x[4], reverse=True)
+        return results[:limit]
 
-                h_found = sum(1 for w in h_sig if w in blob)
-                a_found = sum(1 for w in a_sig if w in blob)
-                l_found = sum(1 for w in l_sig if w in blob)
 
-                h_r = h_found / float(len(h_sig)) if h_sig else 0.0
-                a_r = a_found / float(len(a_sig)) if a_sig else 0.0
-                l_r = l_found / float(len(l_sig)) if l_sig else 0.0
+GLOBAL_EPG_ENGINE = EpgMatchEngine()
 
-                score = h_r * 40 + a_r * 40 + l_r * 20
-                if h_r == 1.0: score += 10
-                if a_r == 1.0: score += 10
-                if h_r == 1.0 and a_r == 1.0: score += 30
 
-                if score > best_score and score > 40:
-                    best_score = score
-                    best_name  = ch_name
-            except:
-                continue
+def notify_bouquets_changed():
+    """Bouquets were reloaded: drop the service snapshot and the EPG windows
+    built over it instead of waiting for their own staleness checks. Safe
+    from any thread (the snapshot itself is rebuilt on next main-thread use)."""
+    GLOBAL_SERVICE_SNAPSHOT.invalidate()
+    GLOBAL_EPG_ENGINE.invalidate()
+
+
+def _epg_quick_channel_for_match(home_name, away_name, league_name, kick_off_ts, services=None):
+    """
+    Best broadcasting channel name for a match (main thread, see
+    EpgMatchEngine.match_quick). Returns a channel name string, or "" if nothing found.
+    """
+    try:
+        if not services:
+            services = get_all_services()
+        if not services:
+            return ""
+
+        h_norm = [normalize_text(kw) for kw in get_search_keywords(home_name)]
+        a_norm = [normalize_text(kw) for kw in get_search_keywords(away_name)]
+        l_norm = [normalize_text(kw) for kw in get_search_keywords(league_name)]
 
-        return best_name
+        best = GLOBAL_EPG_ENGINE.match_quick(h_norm, a_norm, l_norm, kick_off_ts, services, limit=1)
+        if not best:
+            return ""
+        return GLOBAL_SERVICE_SNAPSHOT.name_for(best[0][0]) or best[0][1]
     except Exception as e:
         log_dbg("[FavNotif] _epg_quick_channel_for_match error: {}".format(e))
         return ""
@@ -19832,26 +22721,156 @@ class LiveScoreFollowToast(Screen):
         self.timer.start(5000, True)
 
 
+# ==============================================================================
+# MATCH LIST ROW CACHE
+# ==============================================================================
+def _row_key_part(v):
+    """Hashable stand-in for one entry field (stat lists become tuples)."""
+    if isinstance(v, list):
+        return tuple(_row_key_part(x) for x in v)
+    if isinstance(v, dict):
+        return tuple(sorted((k, _row_key_part(x)) for k, x in v.items()))
+    return v
+
+
+class RowRenderCache(object):
+    """
+    event id -> (key, multicontent row) for the main match list.
+    The key covers everything the row renderers read: the snapshot object
+    (replaced whenever its scoreboard data changes), the theme, the entry
+    tuple (logos, heat colour, predictor, glow side, bucketed pulse) and
+    whether each logo is on disk yet. Rows never depend on the selection -
+    the focus glow is a separate widget - so an unchanged event reuses the
+    list it built last time and only rows that actually moved are re-rendered.
+    """
+    def __init__(self):
+        self._rows = {}
+        self._seen = set()
+        self.hits = 0
+        self.misses = 0
+        self.total_hits = 0
+        self.total_misses = 0
+
+    def begin(self):
+        self.hits = 0
+        self.misses = 0
+        self._seen = set()
+
+    def _key(self, theme, entry):
+        return (theme, _row_key_part(entry),
+                entry[8] in GLOBAL_VALID_LOGO_PATHS,
+                entry[9] in GLOBAL_VALID_LOGO_PATHS,
+                len(entry) > 14 and entry[14] in GLOBAL_VALID_LOGO_PATHS)
+
+    def peek(self, eid, snap, theme, entry):
+        """The still-valid cached row for eid, or None (nothing is rendered)."""
+        self._seen.add(eid)
+        slot = self._rows.get(eid)
+        if slot is not None and slot[0] is snap and slot[1] == self._key(theme, entry):
+            self.hits += 1
+            return slot[2]
+        return None
+
+    def row(self, eid, snap, theme, entry, render):
+        self._seen.add(eid)
+        key = self._key(theme, entry)
+        slot = self._rows.get(eid)
+        if slot is not None and slot[0] is snap and slot[1] == key:
+            self.hits += 1
+            return slot[2]
+        built = render(entry)
+        self._rows[eid] = (snap, key, built)
+        self.misses += 1
+        return built
+
+    def end(self):
+        """Drop rows for events that left the list and fold this pass into the totals."""
+        for eid in [e for e in self._rows if e not in self._seen]:
+            del self._rows[eid]
+        self.total_hits += self.hits
+        self.total_misses += self.misses
+
+    def clear(self):
+        self._rows.clear()
+
+    def stats(self):
+        total = self.total_hits + self.total_misses
+        return {
+            'hits': self.hits, 'misses': self.misses,
+            'total_hits': self.total_hits, 'total_misses': self.total_misses,
+            'hit_rate': (100.0 * self.total_hits / total) if total else 0.0,
+            'entries': len(self._rows),
+        }
+
+
+class WindowedRowList(object):
+    """
+    Full-length content for the main match list where only the rows around the
+    cursor are rendered. Rows outside the window hold their cached render when
+    one is still valid, otherwise a blank placeholder ([entry]) that is filled
+    in by fill() once the cursor comes within reach. The list keeps its full
+    length, so indices still line up with current_match_ids.
+    """
+    PREFETCH = 6
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.content = []
+        self._pending = {}      # index -> (eid, snap, theme, entry, render)
+
+    def load(self, content, lazy, centre, visible):
+        """content: rendered rows with None where lazy[index] describes the row."""
+        self.content = content
+        self._pending = lazy
+        self.fill(centre, visible)
+        for i, (eid, snap, theme, entry, render) in list(lazy.items()):
+            row = self.cache.peek(eid, snap, theme, entry)
+            if row is not None:
+                content[i] = row
+                del lazy[i]
+            else:
+                content[i] = [entry]
+        return content
+
+    def fill(self, centre, visible):
+        """Render pending rows within reach of centre; returns the filled indices."""
+        if not self._pending:
+            return []
+        lo = max(0, centre - visible - self.PREFETCH)
+        hi = min(len(self.content), centre + visible + self.PREFETCH + 1)
+        filled = []
+        for i in range(lo, hi):
+            spec = self._pending.pop(i, None)
+            if spec is not None:
+                self.content[i] = self.cache.row(*spec)
+                filled.append(i)
+        return filled
+
+    def pending(self):
+        return len(self._pending)
+
+
 class SimpleSportsScreen(Screen):
     @profile_function("SimpleSportsScreen")
     def __init__(self, session):
         Screen.__init__(self, session)
         self.session = session
         self.monitor = global_sports_monitor
-        self.logo_path = "/tmp/simplysports/logos/"
+        self.logo_path = logo_cache_dir() + "/"
         if not os.path.exists(self.logo_path):
             try: os.makedirs(self.logo_path)
             except: pass
 
-        self.active_downloads = set()
-
         # Track matches for cursor locking
         self.current_match_ids = []
+        # Per-event rendered rows, reused while their inputs are unchanged
+        self._row_cache = RowRenderCache()
+        self._row_window = WindowedRowList(self._row_cache)
 
         # Debounce for remote keys
         self.last_key_time = 0
 
-        # Cache for channels to avoid re-scanning bouquets
+        # Channels come from the shared GLOBAL_SERVICE_SNAPSHOT (see get_all_services)
         self.service_cache = None
 
         valid_alphas = ['00', '1A', '33', '4D', '59', '66', '80', '99', 'B3', 'CC', 'E6', 'FF']
@@ -20042,7 +23061,8 @@ class SimpleSportsScreen(Screen):
         self["list"].l.setFont(1, gFont("SimplySportFont", 28))
         self["list"].l.setFont(2, gFont("SimplySportFont", 38))
         self["list"].l.setFont(3, gFont("SimplySportFont", 20))
-        self["list"].l.setItemHeight(136 if self.is_vnext_theme else 90)
+        self._row_height = 136 if self.is_vnext_theme else 90
+        self["list"].l.setItemHeight(self._row_height)
         self["key_red"] = Label(_t("League List")); self["key_green"] = Label(_t("Mini Bar")); self["key_yellow"] = Label(_t("Livescore.cz")); self["key_blue"] = Label(_t("Watch Party"))
         self["key_epg"] = Label(_t("Info/EPG: Channels"))
         self["key_ch"] = Label(_t("< > / << >> Browse Days"))
@@ -20106,7 +23126,6 @@ class SimpleSportsScreen(Screen):
             }, -1)
         log_dbg("SimpleSportsScreen: ActionMap Registered")
 
-        self.container = eConsoleAppContainer(); self.container.appClosed.append(self.download_finished)
         global_sports_monitor.set_session(session)
         self.monitor.register_callback(self.refresh_ui)
         if self.is_vnext_theme:
@@ -20169,17 +23188,43 @@ class SimpleSportsScreen(Screen):
                 self["list"].moveToIndex(new_index)
             except ValueError:
                 pass
+        self._fill_visible_rows()
+
+    def _visible_rows(self):
+        try:
+            return max(1, self["list"].instance.size().height() // self._row_height)
+        except Exception:
+            return self._GLOW_VISIBLE_ROWS
+
+    def _fill_visible_rows(self):
+        """Render the placeholder rows that the cursor has come within reach of."""
+        filled = self._row_window.fill(self["list"].getSelectedIndex(), self._visible_rows())
+        if not filled:
+            return
+        lst = self["list"].list
+        content = self._row_window.content
+        for i in filled:
+            if i < len(lst):
+                lst[i] = content[i]
+        try:
+            for i in filled:
+                if i < len(lst):
+                    self["list"].l.invalidateEntry(i)
+        except Exception:
+            self["list"].l.setList(lst)
 
     def _nav_up(self):
         self._reset_idle_hint()
         old_idx = self["list"].getSelectedIndex()
         self["list"].up()
+        self._fill_visible_rows()
         self._update_selection_glow(old_idx, self["list"].getSelectedIndex())
 
     def _nav_down(self):
         self._reset_idle_hint()
         old_idx = self["list"].getSelectedIndex()
         self["list"].down()
+        self._fill_visible_rows()
         self._update_selection_glow(old_idx, self["list"].getSelectedIndex())
 
     # --- Sliding selection glow ---
@@ -20720,78 +23765,28 @@ class SimpleSportsScreen(Screen):
         # CRITICAL FIX: Negative Cache bypass. If OS lacks graphic, skip the system call entirely!
         if team_id in self.monitor.missing_logo_cache: return None
 
-        target_path = self.logo_path + str(team_id) + ".png"
+        # Resolved per download: the store can move after a late HDD mount
+        target_path = logo_cache_dir() + "/" + str(team_id) + ".png"
 
-        # Fast Set Bypass
-        if target_path in GLOBAL_VALID_LOGO_PATHS:
-            self.monitor.logo_path_cache[team_id] = target_path
-            return target_path
-
-        # The ultimate heavy fallback. Only executes precisely ONE time per missing image!
-        if os.path.exists(target_path) and os.path.getsize(target_path) > 0:
-            GLOBAL_VALID_LOGO_PATHS.add(target_path)
-            self.monitor.logo_path_cache[team_id] = target_path
-            return target_path
+        # Persistent index (no disk probe)
+        cached = GLOBAL_LOGO_INDEX.lookup(team_id)
+        if cached:
+            self.monitor.logo_path_cache[team_id] = cached
+            return cached
 
         # It's officially missing - track it so we never stall checking the disk for it again
         self.monitor.missing_logo_cache.add(team_id)
 
-        # Queue download if not cached
-        self.queue_download(url, target_path, team_id)
+        # Queue download if not cached (on-screen rows go first)
+        GLOBAL_LOGO_DOWNLOADER.request(url, team_id, target_path, LOGO_PRIO_VISIBLE, self._on_logo_ready,
+                                       owner=self)
         return None
 
-    def queue_download(self, url, target_path, filename):
-        if filename in self.active_downloads or filename in self.monitor.pending_logos: return
-        # Check if recently failed
-        if hasattr(self, 'failed_downloads') and filename in self.failed_downloads: return
-
-        # Limit concurrent downloads to prevent network congestion
-        MAX_CONCURRENT = 5
-        if len(self.active_downloads) >= MAX_CONCURRENT:
-            # Add to pending queue - will be processed when current downloads finish
-            if not hasattr(self, 'pending_downloads'): self.pending_downloads = []
-
-            # CRITICAL FIX: Prevent duplicate pending entries
-            for i in range(len(self.pending_downloads)):
-                if self.pending_downloads[i][2] == filename:
-                    return # Already pending
-
-            self.pending_downloads.append((url, target_path, filename))
-            return
-        self.active_downloads.add(filename)
-        from twisted.web.client import downloadPage
-        downloadPage(url.encode('utf-8'), target_path).addCallback(self.download_finished, filename, target_path).addErrback(self.download_failed, filename)
-
-    def download_finished(self, data, filename, target_path):
-        self.active_downloads.discard(filename)
-        self.monitor.missing_logo_cache.discard(filename)
-        if os.path.exists(target_path) and os.path.getsize(target_path) > 0:
-            GLOBAL_VALID_LOGO_PATHS.add(target_path)
-            self.monitor.logo_path_cache[filename] = target_path
-            # Batch UI updates - wait for more downloads before refreshing
-            if not self.logo_refresh_timer.isActive(): self.logo_refresh_timer.start(1500, True)
-        # Process pending downloads
-        self._process_pending_downloads()
-
-    def download_failed(self, error, filename):
-        self.active_downloads.discard(filename)
-        # Track failures to prevent infinite retry loops
-        # Use a short-lived cache or persistent set? Persistent for session is safest.
-        if not hasattr(self, 'failed_downloads'): self.failed_downloads = set()
-        self.failed_downloads.add(filename)
-
-        self._process_pending_downloads()
-
-    def _process_pending_downloads(self):
-        """Process queued downloads when there's capacity"""
-        if not hasattr(self, 'pending_downloads') or not self.pending_downloads: return
-        MAX_CONCURRENT = 5
-        while self.pending_downloads and len(self.active_downloads) < MAX_CONCURRENT:
-            url, target_path, filename = self.pending_downloads.pop(0)
-            if filename not in self.active_downloads and filename not in self.monitor.logo_path_cache:
-                self.active_downloads.add(filename)
-                from twisted.web.client import downloadPage
-                downloadPage(url.encode('utf-8'), target_path).addCallback(self.download_finished, filename, target_path).addErrback(self.download_failed, filename)
+    def _on_logo_ready(self, team_id, target_path):
+        self.monitor.missing_logo_cache.discard(team_id)
+        self.monitor.logo_path_cache[team_id] = target_path
+        # Batch UI updates - wait for more downloads before refreshing
+        if not self.logo_refresh_timer.isActive(): self.logo_refresh_timer.start(1500, True)
 
     def check_epg_availability(self, home, away):
         epg = eEPGCache.getInstance()
@@ -20936,19 +23931,30 @@ class SimpleSportsScreen(Screen):
                 break
         # --- DIAGNOSTIC END ---
 
+        # 0. Precomputed "where to watch" (background job after each refresh):
+        # shown at once as a first result; the live search below still runs and
+        # merges what the precompute missed (it keeps only KEEP_CHANNELS rows)
+        early_screen = None
+        if target_event:
+            cached = global_sports_monitor.where_to_watch.get(target_event.get('id', ''))
+            if cached:
+                log_dbg("search_and_display_epg: {} precomputed channels".format(len(cached)))
+                early_screen = self.session.open(BroadcastingChannelsScreen, cached,
+                                                 match_time_ts=match_time_ts, target_event=target_event)
+
         # 1. Prepare Target Words
         h_norm = [normalize_text(kw) for kw in get_search_keywords(home)]
         a_norm = [normalize_text(kw) for kw in get_search_keywords(away)]
         l_norm = [normalize_text(kw) for kw in get_search_keywords(league)]
 
-        # 2. Get Channels
-        if not self.service_cache:
-            self.service_cache = get_all_services()
+        # 2. Get Channels (process-wide snapshot, rebuilt only when bouquets change)
+        self.service_cache = get_all_services()
 
         log_dbg("search_and_display_epg: Service Cache Size = {}".format(len(self.service_cache) if self.service_cache else 0))
 
         if not self.service_cache:
-            self.session.open(MessageBox, "No channels found in bouquets.", MessageBox.TYPE_INFO)
+            if early_screen is None:
+                self.session.open(MessageBox, "No channels found in bouquets.", MessageBox.TYPE_INFO)
             return
 
         c_count = len(self.service_cache)
@@ -20980,127 +23986,22 @@ class SimpleSportsScreen(Screen):
                             probe_result = "No Data on %s" % s[1]
             except Exception as e: probe_result = "Error: %s" % str(e)
         # -------------------------------------
-        unique_services = {}
-        for s in self.service_cache:
-            unique_services[str(s[0])] = s
-
         from twisted.internet import threads
-        import time
 
         def _bg_search(services, m_time, h_words, a_words, l_words):
-            bg_results = []
-            search_offsets = [900, 0, 3600, -900]
-            now = int(time.time())
-            use_fallback_now = True
-
-            if m_time > (now + 21600):
-                use_fallback_now = False
-
-            for sref_str, s_info in services.items():
-                sref_raw = s_info[0]
-                ch_name = s_info[1]
-                try:
-                    evt = None
-                    sref_obj = eServiceReference(sref_raw)
-
-                    for offset in search_offsets:
-                        probe_time = m_time + offset
-                        candidate = epg.lookupEventTime(sref_obj, probe_time)
-                        if candidate:
-                            evt = candidate
-                            break
-
-                    if not evt and use_fallback_now:
-                         if abs(m_time - now) < 7200:
-                             evt = epg.lookupEventTime(sref_obj, now)
-
-                    if not evt and (sref_raw.startswith("4097:") or sref_raw.startswith("5001:")):
-                        parts = sref_raw.split(':')
-                        if len(parts) > 10:
-                            dvb_ref_str = "1:0:1:%s:%s:%s:%s:0:0:0" % (parts[3], parts[4], parts[5], parts[6])
-                            dvb_obj = eServiceReference(dvb_ref_str)
-                            for offset in search_offsets:
-                                probe_time = m_time + offset
-                                evt = epg.lookupEventTime(dvb_obj, probe_time)
-                                if evt: break
-                            if not evt and use_fallback_now and abs(m_time - now) < 7200:
-                                evt = epg.lookupEventTime(dvb_obj, now)
-
-                    if evt:
-                        title = evt.getEventName() or ""
-                        desc = evt.getShortDescription() or ""
-                        ext = evt.getExtendedDescription() or ""
-
-                        blob = normalize_text(title + " " + desc + " " + ext + " " + ch_name)
-
-                        STOP_WORDS = ['al', 'el', 'the', 'fc', 'sc', 'fk', 'sk', 'club', 'sport', 'sports', 'vs', 'live', 'hd', 'fhd', '4k', 'uhd']
-
-                        def match_sig_score(keywords, text_blob, require_all=True):
-                            sig = [w for w in keywords if w not in STOP_WORDS and len(w) > 1]
-                            if not sig: sig = keywords
-
-                            found_count = 0
-                            for w in sig:
-                                if w in text_blob: 
-                                    found_count += 1
-
-                            return found_count, len(sig)
-
-                        h_found, h_total = match_sig_score(h_words, blob)
-                        a_found, a_total = match_sig_score(a_words, blob) if a_words else (0, 0)
-                        l_found, l_total = match_sig_score(l_words, blob)
-
-                        h_ratio = h_found / float(h_total) if h_total > 0 else 0.0
-                        a_ratio = a_found / float(a_total) if a_total > 0 else 0.0
-                        l_ratio = l_found / float(l_total) if l_total > 0 else 0.0
-
-                        score = 0.0
-                        score += (h_ratio * 40)
-                        score += (a_ratio * 40)
-                        score += (l_ratio * 20)
-
-                        if h_ratio == 1.0: score += 10
-                        if a_ratio == 1.0: score += 10
-                        if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): score += 30
-                        score += (h_found + a_found + l_found)
-
-                        try:
-                            evt_start = evt.getBeginTime()
-                            diff_min = abs(evt_start - m_time) / 60.0
-
-                            if diff_min <= 15: score += 20
-                            elif diff_min <= 45: score += 10
-                            elif diff_min <= 90: score += 5
-                            elif diff_min > 120: score -= 15
-                        except: diff_min = 999
-
-                        valid_match = False
-                        if h_ratio == 1.0 and (a_ratio == 1.0 or not a_words): valid_match = True
-                        elif h_ratio >= 0.5 and a_ratio >= 0.5: valid_match = True
-                        elif (h_ratio == 1.0 or a_ratio == 1.0) and l_ratio >= 0.5: valid_match = True
-
-                        if valid_match and score > 40:
-                            cat_color = 0xffffff
-                            if score >= 100: cat_color = 0x00FF00
-                            elif score >= 80: cat_color = 0xFFFF00
-
-                            sat_pos = get_sat_position(sref_raw)
-                            full_name = ch_name + ((" (" + sat_pos + ")") if sat_pos else "")
-                            time_info = "T+0" if diff_min < 1 else "T-%d" % int(diff_min) if evt_start < m_time else "T+%d" % int(diff_min)
-                            display_title = "[%d|%s] %s" % (int(score), time_info, title)
-                            bg_results.append((sref_raw, full_name, display_title, cat_color, score))
-                except:
-                    pass
-
-            bg_results.sort(key=lambda x: x[4], reverse=True)
-            return [(r[0], r[1], r[2], r[3]) for r in bg_results[:200]]
+            # One batched EPG window snapshot shared by every search around this kick-off
+            bg_results = GLOBAL_EPG_ENGINE.match(h_words, a_words, l_words, m_time, services)
+            return [(r[0], r[1], r[2], r[3]) for r in bg_results]
 
         def _on_search_done(final_list):
+            if early_screen is not None:
+                early_screen.merge_live_results(final_list or [])
+                return
             # Always open BroadcastingChannelsScreen - user can still use Red/Green buttons
             self.session.open(BroadcastingChannelsScreen, final_list or [], match_time_ts=match_time_ts, target_event=target_event)
 
         # Execute heavy loop in background thread to prevent UI lockup
-        threads.deferToThread(_bg_search, unique_services, match_time_ts, h_norm, a_norm, l_norm).addCallback(_on_search_done)
+        threads.deferToThread(_bg_search, self.service_cache, match_time_ts, h_norm, a_norm, l_norm).addCallback(_on_search_done)
 
     @profile_function("SimpleSportsScreen")
     def refresh_logos_only(self):
@@ -21189,11 +24090,13 @@ class SimpleSportsScreen(Screen):
         tomorrow_str = (now + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
         yesterday_str = (now - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
 
+        passing = self.monitor.match_snapshots.filter_ids(mode, today_str, tomorrow_str, yesterday_str)
         for event in events:
             try:
-                snap = self.monitor.match_snapshots.get(str(event.get('id', '')))
+                eid = str(event.get('id', ''))
+                if eid not in passing: continue
+                snap = self.monitor.match_snapshots.get(eid)
                 if not snap: continue
-                if not snapshot_passes_filter(snap, mode, today_str, tomorrow_str, yesterday_str): continue
 
                 # Racing: Only show in single-league mode, skip in custom/multi-league
                 if snap['sport_type'] == SPORT_TYPE_RACING and self.monitor.is_custom_mode: continue
@@ -21287,6 +24190,8 @@ class SimpleSportsScreen(Screen):
                     pulse_age = time.time() - pulse_ts
                     if pulse_age <= 2.0:
                         pulse_alpha = 1.0 - (pulse_age / 2.0)  # linear fade 1.0 -> 0.0
+                        # Quantised to 5 steps so cached rows can be reused mid-fade
+                        pulse_alpha = round(pulse_alpha * 5) / 5.0
 
                 if snap['state'] == 'in' and match_id in self.monitor.goal_flags:
                     goal_time = self.monitor.goal_flags[match_id].get('time', 0)
@@ -21400,6 +24305,9 @@ class SimpleSportsScreen(Screen):
         # Convert to list entries after sorting
         list_content = []
         new_match_ids = []
+        row_cache = self._row_cache
+        row_cache.begin()
+        lazy_rows = {}
         for i, (entry_data, match_id, is_live, event) in enumerate(raw_entries):
             # Use RacingListEntry for racing events
             ev_url = event.get('league_url', '')
@@ -21451,13 +24359,25 @@ class SimpleSportsScreen(Screen):
                             if row:
                                 list_content.append(row)
                                 new_match_ids.append(match_id + '_ses_' + str(comp_idx) + '_drv_' + str(d_rank))
-            elif self.monitor.theme_mode == "ucl":
-                list_content.append(UCLListEntry(entry_data))
-                new_match_ids.append(match_id)
             else:
-                list_content.append(VNextListEntry(entry_data))
+                # Rendered lazily: only rows near the cursor are built now
+                theme = self.monitor.theme_mode
+                lazy_rows[len(list_content)] = (
+                    match_id, self.monitor.match_snapshots.get(match_id), theme, entry_data,
+                    UCLListEntry if theme == "ucl" else VNextListEntry)
+                list_content.append(None)
                 new_match_ids.append(match_id)
 
+        centre = current_idx if current_idx >= 0 else 0
+        if selected_id and self.current_match_ids != new_match_ids:
+            try: centre = new_match_ids.index(selected_id)
+            except ValueError: centre = 0
+        self._row_window.load(list_content, lazy_rows, centre, self._visible_rows())
+        row_cache.end()
+        _rs = row_cache.stats()
+        log_diag("ROW_CACHE: rows={} rendered={} reused={} deferred={} hit_rate={:.1f}% cached={}".format(
+            len(list_content), _rs['misses'], _rs['hits'], self._row_window.pending(), _rs['hit_rate'], _rs['entries']))
+
         # Count match states for header breakdown
         count_live = 0; count_fin = 0; count_sch = 0
         for entry_data, match_id, is_live, event in raw_entries:
@@ -21559,6 +24479,7 @@ class SimpleSportsScreen(Screen):
             (_t("Goal Alert Mode: ") + alert_lbl, "toggle_goal_alert"),
             (_t("AI Mode: ") + ai_status, "ai_mode"),
             (_t("Notifications Test"), "notif_test"),
+            (_t("Snapshot Memory Report"), "snapshot_mem"),
             (u"Language / \u0644\u063a\u0629: " + cur_lang_lbl, "change_language"),
         ]
         self.session.openWithCallback(self.settings_menu_callback, ChoiceBox, title=_t("Settings & Tools"), list=menu_options)
@@ -21584,8 +24505,17 @@ class SimpleSportsScreen(Screen):
             elif action == "toggle_goal_alert":
                 self.open_goal_alert_selector()
             elif action == "notif_test": self.run_notification_test()
+            elif action == "snapshot_mem": self.monitor.log_snapshot_memory(self._on_snapshot_memory_report)
             elif action == "change_language": self.open_language_selector()
 
+    def _on_snapshot_memory_report(self, r):
+        if r is None:
+            msg = _t("Snapshot memory report failed (see diagnostic log).")
+        else:
+            msg = "{}: {}\nDict: {} KB\nSlots: {} KB\nSaved: {:.1f}%".format(
+                _t("Events"), r['events'], r['dict_bytes'] // 1024, r['slot_bytes'] // 1024, r['saved_pct'])
+        self.session.open(MessageBox, msg, MessageBox.TYPE_INFO)
+
     def on_favorite_teams_closed(self, result=None):
         # No reload needed; pinning is applied on next refresh_ui call
         pass
@@ -22284,11 +25214,11 @@ class SimpleSportsScreen(Screen):
             h_logo = event.get('h_logo_url', '')
             a_logo = event.get('a_logo_url', '')
 
-            # Zap Feature: If event has a service ref (from channel mapping), store it
-            # This requires us to know call open_broadcasting logic or similar?
-            # For now, just store generic data
+            # Zap Feature: keep the event id so the reminder can zap to the
+            # precomputed "where to watch" channel when it fires
 
-            self.monitor.add_reminder(match_name, trigger_time, league_name, h_logo, a_logo, label, h_id=h_id, a_id=a_id)
+            self.monitor.add_reminder(match_name, trigger_time, league_name, h_logo, a_logo, label, h_id=h_id, a_id=a_id,
+                                      eid=str(event.get('id') or event.get('event_id') or ''))
             msg = (u"\u062a\u0645 \u0636\u0628\u0637 \u0627\u0644\u062a\u0630\u0643\u064a\u0631 \u0644\u0640:\n" + match_name) if PLUGIN_LANGUAGE == "ar" else ("Reminder set for:\n" + match_name)
             self.session.open(MessageBox, msg, MessageBox.TYPE_INFO, timeout=3)
 
@@ -22910,8 +25840,14 @@ class BroadcastingChannelsScreen(Screen):
         self._sports_channels_cache = None  # Cache for iptv-org channels
         self._sat_feed_search_running = False
         self._livesoccertv_search_running = False
+        self._bouquet_scan_running = False      # Blue: single-row bouquet scan in flight
         self._livesoccertv_channels = None      # None = no fetch yet; list = channels shown
         self._livesoccertv_list_start_idx = 0   # index in self["list"].list where LSTV entries begin
+        self._lstv_batch_gen = 0                # bumped to drop stale bouquet-batch callbacks
+        self._lstv_batch_found = 0
+        self._lstv_pending_results = {}         # (ch_name, country) -> sref, flushed by the timer
+        self._lstv_flush_timer = eTimer()       # coalesces bouquet-batch row updates
+        safe_connect(self._lstv_flush_timer, self._flush_lstv_scan_results)
 
         self["actions"] = ActionMap(["OkCancelActions", "ColorActions", "DirectionActions"], {
             "ok": self.zap_to_channel,
@@ -22930,9 +25866,22 @@ class BroadcastingChannelsScreen(Screen):
         self._epg_search_running = False
         self._broadcaster_names = set()   # populated lazily when Green is first pressed
 
+        self._closed = False
         self.onLayoutFinish.append(self.start_list)
+        self.onClose.append(self._on_close)
+
+    def _on_close(self):
+        self._closed = True
+        self._cancel_lstv_bouquet_batch()
+
+    def _cancel_lstv_bouquet_batch(self):
+        self._lstv_batch_gen += 1
+        self._lstv_flush_timer.stop()
+        self._lstv_pending_results = {}
 
     def start_list(self):
+        GLOBAL_BOUQUET_INDEX.warm()
+        GLOBAL_XMLTV_INDEX.refresh_async()
         self.show_channels()
         try:
             self["list"].selectionEnabled(1)
@@ -22969,6 +25918,20 @@ class BroadcastingChannelsScreen(Screen):
     def set_search_status(self, text):
         pass
 
+    def merge_live_results(self, results):
+        """Append live-search channels that the precomputed list lacked,
+        keeping the cursor where it is. Ignored once the screen closed."""
+        if self._closed:
+            return
+        shown = set(item[0] for item in self.channels)
+        new_channels = [r for r in results if r[0] not in shown]
+        if not new_channels:
+            return
+        idx = self["list"].getSelectedIndex() or 0
+        self.add_live_results(new_channels)
+        self["list"].moveToIndex(idx)
+        log_dbg("BroadcastingChannels: live search added {} channels".format(len(new_channels)))
+
     def fetch_online_broadcasters(self):
         """Fetch and display global broadcasters for the event."""
         if not getattr(self, 'target_event', None):
@@ -23246,144 +26209,77 @@ class BroadcastingChannelsScreen(Screen):
         h_terms = [_normalize_name(w) for w in home_words]
         a_terms = [_normalize_name(w) for w in away_words]
 
-        # Compile XMLTV sources list (Remote URL + Local files in /etc/epgimport)
-        sources = [XMLTV_EPG_URL]
-
-        import os
-        epgimport_dir = "/etc/epgimport"
-        if os.path.exists(epgimport_dir) and os.path.isdir(epgimport_dir):
-            try:
-                for f in os.listdir(epgimport_dir):
-                    if (f.endswith(".xml") or f.endswith(".xml.gz") or f.endswith(".gz")) and not f.endswith("sources.xml"):
-                        sources.append(os.path.join(epgimport_dir, f))
-            except Exception as e:
-                log_dbg("Error listing /etc/epgimport: {}".format(e))
+        max_age = getattr(global_sports_monitor, 'xmltv_max_age_hours', XMLTV_SPOOL_MAX_AGE_HOURS)
 
-        log_dbg("XMLTV Search starting. Sources: {}, h_terms: {}, a_terms: {}".format(sources, h_terms, a_terms))
+        log_dbg("XMLTV Search starting. h_terms: {}, a_terms: {}".format(h_terms, a_terms))
 
         from twisted.internet import threads
 
         # Run stream parser in background to prevent UI freeze
         threads.deferToThread(
-            self._parse_xmltv_stream_worker, sources, h_terms, a_terms
+            self._parse_xmltv_stream_worker, max_age, h_terms, a_terms
         ).addCallback(
             self._on_xmltv_parsed
         ).addErrback(
             self._xmltv_search_err
         )
 
-    def _parse_xmltv_stream_worker(self, sources, h_terms, a_terms):
-        """Background worker to memory-safely parse XMLTV from local files or HTTP streams."""
-        import xml.etree.ElementTree as ET
-        import gzip
+    def _parse_xmltv_stream_worker(self, max_age_hours, h_terms, a_terms):
+        """Background worker: match programmes in GLOBAL_XMLTV_INDEX (EPGImport files + remote spool)."""
         import os
         import time
 
-        # Helper to safely convert text to unicode
-        def _to_unicode(s):
-            if isinstance(s, bytes):
-                return s.decode('utf-8', errors='replace')
-            return s
-
         t_start = time.time()
         channels = {}      # ch_id -> display_name
         matched_channels = {}  # ch_id -> source_label
 
-        for source in sources:
-            # Check elapsed time limit (45 seconds hard limit)
-            if time.time() - t_start > 45:
-                log_dbg("XMLTV parser aborted after 45s hard limit to prevent box freeze.")
-                break
-
-            log_dbg("Parsing XMLTV source: {}".format(source))
-            
-            # Determine source label
-            if source.startswith("http://") or source.startswith("https://"):
-                source_label = u"XMLTV"
-            else:
-                source_label = u"EPGI: {}".format(os.path.basename(source))
-
-            response = None
+        # Remote guide: on HDD/USB it is spooled and indexed in the background
+        # (the first search only sees what is already indexed); without one it
+        # is streamed per search, as keeping it in RAM-backed /tmp is too costly.
+        spool = GLOBAL_XMLTV_SPOOL
+        if not _xmltv_store_persistent():
             try:
-                if source.startswith("http://") or source.startswith("https://"):
-                    # Remote URL
-                    try:
-                        import urllib.request as urllib2
-                    except ImportError:
-                        import urllib2
-                    req = urllib2.Request(source, headers={'User-Agent': 'Mozilla/5.0'})
-                    response = urllib2.urlopen(req, timeout=EPG_SEARCH_TIMEOUT)
-                else:
-                    # Local File
-                    if os.path.exists(source):
-                        if source.endswith(".gz") or source.endswith(".xml.gz"):
-                            response = gzip.open(source, 'rb')
-                        else:
-                            response = open(source, 'rb')
-                    else:
-                        continue
+                _stream_xmltv_matches(XMLTV_EPG_URL, h_terms, a_terms,
+                                      channels, matched_channels, u"XMLTV")
             except Exception as e:
-                log_dbg("Failed to open XMLTV source {}: {}".format(source, e))
-                continue
-
-            if not response:
-                continue
-
-            try:
-                context = ET.iterparse(response, events=("start", "end"))
-                context = iter(context)
-                try:
-                    _, root = next(context)
-                except StopIteration:
-                    response.close()
-                    continue
-
-                for event, elem in context:
-                    if time.time() - t_start > 45:
-                        log_dbg("XMLTV parser aborted inside source loop after 45s limit.")
-                        break
+                log_dbg("XMLTV stream search failed: {}".format(e))
+        elif not spool.is_fresh(max_age_hours):
+            reactor.callFromThread(spool.update_async, GLOBAL_XMLTV_INDEX.refresh)
 
-                    if event == "end":
-                        if elem.tag == "channel":
-                            ch_id = elem.get("id")
-                            display = elem.find("display-name")
-                            if ch_id and display is not None and display.text:
-                                channels[ch_id] = _to_unicode(display.text)
-                            elem.clear()
-                            root.clear()
+        try:
+            index = GLOBAL_XMLTV_INDEX
+            if not index.ready:
+                index.refresh()     # first build: local EPGImport files (+ spool if present)
+            else:
+                reactor.callFromThread(index.refresh_async)
+            meta = index.snapshot()
+            if meta is not None:
+                for src, ch, _start, _stop, _title, _norm, prog_blob in index.programmes(meta=meta):
+                    h_ok = any(t in prog_blob for t in h_terms) if h_terms else True
+                    a_ok = any(t in prog_blob for t in a_terms) if a_terms else True
+                    if h_ok and a_ok:
+                        ch_id = index.channel_id(meta, ch)
+                        name = index.channel_name(meta, ch_id)
+                        if name and ch_id not in matched_channels:
+                            channels[ch_id] = name
+                            src_path = index.source(meta, src)
+                            if src_path == spool.path:
+                                matched_channels[ch_id] = u"XMLTV"
+                            else:
+                                matched_channels[ch_id] = u"EPGI: {}".format(os.path.basename(src_path))
+                log_dbg("XMLTV index search: {} channels in {:.0f}ms".format(
+                    len(matched_channels), (time.time() - t_start) * 1000.0))
+        except Exception as e:
+            log_dbg("XMLTV index search error: {}".format(e))
 
-                        elif elem.tag == "programme":
-                            title = elem.find("title")
-                            desc = elem.find("desc")
-                            
-                            title_text = _to_unicode(title.text) if title is not None and title.text else u""
-                            desc_text = _to_unicode(desc.text) if desc is not None and desc.text else u""
-                            
-                            prog_blob = _normalize_name(title_text + u" " + desc_text)
-                            
-                            h_ok = any(t in prog_blob for t in h_terms) if h_terms else True
-                            a_ok = any(t in prog_blob for t in a_terms) if a_terms else True
-                            
-                            if h_ok and a_ok:
-                                ch_id = elem.get("channel")
-                                if ch_id:
-                                    matched_channels[ch_id] = source_label
-                            elem.clear()
-                            root.clear()
-            except Exception as e:
-                log_dbg("Error parsing source {}: {}".format(source, e))
-            finally:
-                try:
-                    response.close()
-                except:
-                    pass
+        found = [(channels[ch_id], source_label)
+                 for ch_id, source_label in matched_channels.items()
+                 if ch_id in channels]
+        matches = match_bouquet_names([ch_name for ch_name, _ in found])
 
         results = []
-        for ch_id, source_label in matched_channels.items():
-            if ch_id in channels:
-                ch_name = channels[ch_id]
-                sref = _scan_bouquet_for_name(ch_name) or u""
-                results.append((ch_name, sref, source_label))
+        for (ch_name, source_label), (sref, _score) in zip(found, matches):
+            results.append((ch_name, sref or u"", source_label))
 
         return results
 
@@ -23936,11 +26832,11 @@ class BroadcastingChannelsScreen(Screen):
     #   Results are shown immediately — no bouquet scan yet.
     #   Button label changes to "Find in Bouquets" to hint at Stage 2.
     #
-    # Stage 2 (second press, _livesoccertv_channels is a list):
-    #   Bouquets are scanned on the main thread for every channel name.
-    #   LSTV entries in the list are replaced in-place with updated
-    #   entries that carry a live sref where a bouquet match was found.
-    #   Button label resets to "LiveSoccerTV" so a fresh search is possible.
+    # Stage 2 (automatic, right after Stage 1):
+    #   match_bouquet_names_async() resolves every channel name in one
+    #   batch on a worker thread. LSTV entries in the list are replaced
+    #   in-place, one by one, with entries that carry a live sref where a
+    #   bouquet match was found. Blue re-scans the highlighted entry only.
     # ==================================================================
 
     # ------------------------------------------------------------------ entry
@@ -23948,7 +26844,7 @@ class BroadcastingChannelsScreen(Screen):
         """
         Blue button handler — now ONLY for scanning bouquets of the highlighted channel.
         """
-        if self._livesoccertv_search_running:
+        if self._livesoccertv_search_running or self._bouquet_scan_running:
             return  # debounce: ignore while a background thread is active
 
         idx = self["list"].getSelectedIndex()
@@ -23961,28 +26857,49 @@ class BroadcastingChannelsScreen(Screen):
 
                 self["key_blue"].setText(_t("Scanning..."))
                 self["hint"].setText(_t("Checking bouquets..."))
+                self._bouquet_scan_running = True
 
-                sref = _scan_bouquet_for_name(ch_name, country=country) or u""
-
-                # Rebuild only the highlighted entry
-                updated_entry = self._build_livesoccertv_list_entry(ch_name, country, sref=sref, scanned=True)
-
-                if idx < len(self.channels):
-                    self.channels[idx] = updated_entry[0]
-
-                current = list(self["list"].list)
-                current[idx] = updated_entry[1]
-                self["list"].setList(current)
+                # The bouquet index may need building: never on the reactor thread
+                def _on_done(results):
+                    if self._closed:
+                        return
+                    self._show_bouquet_scan_result(idx, ch_name, country, results[0][0] or u"")
 
-                if sref:
-                    self["hint"].setText(u"Found in bouquets: {}".format(ch_name))
-                else:
-                    self["hint"].setText(u"Not in bouquets: {}".format(ch_name))
+                def _finished(_):
+                    self._bouquet_scan_running = False
+                    if not self._closed:
+                        self["key_blue"].setText(_t("Find in Bouquets"))
 
-                self["key_blue"].setText(_t("Find in Bouquets"))
+                match_bouquet_names_async([(ch_name, country)], on_done=_on_done).addBoth(_finished)
             else:
                 self["hint"].setText(_t("Please highlight a LiveSoccerTV channel"))
 
+    def _show_bouquet_scan_result(self, idx, ch_name, country, sref):
+        """Rebuild only the scanned LSTV row (found again if the list moved)."""
+        lst = self["list"].list or []
+        if idx >= len(lst) or lst[idx][0][4:6] != (ch_name, country):
+            idx = None
+            for i, entry_tuple in enumerate(lst):
+                raw = entry_tuple[0]
+                if len(raw) >= 6 and raw[3] == 0x1B5E20 and raw[4:6] == (ch_name, country):
+                    idx = i
+                    break
+            if idx is None:
+                return
+        updated_entry = self._build_livesoccertv_list_entry(ch_name, country, sref=sref, scanned=True)
+        if idx < len(self.channels):
+            self.channels[idx] = updated_entry[0]
+        lst[idx] = updated_entry[1]
+        try:
+            self["list"].l.invalidateEntry(idx)
+        except Exception:
+            self["list"].l.setList(lst)
+
+        if sref:
+            self["hint"].setText(u"Found in bouquets: {}".format(ch_name))
+        else:
+            self["hint"].setText(u"Not in bouquets: {}".format(ch_name))
+
     # --------------------------------------------------------------- worker
     def _livesoccertv_worker(self, home, away):
         """
@@ -24311,6 +27228,73 @@ class BroadcastingChannelsScreen(Screen):
         if new_entries:
             self._add_feed_entries_to_list(new_entries)
             self["hint"].setText(u"LSTV: {} ch".format(len(new_entries)))
+            self._start_lstv_bouquet_batch(channel_names)
+
+    # ------------------------------------ background bouquet batch (Stage 2)
+    def _start_lstv_bouquet_batch(self, channel_names):
+        """Resolve every LSTV channel against the bouquets on a worker thread;
+        rows flip to their scanned state as matches arrive, in batches of at
+        most one per LSTV_FLUSH_MS."""
+        self._cancel_lstv_bouquet_batch()
+        gen = self._lstv_batch_gen
+        self._lstv_batch_found = 0
+        queries = [(ch_name, country) for ch_name, country in channel_names]
+
+        def _on_progress(i, name, sref, score):
+            if gen != self._lstv_batch_gen:
+                return
+            self._apply_lstv_scan_result(queries[i][0], queries[i][1], sref or u"")
+
+        def _on_done(results):
+            if gen != self._lstv_batch_gen:
+                return
+            self._lstv_flush_timer.stop()
+            self._flush_lstv_scan_results()
+            self["hint"].setText(u"LSTV: {} ch, {} in bouquets".format(
+                len(queries), self._lstv_batch_found))
+
+        match_bouquet_names_async(queries, _on_progress, _on_done)
+
+    LSTV_FLUSH_MS = 200
+
+    def _apply_lstv_scan_result(self, ch_name, country, sref):
+        """Queue a scanned result; the flush timer applies queued rows together."""
+        self._lstv_pending_results[(ch_name, country)] = sref
+        if not self._lstv_flush_timer.isActive():
+            self._lstv_flush_timer.start(self.LSTV_FLUSH_MS, True)
+
+    def _flush_lstv_scan_results(self):
+        """Replace the unscanned LSTV rows of the queued results with their
+        scanned entries in place, redrawing only those rows."""
+        pending, self._lstv_pending_results = self._lstv_pending_results, {}
+        lst = self["list"].list
+        if not pending or not lst:
+            return
+        changed = []
+        for idx, entry_tuple in enumerate(lst):
+            raw = entry_tuple[0]
+            if not (len(raw) >= 7 and raw[3] == 0x1B5E20 and not raw[6]):
+                continue
+            key = (raw[4], raw[5])
+            if key not in pending:
+                continue
+            sref = pending.pop(key)
+            updated_entry = self._build_livesoccertv_list_entry(key[0], key[1], sref=sref, scanned=True)
+            if idx < len(self.channels):
+                self.channels[idx] = updated_entry[0]
+            lst[idx] = updated_entry[1]
+            changed.append(idx)
+            if sref:
+                self._lstv_batch_found += 1
+            if not pending:
+                break
+        if not changed:
+            return
+        try:
+            for idx in changed:
+                self["list"].l.invalidateEntry(idx)
+        except Exception:
+            self["list"].l.setList(lst)
 
     # -------------------------------------------- error handler
     def _livesoccertv_err(self, failure):